@@ -1,10 +1,10 @@
-import copy
 import json
 import os
 import logging
 import uuid
 import httpx
 import asyncio
+import time
 from quart import (
     Blueprint,
     Quart,
@@ -14,32 +14,53 @@ from quart import (
     send_from_directory,
     render_template,
     current_app,
+    stream_with_context,
 )
 
-from openai import AsyncAzureOpenAI
-from azure.identity.aio import (
-    DefaultAzureCredential,
-    get_bearer_token_provider
-)
+from azure.identity.aio import DefaultAzureCredential
 from backend.auth.auth_utils import get_authenticated_user_details
+from backend.clients import ClientRegistry
+from autogen_agentchat.base import TaskResult
+from backend.agents.agents import (
+    get_agent_response,
+    get_agent_runtime,
+    close_agent_runtime,
+    stream_agent_response
+)
+from backend.agents.events import (
+    answer_chunk,
+    answer_completion,
+    format_agent_event,
+    get_reviewer_message,
+    is_reviewer_token,
+    REVIEWER_SOURCE
+)
 from backend.security.ms_defender_utils import get_msdefender_user_json
 from backend.history.cosmosdbservice import CosmosConversationClient
+from backend.history.delete_jobs import HistoryDeleteJobs
+from backend.history.write_behind import HistoryWriteBehind
 from backend.settings import (
     app_settings,
     MINIMUM_SUPPORTED_AZURE_OPENAI_PREVIEW_API_VERSION
 )
 from backend.utils import (
     format_as_ndjson,
-    format_stream_response,
+    coalesce_chunks,
+    encode_ndjson,
+    StreamResponseEncoder,
     format_non_streaming_response,
     convert_to_pf_format,
     format_pf_non_streaming_response,
+    log_redacted_debug,
 )
 
 bp = Blueprint("routes", __name__, static_folder="static", template_folder="static")
 
 cosmos_db_ready = asyncio.Event()
 
+# Response header of /history/list with the continuation token of the next page
+HISTORY_CONTINUATION_HEADER = "x-ms-continuation"
+
 
 def create_app():
     app = Quart(__name__)
@@ -48,13 +69,45 @@ def create_app():
     
     @app.before_serving
     async def init():
+        app.client_registry = ClientRegistry(
+            app_settings,
+            minimum_api_version=MINIMUM_SUPPORTED_AZURE_OPENAI_PREVIEW_API_VERSION
+        )
+        await app.client_registry.start()
+
+        if app_settings.datasource:
+            # Build the datasource payload once instead of on every request
+            app_settings.datasource.payload_template
+
+        try:
+            get_agent_runtime()
+        except Exception:
+            # Retried on the first chat request
+            logging.exception("Failed to initialize agent runtime")
+
         try:
             app.cosmos_conversation_client = await init_cosmosdb_client()
+            app.history_write_behind = init_history_write_behind(app.cosmos_conversation_client)
+            app.history_delete_jobs = (
+                HistoryDeleteJobs(app.cosmos_conversation_client)
+                if app.cosmos_conversation_client else None
+            )
             cosmos_db_ready.set()
         except Exception as e:
             logging.exception("Failed to initialize CosmosDB client")
             app.cosmos_conversation_client = None
+            app.history_write_behind = None
+            app.history_delete_jobs = None
             raise e
+
+    @app.after_serving
+    async def shutdown():
+        if app.history_write_behind:
+            await app.history_write_behind.close()
+        if app.history_delete_jobs:
+            await app.history_delete_jobs.close()
+        await close_agent_runtime()
+        await app.client_registry.close()
     
     return app
 
@@ -83,9 +136,6 @@ DEBUG = os.environ.get("DEBUG", "false")
 if DEBUG.lower() == "true":
     logging.basicConfig(level=logging.DEBUG)
 
-USER_AGENT = "GitHubSampleWebApp/AsyncAzureOpenAI/1.0.0"
-
-
 # Frontend Settings via Environment Variables
 frontend_settings = {
     "auth_enabled": app_settings.base_settings.auth_enabled,
@@ -111,84 +161,9 @@ frontend_settings = {
 MS_DEFENDER_ENABLED = os.environ.get("MS_DEFENDER_ENABLED", "true").lower() == "true"
 
 
-azure_openai_tools = []
-azure_openai_available_tools = []
-
-# Initialize Azure OpenAI Client
+# Azure OpenAI client, shared by every request of this worker
 async def init_openai_client():
-    azure_openai_client = None
-    
-    try:
-        # API version check
-        if (
-            app_settings.azure_openai.preview_api_version
-            < MINIMUM_SUPPORTED_AZURE_OPENAI_PREVIEW_API_VERSION
-        ):
-            raise ValueError(
-                f"The minimum supported Azure OpenAI preview API version is '{MINIMUM_SUPPORTED_AZURE_OPENAI_PREVIEW_API_VERSION}'"
-            )
-
-        # Endpoint
-        if (
-            not app_settings.azure_openai.endpoint and
-            not app_settings.azure_openai.resource
-        ):
-            raise ValueError(
-                "AZURE_OPENAI_ENDPOINT or AZURE_OPENAI_RESOURCE is required"
-            )
-
-        endpoint = (
-            app_settings.azure_openai.endpoint
-            if app_settings.azure_openai.endpoint
-            else f"https://{app_settings.azure_openai.resource}.openai.azure.com/"
-        )
-
-        # Authentication
-        aoai_api_key = app_settings.azure_openai.key
-        ad_token_provider = None
-        if not aoai_api_key:
-            logging.debug("No AZURE_OPENAI_KEY found, using Azure Entra ID auth")
-            async with DefaultAzureCredential() as credential:
-                ad_token_provider = get_bearer_token_provider(
-                    credential,
-                    "https://cognitiveservices.azure.com/.default"
-                )
-
-        # Deployment
-        deployment = app_settings.azure_openai.model
-        if not deployment:
-            raise ValueError("AZURE_OPENAI_MODEL is required")
-
-        # Default Headers
-        default_headers = {"x-ms-useragent": USER_AGENT}
-
-        # Remote function calls
-        if app_settings.azure_openai.function_call_azure_functions_enabled:
-            azure_functions_tools_url = f"{app_settings.azure_openai.function_call_azure_functions_tools_base_url}?code={app_settings.azure_openai.function_call_azure_functions_tools_key}"
-            async with httpx.AsyncClient() as client:
-                response = await client.get(azure_functions_tools_url)
-            response_status_code = response.status_code
-            if response_status_code == httpx.codes.OK:
-                azure_openai_tools.extend(json.loads(response.text))
-                for tool in azure_openai_tools:
-                    azure_openai_available_tools.append(tool["function"]["name"])
-            else:
-                logging.error(f"An error occurred while getting OpenAI Function Call tools metadata: {response.status_code}")
-
-        
-        azure_openai_client = AsyncAzureOpenAI(
-            api_version=app_settings.azure_openai.preview_api_version,
-            api_key=aoai_api_key,
-            azure_ad_token_provider=ad_token_provider,
-            default_headers=default_headers,
-            azure_endpoint=endpoint,
-        )
-
-        return azure_openai_client
-    except Exception as e:
-        logging.exception("Exception in Azure OpenAI initialization", e)
-        azure_openai_client = None
-        raise e
+    return await current_app.client_registry.get_azure_openai_client()
 
 async def openai_remote_azure_function_call(function_name, function_args):
     if app_settings.azure_openai.function_call_azure_functions_enabled is not True:
@@ -200,12 +175,45 @@ async def openai_remote_azure_function_call(function_name, function_args):
         "tool_name": function_name,
         "tool_arguments": json.loads(function_args)
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.post(azure_functions_tool_url, data=json.dumps(body), headers=headers)
+    client_registry = current_app.client_registry
+    async with client_registry.tool_call_semaphore:
+        response = await client_registry.http_client.post(
+            azure_functions_tool_url,
+            content=json.dumps(body),
+            headers=headers,
+            timeout=app_settings.azure_openai.function_call_azure_functions_tool_timeout
+        )
     response.raise_for_status()
 
     return response.text
 
+
+async def execute_tool_calls(tool_calls):
+    """Run (name, arguments) tool calls concurrently, returning their results in the same order.
+
+    A tool that fails or times out gets an error result so the model can still
+    answer with the others.
+    """
+    # The httpx timeout only bounds each connect/read, so give every call a
+    # total deadline that also covers waiting on the tool call semaphore
+    timeout = app_settings.azure_openai.function_call_azure_functions_tool_timeout
+
+    async def call_tool(function_name, function_args):
+        try:
+            return await asyncio.wait_for(
+                openai_remote_azure_function_call(function_name, function_args),
+                timeout=timeout
+            )
+        except Exception as e:
+            logging.exception(f"Exception in Azure Function tool call {function_name}")
+            if isinstance(e, (asyncio.TimeoutError, httpx.TimeoutException)):
+                return json.dumps({"error": f"Tool {function_name} timed out"})
+            return json.dumps({"error": f"Tool {function_name} failed"})
+
+    return await asyncio.gather(
+        *(call_tool(function_name, function_args) for function_name, function_args in tool_calls)
+    )
+
 async def init_cosmosdb_client():
     cosmos_conversation_client = None
     if app_settings.chat_history:
@@ -227,7 +235,15 @@ async def init_cosmosdb_client():
                 database_name=app_settings.chat_history.database,
                 container_name=app_settings.chat_history.conversations_container,
                 enable_message_feedback=app_settings.chat_history.enable_feedback,
+                delete_max_concurrency=app_settings.chat_history.delete_max_concurrency,
             )
+            try:
+                indexing_policy_issues = await cosmos_conversation_client.verify_indexing_policy()
+                for issue in indexing_policy_issues:
+                    logging.warning(f"CosmosDB indexing policy: {issue}")
+            except Exception:
+                # Queries fall back to sorting on single fields
+                logging.exception("Failed to read the CosmosDB indexing policy")
         except Exception as e:
             logging.exception("Exception in CosmosDB initialization", e)
             cosmos_conversation_client = None
@@ -238,7 +254,79 @@ async def init_cosmosdb_client():
     return cosmos_conversation_client
 
 
-def prepare_model_args(request_body, request_headers):
+def init_history_write_behind(cosmos_conversation_client):
+    if not cosmos_conversation_client or not app_settings.chat_history.write_behind_enabled:
+        return None
+
+    write_behind = HistoryWriteBehind(
+        workers=app_settings.chat_history.write_behind_workers,
+        max_pending=app_settings.chat_history.write_behind_max_pending
+    )
+    write_behind.start()
+    return write_behind
+
+
+async def write_history_message(user_id, conversation_id, input_message, message_id=None):
+    """Write a message to the conversation history.
+
+    With write-behind enabled the write is only queued, and a missing
+    conversation is logged instead of failing the request.
+    """
+    cosmos_conversation_client = current_app.cosmos_conversation_client
+
+    async def write():
+        createdMessageValue = await cosmos_conversation_client.create_message(
+            uuid=message_id or str(uuid.uuid4()),
+            conversation_id=conversation_id,
+            user_id=user_id,
+            input_message=input_message,
+        )
+        if createdMessageValue == "Conversation not found":
+            raise Exception(
+                "Conversation not found for the given conversation ID: "
+                + conversation_id
+                + "."
+            )
+        return createdMessageValue
+
+    if current_app.history_write_behind:
+        await current_app.history_write_behind.submit(conversation_id, write)
+    else:
+        await write()
+
+
+async def delete_history_items(user_id, message_ids, conversation_ids=()):
+    """Delete history documents, returning the background job if there are too many to wait for."""
+    conversation_ids = list(conversation_ids)
+    threshold = app_settings.chat_history.delete_background_threshold
+    if threshold and len(message_ids) + len(conversation_ids) > threshold:
+        return await current_app.history_delete_jobs.start(user_id, message_ids, conversation_ids)
+
+    await current_app.cosmos_conversation_client.delete_history_items(user_id, message_ids, conversation_ids)
+    return None
+
+
+def delete_job_response(job):
+    return (
+        jsonify(
+            {
+                "message": "Deleting in the background",
+                "job_id": job["id"],
+                "total": job["total"],
+            }
+        ),
+        202,
+    )
+
+
+async def wait_for_history_writes(conversation_id=None):
+    # Reads and deletes must see the messages that are still queued, which
+    # only covers the writes queued by this worker
+    if current_app.history_write_behind:
+        await current_app.history_write_behind.wait_for(conversation_id)
+
+
+async def prepare_model_args(request_body, request_headers):
     request_messages = request_body.get("messages", [])
     messages = []
     if not app_settings.datasource:
@@ -293,53 +381,24 @@ def prepare_model_args(request_body, request_headers):
 
     if len(messages) > 0:
         if messages[-1]["role"] == "user":
+            azure_openai_tools = current_app.client_registry.azure_openai_tools
             if app_settings.azure_openai.function_call_azure_functions_enabled and len(azure_openai_tools) > 0:
                 model_args["tools"] = azure_openai_tools
 
             if app_settings.datasource:
+                request_parameters = await app_settings.datasource.request_payload_parameters(
+                    request,
+                    group_resolver=current_app.client_registry.graph_group_resolver
+                )
                 model_args["extra_body"] = {
                     "data_sources": [
                         app_settings.datasource.construct_payload_configuration(
-                            request=request
+                            request_parameters=request_parameters
                         )
                     ]
                 }
 
-    model_args_clean = copy.deepcopy(model_args)
-    if model_args_clean.get("extra_body"):
-        secret_params = [
-            "key",
-            "connection_string",
-            "embedding_key",
-            "encoded_api_key",
-            "api_key",
-        ]
-        for secret_param in secret_params:
-            if model_args_clean["extra_body"]["data_sources"][0]["parameters"].get(
-                secret_param
-            ):
-                model_args_clean["extra_body"]["data_sources"][0]["parameters"][
-                    secret_param
-                ] = "*****"
-        authentication = model_args_clean["extra_body"]["data_sources"][0][
-            "parameters"
-        ].get("authentication", {})
-        for field in authentication:
-            if field in secret_params:
-                model_args_clean["extra_body"]["data_sources"][0]["parameters"][
-                    "authentication"
-                ][field] = "*****"
-        embeddingDependency = model_args_clean["extra_body"]["data_sources"][0][
-            "parameters"
-        ].get("embedding_dependency", {})
-        if "authentication" in embeddingDependency:
-            for field in embeddingDependency["authentication"]:
-                if field in secret_params:
-                    model_args_clean["extra_body"]["data_sources"][0]["parameters"][
-                        "embedding_dependency"
-                    ]["authentication"][field] = "*****"
-
-    logging.debug(f"REQUEST BODY: {json.dumps(model_args_clean, indent=4)}")
+    log_redacted_debug("REQUEST BODY", model_args)
 
     return model_args
 
@@ -382,13 +441,16 @@ async def process_function_call(response):
     messages = []
 
     if response_message.tool_calls:
-        for tool_call in response_message.tool_calls:
-            # Check if function exists
-            if tool_call.function.name not in azure_openai_available_tools:
-                continue
-            
-            function_response = await openai_remote_azure_function_call(tool_call.function.name, tool_call.function.arguments)
+        # Skip functions that do not exist
+        tool_calls = [
+            tool_call for tool_call in response_message.tool_calls
+            if tool_call.function.name in current_app.client_registry.azure_openai_available_tools
+        ]
+        function_responses = await execute_tool_calls(
+            [(tool_call.function.name, tool_call.function.arguments) for tool_call in tool_calls]
+        )
 
+        for tool_call, function_response in zip(tool_calls, function_responses):
             # adding assistant response to messages
             messages.append(
                 {
@@ -414,34 +476,33 @@ async def process_function_call(response):
     
     return None
 
-async def send_chat_request(request_body, request_headers):
-    filtered_messages = []
+def get_user_message(request_body):
     user_message = ""
+    for message in request_body.get("messages", []):
+        if message.get("role") == "user":
+            user_message = message["content"]
+
+    return user_message
+
+
+async def send_chat_request(request_body, request_headers, agent_response=None):
+    filtered_messages = []
     messages = request_body.get("messages", [])
     for message in messages:
         if message.get("role") != 'tool':
             filtered_messages.append(message)
-        
-        if message.get("role") == "user":
-            user_message = message["content"]
-            
+
+    user_message = get_user_message(request_body)
     request_body['messages'] = filtered_messages
-    model_args = prepare_model_args(request_body, request_headers)
+    model_args = await prepare_model_args(request_body, request_headers)
 
     try:
+        if agent_response is None:
+            agent_response = await get_agent_response(user_message)
 
-        from backend.datasources.neo4j_datasource import Neo4jDatasource
-        from backend.agents.agents import get_agent_response
-
-        agent_response = await get_agent_response(user_message)
-
-        reviewer_message = [
-            msg.content for msg in agent_response.messages 
-            if (
-                hasattr(msg, 'type') and msg.type == 'TextMessage' and
-                hasattr(msg, 'source') and msg.source == 'CaseReviewer'
-            )
-        ]
+        reviewer_message = get_reviewer_message(agent_response)
+        if reviewer_message is None:
+            raise ValueError("The agent team did not produce a CaseReviewer answer")
         
         if not (m.get("role") == "system" for m in model_args["messages"]):
             model_args["messages"].insert(
@@ -454,7 +515,7 @@ async def send_chat_request(request_body, request_headers):
 
         model_args["messages"].append({
             "role": "user", #tool
-            "content": reviewer_message[-1]
+            "content": reviewer_message
         })
         
         azure_openai_client = await init_openai_client()
@@ -465,10 +526,27 @@ async def send_chat_request(request_body, request_headers):
         logging.exception("Exception in send_chat_request")
         raise e
 
-    return response, apim_request_id
+    return response, apim_request_id, agent_response
+
+
+def single_pass_enabled():
+    return app_settings.agents.pipeline_mode == "single_pass"
 
 
 async def complete_chat_request(request_body, request_headers):
+    if single_pass_enabled() and not app_settings.base_settings.use_promptflow:
+        # The CaseReviewer answer is the response, no re-synthesis completion
+        agent_response = await get_agent_response(get_user_message(request_body))
+        reviewer_message = get_reviewer_message(agent_response)
+        if reviewer_message is None:
+            raise ValueError("The agent team did not produce a CaseReviewer answer")
+
+        history_metadata = request_body.get("history_metadata", {})
+        completion = answer_completion(
+            str(uuid.uuid4()), app_settings.azure_openai.model, int(time.time()), reviewer_message
+        )
+        return format_non_streaming_response(completion, history_metadata, None)
+
     if app_settings.base_settings.use_promptflow:
         response = await promptflow_request(request_body)
         history_metadata = request_body.get("history_metadata", {})
@@ -479,7 +557,7 @@ async def complete_chat_request(request_body, request_headers):
             app_settings.promptflow.citations_field_name
         )
     else:
-        response, apim_request_id = await send_chat_request(request_body, request_headers)
+        response, apim_request_id, agent_response = await send_chat_request(request_body, request_headers)
         history_metadata = request_body.get("history_metadata", {})
         non_streaming_response = format_non_streaming_response(response, history_metadata, apim_request_id)
 
@@ -489,7 +567,9 @@ async def complete_chat_request(request_body, request_headers):
             if function_response:
                 request_body["messages"].extend(function_response)
 
-                response, apim_request_id = await send_chat_request(request_body, request_headers)
+                response, apim_request_id, _ = await send_chat_request(
+                    request_body, request_headers, agent_response=agent_response
+                )
                 history_metadata = request_body.get("history_metadata", {})
                 non_streaming_response = format_non_streaming_response(response, history_metadata, apim_request_id)
 
@@ -534,9 +614,11 @@ async def process_function_call_stream(completionChunk, function_call_stream_sta
             function_call_stream_state.current_tool_call["tool_arguments"] = function_call_stream_state.tool_arguments_stream
             function_call_stream_state.tool_calls.append(function_call_stream_state.current_tool_call)
             
-            for tool_call in function_call_stream_state.tool_calls:
-                tool_response = await openai_remote_azure_function_call(tool_call["tool_name"], tool_call["tool_arguments"])
+            tool_responses = await execute_tool_calls(
+                [(tool_call["tool_name"], tool_call["tool_arguments"]) for tool_call in function_call_stream_state.tool_calls]
+            )
 
+            for tool_call, tool_response in zip(function_call_stream_state.tool_calls, tool_responses):
                 function_call_stream_state.function_messages.append({
                     "role": "assistant",
                     "function_call": {
@@ -559,35 +641,91 @@ async def process_function_call_stream(completionChunk, function_call_stream_sta
             return function_call_stream_state.streaming_state
 
 
+def coalesce_stream(response):
+    aoai = app_settings.azure_openai
+    if aoai.stream_coalesce_max_delay_ms <= 0:
+        return response
+
+    return coalesce_chunks(
+        response,
+        max_delay=aoai.stream_coalesce_max_delay_ms / 1000,
+        max_chars=aoai.stream_coalesce_max_chars
+    )
+
+
 async def stream_chat_request(request_body, request_headers):
-    response, apim_request_id = await send_chat_request(request_body, request_headers)
     history_metadata = request_body.get("history_metadata", {})
-    
-    async def generate(apim_request_id, history_metadata):
+    user_message = get_user_message(request_body)
+
+    # The agent pass runs inside the response stream, so the first agent event
+    # reaches the browser as soon as it happens instead of after the whole pass
+    @stream_with_context
+    async def generate(history_metadata):
+        single_pass = single_pass_enabled()
+        response_id = str(uuid.uuid4())
+        created = int(time.time())
+        answer_streamed = False
+        encoder = StreamResponseEncoder(history_metadata, None)
+
+        agent_response = None
+        async for message in stream_agent_response(user_message):
+            if isinstance(message, TaskResult):
+                agent_response = message
+                continue
+
+            if single_pass and message.source == REVIEWER_SOURCE:
+                # Reviewer tokens are the answer itself, sent as completion chunks
+                if is_reviewer_token(message):
+                    answer_streamed = True
+                    chunk = answer_chunk(response_id, app_settings.azure_openai.model, created, message.content)
+                    yield encoder.encode(chunk)
+                continue
+
+            agent_event = format_agent_event(message)
+            if agent_event:
+                yield encode_ndjson(agent_event)
+
+        if single_pass:
+            if not answer_streamed:
+                reviewer_message = get_reviewer_message(agent_response) if agent_response else None
+                if reviewer_message is None:
+                    raise ValueError("The agent team did not produce a CaseReviewer answer")
+                chunk = answer_chunk(response_id, app_settings.azure_openai.model, created, reviewer_message)
+                yield encoder.encode(chunk)
+            return
+
+        response, apim_request_id, _ = await send_chat_request(
+            request_body, request_headers, agent_response=agent_response
+        )
+        encoder = StreamResponseEncoder(history_metadata, apim_request_id)
+
         if app_settings.azure_openai.function_call_azure_functions_enabled:
             # Maintain state during function call streaming
             function_call_stream_state = AzureOpenaiFunctionCallStreamState()
             
-            async for completionChunk in response:
+            async for completionChunk in coalesce_stream(response):
                 stream_state = await process_function_call_stream(completionChunk, function_call_stream_state, request_body, request_headers, history_metadata, apim_request_id)
                 
                 # No function call, asistant response
                 if stream_state == "INITIAL":
-                    yield format_stream_response(completionChunk, history_metadata, apim_request_id)
+                    yield encoder.encode(completionChunk)
 
                 # Function call stream completed, functions were executed.
                 # Append function calls and results to history and send to OpenAI, to stream the final answer.
                 if stream_state == "COMPLETED":
                     request_body["messages"].extend(function_call_stream_state.function_messages)
-                    function_response, apim_request_id = await send_chat_request(request_body, request_headers)
-                    async for functionCompletionChunk in function_response:
-                        yield format_stream_response(functionCompletionChunk, history_metadata, apim_request_id)
+                    function_response, apim_request_id, _ = await send_chat_request(
+                        request_body, request_headers, agent_response=agent_response
+                    )
+                    encoder = StreamResponseEncoder(history_metadata, apim_request_id)
+                    async for functionCompletionChunk in coalesce_stream(function_response):
+                        yield encoder.encode(functionCompletionChunk)
                 
         else:
-            async for completionChunk in response:
-                yield format_stream_response(completionChunk, history_metadata, apim_request_id)
+            async for completionChunk in coalesce_stream(response):
+                yield encoder.encode(completionChunk)
 
-    return generate(apim_request_id=apim_request_id, history_metadata=history_metadata)
+    return generate(history_metadata=history_metadata)
 
 
 async def conversation_internal(request_body, request_headers):
@@ -659,18 +797,7 @@ async def add_conversation():
         ## then write it to the conversation history in cosmos
         messages = request_json["messages"]
         if len(messages) > 0 and messages[-1]["role"] == "user":
-            createdMessageValue = await current_app.cosmos_conversation_client.create_message(
-                uuid=str(uuid.uuid4()),
-                conversation_id=conversation_id,
-                user_id=user_id,
-                input_message=messages[-1],
-            )
-            if createdMessageValue == "Conversation not found":
-                raise Exception(
-                    "Conversation not found for the given conversation ID: "
-                    + conversation_id
-                    + "."
-                )
+            await write_history_message(user_id, conversation_id, messages[-1])
         else:
             raise Exception("No user message found")
 
@@ -710,18 +837,10 @@ async def update_conversation():
         if len(messages) > 0 and messages[-1]["role"] == "assistant":
             if len(messages) > 1 and messages[-2].get("role", None) == "tool":
                 # write the tool message first
-                await current_app.cosmos_conversation_client.create_message(
-                    uuid=str(uuid.uuid4()),
-                    conversation_id=conversation_id,
-                    user_id=user_id,
-                    input_message=messages[-2],
-                )
+                await write_history_message(user_id, conversation_id, messages[-2])
             # write the assistant message
-            await current_app.cosmos_conversation_client.create_message(
-                uuid=messages[-1]["id"],
-                conversation_id=conversation_id,
-                user_id=user_id,
-                input_message=messages[-1],
+            await write_history_message(
+                user_id, conversation_id, messages[-1], message_id=messages[-1]["id"]
             )
         else:
             raise Exception("No bot messages found")
@@ -800,15 +919,14 @@ async def delete_conversation():
         if not current_app.cosmos_conversation_client:
             raise Exception("CosmosDB is not configured or not working")
 
-        ## delete the conversation messages from cosmos first
-        deleted_messages = await current_app.cosmos_conversation_client.delete_messages(
-            conversation_id, user_id
-        )
-
-        ## Now delete the conversation
-        deleted_conversation = await current_app.cosmos_conversation_client.delete_conversation(
+        ## delete the conversation messages from cosmos first, then the conversation
+        await wait_for_history_writes(conversation_id)
+        message_ids = await current_app.cosmos_conversation_client.get_message_ids(
             user_id, conversation_id
         )
+        job = await delete_history_items(user_id, message_ids, [conversation_id])
+        if job:
+            return delete_job_response(job)
 
         return (
             jsonify(
@@ -827,7 +945,8 @@ async def delete_conversation():
 @bp.route("/history/list", methods=["GET"])
 async def list_conversations():
     await cosmos_db_ready.wait()
-    offset = request.args.get("offset", 0)
+    offset = int(request.args.get("offset", 0))
+    continuation_token = request.args.get("continuation_token", None)
     authenticated_user = get_authenticated_user_details(request_headers=request.headers)
     user_id = authenticated_user["user_principal_id"]
 
@@ -836,15 +955,24 @@ async def list_conversations():
         raise Exception("CosmosDB is not configured or not working")
 
     ## get the conversations from cosmos
-    conversations = await current_app.cosmos_conversation_client.get_conversations(
-        user_id, offset=offset, limit=25
-    )
+    if "offset" in request.args and not continuation_token:
+        # Clients that still page with ?offset=, including the first ?offset=0 page
+        conversations = await current_app.cosmos_conversation_client.get_conversations(
+            user_id, offset=offset, limit=25
+        )
+        next_continuation_token = None
+    else:
+        conversations, next_continuation_token = await current_app.cosmos_conversation_client.get_conversations_page(
+            user_id, limit=25, continuation_token=continuation_token
+        )
     if not isinstance(conversations, list):
         return jsonify({"error": f"No conversations for {user_id} were found"}), 404
 
-    ## return the conversation ids
-
-    return jsonify(conversations), 200
+    ## return the conversations, the token of the next page goes in a header so the body stays a list
+    response = jsonify(conversations)
+    if next_continuation_token:
+        response.headers[HISTORY_CONTINUATION_HEADER] = next_continuation_token
+    return response, 200
 
 
 @bp.route("/history/read", methods=["POST"])
@@ -865,6 +993,7 @@ async def get_conversation():
         raise Exception("CosmosDB is not configured or not working")
 
     ## get the conversation object and the related messages from cosmos
+    await wait_for_history_writes(conversation_id)
     conversation = await current_app.cosmos_conversation_client.get_conversation(
         user_id, conversation_id
     )
@@ -916,11 +1045,15 @@ async def rename_conversation():
     if not current_app.cosmos_conversation_client:
         raise Exception("CosmosDB is not configured or not working")
 
-    ## get the conversation from cosmos
-    conversation = await current_app.cosmos_conversation_client.get_conversation(
-        user_id, conversation_id
+    ## update the title
+    title = request_json.get("title", None)
+    if not title:
+        return jsonify({"error": "title is required"}), 400
+
+    updated_conversation = await current_app.cosmos_conversation_client.rename_conversation(
+        user_id, conversation_id, title
     )
-    if not conversation:
+    if not updated_conversation:
         return (
             jsonify(
                 {
@@ -930,15 +1063,6 @@ async def rename_conversation():
             404,
         )
 
-    ## update the title
-    title = request_json.get("title", None)
-    if not title:
-        return jsonify({"error": "title is required"}), 400
-    conversation["title"] = title
-    updated_conversation = await current_app.cosmos_conversation_client.upsert_conversation(
-        conversation
-    )
-
     return jsonify(updated_conversation), 200
 
 
@@ -955,23 +1079,17 @@ async def delete_all_conversations():
         if not current_app.cosmos_conversation_client:
             raise Exception("CosmosDB is not configured or not working")
 
-        conversations = await current_app.cosmos_conversation_client.get_conversations(
-            user_id, offset=0, limit=None
-        )
-        if not conversations:
+        await wait_for_history_writes()
+        conversation_ids = await current_app.cosmos_conversation_client.get_conversation_ids(user_id)
+        if not conversation_ids:
             return jsonify({"error": f"No conversations for {user_id} were found"}), 404
 
-        # delete each conversation
-        for conversation in conversations:
-            ## delete the conversation messages from cosmos first
-            deleted_messages = await current_app.cosmos_conversation_client.delete_messages(
-                conversation["id"], user_id
-            )
+        # delete every message, then every conversation
+        message_ids = await current_app.cosmos_conversation_client.get_message_ids(user_id)
+        job = await delete_history_items(user_id, message_ids, conversation_ids)
+        if job:
+            return delete_job_response(job)
 
-            ## Now delete the conversation
-            deleted_conversation = await current_app.cosmos_conversation_client.delete_conversation(
-                user_id, conversation["id"]
-            )
         return (
             jsonify(
                 {
@@ -1006,9 +1124,13 @@ async def clear_messages():
             raise Exception("CosmosDB is not configured or not working")
 
         ## delete the conversation messages from cosmos
-        deleted_messages = await current_app.cosmos_conversation_client.delete_messages(
-            conversation_id, user_id
+        await wait_for_history_writes(conversation_id)
+        message_ids = await current_app.cosmos_conversation_client.get_message_ids(
+            user_id, conversation_id
         )
+        job = await delete_history_items(user_id, message_ids)
+        if job:
+            return delete_job_response(job)
 
         return (
             jsonify(
@@ -1024,6 +1146,40 @@ async def clear_messages():
         return jsonify({"error": str(e)}), 500
 
 
+@bp.route("/history/delete_status", methods=["GET"])
+async def delete_status():
+    await cosmos_db_ready.wait()
+    authenticated_user = get_authenticated_user_details(request_headers=request.headers)
+    user_id = authenticated_user["user_principal_id"]
+
+    job_id = request.args.get("job_id", None)
+    if not job_id:
+        return jsonify({"error": "job_id is required"}), 400
+
+    ## make sure cosmos is configured
+    if not current_app.cosmos_conversation_client:
+        raise Exception("CosmosDB is not configured or not working")
+
+    job = await current_app.history_delete_jobs.get(user_id, job_id)
+    if not job:
+        return jsonify({"error": f"Delete job {job_id} was not found"}), 404
+
+    return (
+        jsonify(
+            {
+                "job_id": job["id"],
+                "status": job["status"],
+                "total": job["total"],
+                "deleted": job["deleted"],
+                "error": job["error"],
+                "createdAt": job["createdAt"],
+                "updatedAt": job["updatedAt"],
+            }
+        ),
+        200,
+    )
+
+
 @bp.route("/history/ensure", methods=["GET"])
 async def ensure_cosmos():
     await cosmos_db_ready.wait()
@@ -1037,7 +1193,14 @@ async def ensure_cosmos():
                 return jsonify({"error": err}), 422
             return jsonify({"error": "CosmosDB is not configured or not working"}), 500
 
-        return jsonify({"message": "CosmosDB is configured and working"}), 200
+        indexing_policy_issues = current_app.cosmos_conversation_client.indexing_policy_issues
+        return jsonify({
+            "message": "CosmosDB is configured and working",
+            "indexing_policy": {
+                "supported": not indexing_policy_issues,
+                "issues": indexing_policy_issues,
+            }
+        }), 200
     except Exception as e:
         logging.exception("Exception in /history/ensure")
         cosmos_exception = str(e)
@@ -1,9 +1,34 @@
 # Extended implementation with custom workflows and tools
 
 from typing import Dict, List, Any, Optional, Tuple
-from backend.datasources.neo4j_datasource import Neo4jDatasource
+from backend.datasources.neo4j_datasource import AsyncNeo4jDatasource
+from backend.agents.result_cache import SemanticResultCache
+from backend.embeddings import EmbeddingService
+import logging
 import os 
 
+# Rank constant for reciprocal rank fusion, 60 is the value from the original paper
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(result_lists: List[List[Dict]], k: int = RRF_K) -> List[Dict]:
+    """Fuse ranked result lists into one list, de-duplicated by document id.
+
+    Each document scores sum(1 / (k + rank)) over the lists it appears in, so
+    documents found by several query variations rank above single hits.
+    """
+    fused = {}
+    for query_index, results in enumerate(result_lists):
+        for rank, doc in enumerate(results, start=1):
+            entry = fused.get(doc["id"])
+            if entry is None:
+                entry = fused[doc["id"]] = dict(doc, matched_queries=[], **{"@search.rrf_score": 0.0})
+            entry["@search.rrf_score"] += 1.0 / (k + rank)
+            entry["matched_queries"].append(query_index + 1)
+
+    return sorted(fused.values(), key=lambda doc: doc["@search.rrf_score"], reverse=True)
+
+
 # Create a custom tool registry for our agents
 class AgentTools:
     def __init__(self):
@@ -19,30 +44,102 @@ class AgentTools:
                 "uri": neo4j_uri,
                 "username": neo4j_user,
                 "password": neo4j_password,
-                "database": neo4j_database
+                "database": neo4j_database,
+                "max_connection_pool_size": int(os.environ.get("NEO4J_MAX_CONNECTION_POOL_SIZE", 50)),
+                "connection_acquisition_timeout": float(os.environ.get("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", 60)),
+                "liveness_check_timeout": float(os.environ.get("NEO4J_LIVENESS_CHECK_TIMEOUT", 30)),
+                "search_mode": os.environ.get("NEO4J_SEARCH_MODE", "scan"),
+                "chunk_label": os.environ.get("NEO4J_CHUNK_LABEL", "Chunk"),
+                "vector_index_name": os.environ.get("NEO4J_VECTOR_INDEX_NAME", "chunk_embedding_index"),
+                "vector_dimensions": int(os.environ.get("NEO4J_VECTOR_DIMENSIONS", 3072)),
+                "vector_similarity_function": os.environ.get("NEO4J_VECTOR_SIMILARITY_FUNCTION", "cosine"),
+                "vector_overfetch": int(os.environ.get("NEO4J_VECTOR_OVERFETCH", 4)),
+                "create_vector_index": os.environ.get("NEO4J_CREATE_VECTOR_INDEX", "true").lower() == "true"
             }
         }
         app_settings = NestedAppSettings(**nested_config)
-        self.neo4j_datasource = Neo4jDatasource(app_settings)
+        self.neo4j_datasource = AsyncNeo4jDatasource(app_settings)
+        self.embedding_service = EmbeddingService.from_env()
+
+        self.result_cache = None
+        if os.environ.get("SEMANTIC_CACHE_ENABLED", "true").lower() == "true":
+            self.result_cache = SemanticResultCache(
+                max_entries=int(os.environ.get("SEMANTIC_CACHE_MAX_ENTRIES", 256)),
+                ttl=float(os.environ.get("SEMANTIC_CACHE_TTL_SECONDS", 900)),
+                similarity_threshold=float(os.environ.get("SEMANTIC_CACHE_SIMILARITY_THRESHOLD", 0.97))
+            )
         print("Tools instance initiated!")
 
+    async def close(self):
+        if self.result_cache is not None:
+            logging.info(f"Semantic search cache metrics: {self.result_cache.metrics()}")
+        await self.embedding_service.close()
+        await self.neo4j_datasource.close()
     
-    def get_embedding(self, text: str) -> List[float]:
-        from backend.utils import get_ada_large_embeddings
-        return get_ada_large_embeddings(text)
+    async def get_embedding(self, text: str) -> List[float]:
+        return await self.embedding_service.embed(text)
+
+    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return await self.embedding_service.embed_many(texts)
     
-    def semantic_search(self, query: str, top_k: int = 5, kind: str = None) -> List[Dict]:
+    async def semantic_search(self, query: str, top_k: int = 5, kind: str = None) -> List[Dict]:
         print("started semantic search")
-        embedding = self.get_embedding(query)
-        result = self.neo4j_datasource.semantic_search(embedding, top_k=top_k, kind=kind)
+        if self.result_cache is None:
+            embedding = await self.get_embedding(query)
+            result = await self.neo4j_datasource.semantic_search(embedding, top_k=top_k, kind=kind)
+            return self.format_documents(result)
+
+        result = self.result_cache.get(query, top_k, kind)
+        if result is None:
+            embedding = await self.get_embedding(query)
+            result = self.result_cache.get_similar(embedding, top_k, kind)
+            if result is None:
+                result = await self.neo4j_datasource.semantic_search(embedding, top_k=top_k, kind=kind)
+                # An empty result may be a failed query, do not keep it around
+                if result:
+                    self.result_cache.put(query, top_k, kind, embedding, result)
+
         formatted_result = self.format_documents(result)
         return formatted_result
+
+    async def semantic_search_many(self, queries: List[str], top_k: int = 5, kind: str = None) -> str:
+        """Run several search queries with one embeddings call and one graph query.
+
+        Queries answered by the result cache are left out of both calls.
+        """
+        queries = [query for query in queries if query and query.strip()]
+        if not queries:
+            return self.format_documents([])
+
+        result_lists = [None] * len(queries)
+        if self.result_cache is not None:
+            result_lists = [self.result_cache.get(query, top_k, kind) for query in queries]
+
+        missing = [i for i, result in enumerate(result_lists) if result is None]
+        if missing:
+            embeddings = await self.get_embeddings([queries[i] for i in missing])
+            if self.result_cache is not None:
+                for i, embedding in zip(missing, embeddings):
+                    result_lists[i] = self.result_cache.get_similar(embedding, top_k, kind)
+
+            searches = [(i, embedding) for i, embedding in zip(missing, embeddings) if result_lists[i] is None]
+            if searches:
+                found = await self.neo4j_datasource.semantic_search_many(
+                    [embedding for _, embedding in searches], top_k=top_k, kind=kind
+                )
+                for (i, embedding), result in zip(searches, found):
+                    result_lists[i] = result
+                    # An empty result may be a failed query, do not keep it around
+                    if result and self.result_cache is not None:
+                        self.result_cache.put(queries[i], top_k, kind, embedding, result)
+
+        return self.format_documents(reciprocal_rank_fusion(result_lists), queries=queries)
     
-    def keyword_search(self, keywords: List[str], top_k: int = 5) -> List[Dict]:
-        result = self.neo4j_datasource.keyword_search(keywords, top_k=top_k)
+    async def keyword_search(self, keywords: List[str], top_k: int = 5) -> List[Dict]:
+        result = await self.neo4j_datasource.keyword_search(keywords, top_k=top_k)
         return result
 
-    def format_documents(self, documents: List[Dict]) -> str:
+    def format_documents(self, documents: List[Dict], queries: Optional[List[str]] = None) -> str:
         """Format documents for agent consumption while preserving references"""
         formatted = []
         references = []
@@ -55,7 +152,8 @@ class AgentTools:
             # Create reference entry
             reference = {
                 "ref_id": ref_id,
-                "kind": kind
+                "kind": kind,
+                "title": doc.get("title", "")
             }
             
             # Add URLs or paths based on document kind
@@ -70,6 +168,11 @@ class AgentTools:
             # Format document with reference ID
             formatted_doc = f"DOCUMENT {ref_id}:\n"
             formatted_doc += f"Type: {kind}\n"
+
+            # Tell the agent which of its queries found the document
+            if queries and "matched_queries" in doc:
+                matched = "; ".join(f'"{queries[i - 1]}"' for i in doc["matched_queries"])
+                formatted_doc += f"Matched queries: {matched}\n"
             
             if "content" in doc:
                 formatted_doc += f"Content: {doc['content']}\n"
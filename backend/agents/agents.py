@@ -1,62 +1,29 @@
-from backend.agents.agent_tool import AgentTools
-from typing import Dict, List, Any, Optional, Tuple
-from autogen_agentchat.agents import AssistantAgent
-import dotenv
+import asyncio
+import logging
 import os
+from contextlib import asynccontextmanager
+from typing import Dict, List, Any, Optional
+
+import dotenv
+from autogen_agentchat.agents import AssistantAgent
+from autogen_agentchat.base import TaskResult
+from autogen_agentchat.teams import RoundRobinGroupChat
+from autogen_core.tools import FunctionTool
 from autogen_ext.models.openai import AzureOpenAIChatCompletionClient
-from autogen_agentchat.teams import DiGraphBuilder, GraphFlow, RoundRobinGroupChat
+from backend.agents.agent_tool import AgentTools
 from backend.agents.case_reviewer import get_case_reviewer_agent
 
 
-async def get_agent_response(case_description: str):
-    
-    dotenv.load_dotenv()  # or dotenv.load_dotenv(path_to_your_dotenv_file)
-
-    tools = AgentTools()
-
-    def semantic_search(query: str, top_k: int) -> List[Dict[str, Any]]:
-        """Perform semantic search using the provided tools instance."""
-        print(f"semantic search used with query {query}")
-        return tools.semantic_search(query, top_k=top_k, kind=None)
-
-    azure_model_client = AzureOpenAIChatCompletionClient(
-        model=os.environ.get("AZURE_OPENAI_MODEL"),
-        azure_endpoint=os.environ.get("AZURE_OPENAI_ENDPOINT"),
-        api_key=os.environ.get("AZURE_OPENAI_KEY"),
-        api_version=os.environ.get("AZURE_OPENAI_PREVIEW_API_VERSION"),
-        model_info={
-            "json_output": False,
-            "function_calling": False,
-            "vision": False,
-            "family": "unknown",
-            "structured_output": False,
-            "function_calling": True,
-            "multiple_system_messages": True}
-        )
-
-
-    azure_model_client_gpt4 = AzureOpenAIChatCompletionClient(
-        model=os.environ.get("GPT4_AZURE_OPENAI_MODEL"),
-        azure_endpoint=os.environ.get("GPT4_AZURE_OPENAI_ENDPOINT"),
-        api_key=os.environ.get("GPT4_AZURE_OPENAI_KEY"),
-        max_tokens=int(os.environ.get("GPT4_AZURE_OPENAI_MAX_TOKENS")),
-        api_version=os.environ.get("AZURE_OPENAI_PREVIEW_API_VERSION"),
-        model_info={
-            "json_output": False,
-            "function_calling": False,
-            "vision": False,
-            "family": "unknown",
-            "structured_output": False,
-            "function_calling": True,
-            "multiple_system_messages": True}
-        )
-    
-    
-    
+MODEL_INFO = {
+    "json_output": False,
+    "vision": False,
+    "family": "unknown",
+    "structured_output": False,
+    "function_calling": True,
+    "multiple_system_messages": True
+}
 
-    intent_agent = AssistantAgent(
-    "QueryOptimizer", 
-    system_message="""
+QUERY_OPTIMIZER_SYSTEM_MESSAGE = """
 You are a specialized QueryOptimizer agent responsible for analyzing support questions and generating optimized search queries to retrieve the most relevant information from multiple knowledge sources.
 
 YOUR PRIMARY RESPONSIBILITIES:
@@ -103,7 +70,9 @@ YOUR PRIMARY RESPONSIBILITIES:
    - Solution variation (emphasize fixing or resolving the issue)
 
 4. EXECUTE APPROPRIATE SEARCHES:
-   - Use semantic_search tool with your optimized queries
+   - Use the semantic_search_many tool to run all of your optimized queries in a single call
+   - Use the semantic_search tool only for an individual follow-up query
+   - Results are fused across queries; each document lists the queries that matched it
    - Set appropriate top_k values (10-15 for general, 5-8 for specific)
    - Search public documentation, troubleshooting guides, and internal knowledge bases
 
@@ -146,17 +115,170 @@ CRITICAL GUIDELINES:
 4. Include version numbers when mentioned in the original question
 5. Always search for both the problem AND potential solutions
 6. For limitations, be specific about the exact threshold or boundary in question
-""",
-    tools=[semantic_search],
-    reflect_on_tool_use=True,
-    model_client=azure_model_client_gpt4
-)
+"""
+
+
+def get_query_optimizer_agent(model_client, tools):
+    return AssistantAgent(
+        "QueryOptimizer",
+        system_message=QUERY_OPTIMIZER_SYSTEM_MESSAGE,
+        tools=tools,
+        reflect_on_tool_use=True,
+        model_client=model_client
+    )
+
+
+class AgentRuntime:
+    """Model clients, tools and agent teams built once per worker.
+
+    Each chat borrows a team from a small pool and the team is reset when it is
+    returned, so a request only pays for building a team the first time the pool
+    needs to grow.
+    """
+
+    def __init__(self, model_client, reviewer_model_client, tools, max_teams: int = 8):
+        self.model_client = model_client
+        self.reviewer_model_client = reviewer_model_client
+        self.tools = tools
+        self.max_teams = max_teams
+        self._idle_teams = []
+        self._team_count = 0
+        self._team_released = asyncio.Condition()
+
+        async def semantic_search(query: str, top_k: int) -> List[Dict[str, Any]]:
+            """Perform semantic search using the provided tools instance."""
+            logging.debug(f"semantic search used with query {query}")
+            return await tools.semantic_search(query, top_k=top_k, kind=None)
+
+        async def semantic_search_many(queries: List[str], top_k: int) -> str:
+            """Perform several semantic searches in one call and return fused, de-duplicated results."""
+            logging.debug(f"batched semantic search used with {len(queries)} queries")
+            return await tools.semantic_search_many(queries, top_k=top_k, kind=None)
+
+        self.search_tools = [
+            FunctionTool(semantic_search_many, description=semantic_search_many.__doc__),
+            FunctionTool(semantic_search, description=semantic_search.__doc__)
+        ]
+
+    @classmethod
+    def from_env(cls):
+        dotenv.load_dotenv()  # or dotenv.load_dotenv(path_to_your_dotenv_file)
+
+        azure_model_client = AzureOpenAIChatCompletionClient(
+            model=os.environ.get("AZURE_OPENAI_MODEL"),
+            azure_endpoint=os.environ.get("AZURE_OPENAI_ENDPOINT"),
+            api_key=os.environ.get("AZURE_OPENAI_KEY"),
+            api_version=os.environ.get("AZURE_OPENAI_PREVIEW_API_VERSION"),
+            model_info=MODEL_INFO
+        )
+
+        azure_model_client_gpt4 = AzureOpenAIChatCompletionClient(
+            model=os.environ.get("GPT4_AZURE_OPENAI_MODEL"),
+            azure_endpoint=os.environ.get("GPT4_AZURE_OPENAI_ENDPOINT"),
+            api_key=os.environ.get("GPT4_AZURE_OPENAI_KEY"),
+            max_tokens=int(os.environ.get("GPT4_AZURE_OPENAI_MAX_TOKENS")),
+            api_version=os.environ.get("AZURE_OPENAI_PREVIEW_API_VERSION"),
+            model_info=MODEL_INFO
+        )
+
+        return cls(
+            model_client=azure_model_client_gpt4,
+            reviewer_model_client=azure_model_client,
+            tools=AgentTools(),
+            max_teams=int(os.environ.get("AGENT_MAX_TEAMS", 8))
+        )
+
+    def build_team(self) -> RoundRobinGroupChat:
+        intent_agent = get_query_optimizer_agent(self.model_client, self.search_tools)
+        # Reviewer tokens are forwarded to the browser while the answer is written
+        case_reviewer = get_case_reviewer_agent(
+            model_client=self.reviewer_model_client,
+            model_client_stream=True
+        )
+        return RoundRobinGroupChat([intent_agent, case_reviewer], max_turns=2)
+
+    async def acquire_team(self) -> RoundRobinGroupChat:
+        async with self._team_released:
+            while not self._idle_teams and self._team_count >= self.max_teams:
+                await self._team_released.wait()
+            if self._idle_teams:
+                return self._idle_teams.pop()
+            self._team_count += 1
+
+        try:
+            return self.build_team()
+        except Exception:
+            # Give the slot back, or failed builds would eventually block every request
+            async with self._team_released:
+                self._team_count -= 1
+                self._team_released.notify()
+            raise
+
+    async def release_team(self, team: RoundRobinGroupChat):
+        try:
+            await team.reset()
+        except Exception:
+            logging.exception("Exception while resetting agent team, discarding it")
+            team = None
+
+        async with self._team_released:
+            if team is None:
+                self._team_count -= 1
+            else:
+                self._idle_teams.append(team)
+            self._team_released.notify()
+
+    @asynccontextmanager
+    async def team(self):
+        team = await self.acquire_team()
+        try:
+            yield team
+        finally:
+            await self.release_team(team)
+
+    async def run(self, task: str):
+        async with self.team() as team:
+            return await team.run(task=task)
+
+    async def run_stream(self, task: str):
+        """Yield agent messages and events as they happen, ending with the TaskResult."""
+        async with self.team() as team:
+            async for message in team.run_stream(task=task):
+                yield message
+
+    async def close(self):
+        await self.model_client.close()
+        await self.reviewer_model_client.close()
+        await self.tools.close()
+
+
+_agent_runtime: Optional[AgentRuntime] = None
+
+
+def get_agent_runtime() -> AgentRuntime:
+    global _agent_runtime
+    if _agent_runtime is None:
+        _agent_runtime = AgentRuntime.from_env()
+
+    return _agent_runtime
+
+
+async def close_agent_runtime():
+    global _agent_runtime
+    if _agent_runtime is not None:
+        await _agent_runtime.close()
+        _agent_runtime = None
+
+
+async def get_agent_response(case_description: str):
+    result = await get_agent_runtime().run(case_description)
 
-    case_reviewer = get_case_reviewer_agent(model_client=azure_model_client)
-    team = RoundRobinGroupChat([intent_agent, case_reviewer], max_turns=2)
+    logging.debug(f"=== FINAL RESULT ===\n{result}")
+    return result
 
-    result = await team.run(task=case_description)
 
-    print(f"\n=== FINAL RESULT ===")
-    print(result)
-    return result 
\ No newline at end of file
+async def stream_agent_response(case_description: str):
+    async for message in get_agent_runtime().run_stream(case_description):
+        if isinstance(message, TaskResult):
+            logging.debug(f"=== FINAL RESULT ===\n{message}")
+        yield message
@@ -1,6 +1,6 @@
 from autogen_agentchat.agents import AssistantAgent
 
-def get_case_reviewer_agent(model_client):
+def get_case_reviewer_agent(model_client, model_client_stream=False):
 
    case_reviewer_agent = AssistantAgent(
         name="CaseReviewer",
@@ -139,6 +139,7 @@ def get_case_reviewer_agent(model_client):
          Remember that your response serves as the definitive guide for resolving this support case. Be thorough, accurate, and practical, focusing on getting the customer to a complete resolution as efficiently as possible. Always include properly formatted references to support your analysis and recommendations.
          """,
         model_client=model_client,
+        model_client_stream=model_client_stream,
         #handoffs=["user"]
     )
       
@@ -0,0 +1,99 @@
+from typing import Any, Dict, List, Optional
+
+from openai.types.chat import ChatCompletion, ChatCompletionChunk, ChatCompletionMessage
+from openai.types.chat.chat_completion import Choice
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice, ChoiceDelta
+from autogen_agentchat.messages import (
+    ModelClientStreamingChunkEvent,
+    TextMessage,
+    ToolCallExecutionEvent,
+    ToolCallRequestEvent,
+)
+
+# Value of the "type" field that tells the frontend a frame is agent progress
+# rather than a chat completion chunk
+AGENT_EVENT = "agent_event"
+
+REFERENCES_HEADER = "=== DOCUMENT REFERENCES ==="
+
+REVIEWER_SOURCE = "CaseReviewer"
+
+
+def extract_references(tool_output: str) -> List[str]:
+    """Return the reference lines AgentTools.format_documents appends to search results."""
+    if REFERENCES_HEADER not in tool_output:
+        return []
+    references = tool_output.split(REFERENCES_HEADER, 1)[1]
+    return [line.strip() for line in references.splitlines() if line.strip()]
+
+
+def format_agent_event(message) -> Optional[Dict[str, Any]]:
+    """Convert an agent team message into a typed NDJSON frame, or None to skip it."""
+    frame = {"type": AGENT_EVENT, "source": message.source}
+
+    if isinstance(message, ModelClientStreamingChunkEvent):
+        frame["event"] = "token"
+        frame["content"] = message.content
+    elif isinstance(message, ToolCallRequestEvent):
+        frame["event"] = "tool_call"
+        frame["tool_calls"] = [
+            {"id": call.id, "name": call.name, "arguments": call.arguments}
+            for call in message.content
+        ]
+    elif isinstance(message, ToolCallExecutionEvent):
+        frame["event"] = "tool_result"
+        frame["results"] = [
+            {
+                "call_id": result.call_id,
+                "name": result.name,
+                "is_error": result.is_error,
+                "references": extract_references(result.content),
+            }
+            for result in message.content
+        ]
+    elif isinstance(message, TextMessage) and message.source != "user":
+        frame["event"] = "message"
+        frame["content"] = message.content
+    else:
+        return None
+
+    return frame
+
+
+def is_reviewer_token(message) -> bool:
+    return isinstance(message, ModelClientStreamingChunkEvent) and message.source == REVIEWER_SOURCE
+
+
+def get_reviewer_message(task_result) -> Optional[str]:
+    """Return the last answer the CaseReviewer produced in an agent run."""
+    reviewer_messages = [
+        message.content for message in task_result.messages
+        if isinstance(message, TextMessage) and message.source == REVIEWER_SOURCE
+    ]
+    return reviewer_messages[-1] if reviewer_messages else None
+
+
+# The reviewer answer is wrapped in the OpenAI types so that it goes through
+# StreamResponseEncoder / format_non_streaming_response like a completion
+def answer_chunk(response_id: str, model: str, created: int, content: str) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id=response_id,
+        model=model,
+        created=created,
+        object="chat.completion.chunk",
+        choices=[ChunkChoice(index=0, delta=ChoiceDelta(role="assistant", content=content))]
+    )
+
+
+def answer_completion(response_id: str, model: str, created: int, content: str) -> ChatCompletion:
+    return ChatCompletion(
+        id=response_id,
+        model=model,
+        created=created,
+        object="chat.completion",
+        choices=[Choice(
+            index=0,
+            finish_reason="stop",
+            message=ChatCompletionMessage(role="assistant", content=content)
+        )]
+    )
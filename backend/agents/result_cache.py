@@ -0,0 +1,117 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.embeddings import normalize_text
+
+
+@dataclass
+class _CachedResult:
+    vector: Optional[np.ndarray]
+    documents: List[Dict[str, Any]]
+    expires_at: float
+
+
+class SemanticResultCache:
+    """Search results cached by query text, with a fallback on query similarity.
+
+    The first tier matches the normalized query text, top_k and kind exactly.
+    The second tier reuses the result of a previous query with the same top_k
+    and kind whose embedding has a cosine similarity of at least
+    similarity_threshold. Entries expire after ttl seconds, the least recently
+    used entries are evicted beyond max_entries. Nothing tells the cache when
+    the graph is reloaded, so results are only as fresh as the ttl.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 900, similarity_threshold: float = 0.97):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, int, Optional[str]], _CachedResult]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(query: str, top_k: int, kind: Optional[str]) -> Tuple[str, int, Optional[str]]:
+        return (normalize_text(query), top_k, kind)
+
+    @staticmethod
+    def _unit_vector(vector: List[float]) -> Optional[np.ndarray]:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else None
+
+    def _live_entry(self, key) -> Optional[_CachedResult]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry
+
+    def get(self, query: str, top_k: int, kind: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        key = self._key(query, top_k, kind)
+        entry = self._live_entry(key)
+        if entry is None:
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry.documents
+
+    def get_similar(self, vector: List[float], top_k: int, kind: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        query_vector = self._unit_vector(vector)
+        if query_vector is None:
+            self.misses += 1
+            return None
+
+        best_key, best_score = None, self.similarity_threshold
+        for key in list(self._entries):
+            if key[1] != top_k or key[2] != kind:
+                continue
+            entry = self._live_entry(key)
+            if entry is None or entry.vector is None or entry.vector.shape != query_vector.shape:
+                continue
+            score = float(np.dot(entry.vector, query_vector))
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            self.misses += 1
+            return None
+
+        self.similar_hits += 1
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key].documents
+
+    def put(self, query: str, top_k: int, kind: Optional[str], vector: List[float], documents: List[Dict[str, Any]]):
+        key = self._key(query, top_k, kind)
+        self._entries[key] = _CachedResult(
+            vector=self._unit_vector(vector),
+            documents=documents,
+            expires_at=time.monotonic() + self.ttl
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def metrics(self) -> Dict[str, float]:
+        lookups = self.hits + self.similar_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.similar_hits) / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,123 @@
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+# $top=999 is the largest page Graph returns for directory objects, which keeps
+# most users to a single request
+GRAPH_GROUPS_ENDPOINT = "https://graph.microsoft.com/v1.0/me/transitiveMemberOf?$select=id&$top=999"
+
+
+def token_cache_key(user_token: str) -> str:
+    """Cache key for the group membership looked up with a token.
+
+    The hash of the whole token, not its tid/oid claims: the claims can't be
+    trusted without validating the signature, and a forged token carrying
+    another user's claims must not be served that user's groups. Only tokens
+    Microsoft Graph has accepted end up in the cache.
+    """
+    return hashlib.sha256(user_token.encode()).hexdigest()
+
+
+class GraphGroupResolver:
+    """Microsoft Graph group membership of users, cached per access token.
+
+    Memberships are kept for ttl seconds and the least recently used tokens
+    are evicted beyond max_entries. Concurrent lookups with the same token
+    share one set of Graph requests. Failed lookups are not cached.
+
+    Each @odata.nextLink page holds an opaque skip token that is only known
+    once the previous page has been read, so the pages of one user are
+    fetched in order; lookups for different users run concurrently.
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        ttl: float = 300,
+        max_entries: int = 1024,
+        endpoint: str = GRAPH_GROUPS_ENDPOINT
+    ):
+        self.http_client = http_client
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.endpoint = endpoint
+        self.hits = 0
+        self.shared = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[List[str], float]]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_group_ids(self, user_token: str) -> List[str]:
+        key = token_cache_key(user_token)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[1] > time.monotonic():
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return list(entry[0])
+            del self._entries[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.create_task(self._load(key, user_token))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.shared += 1
+
+        # Shielded so that one cancelled request does not fail the others
+        # waiting for the same token
+        return list(await asyncio.shield(task))
+
+    async def _load(self, key: str, user_token: str) -> List[str]:
+        group_ids = await self._fetch_group_ids(user_token)
+        if group_ids is None:
+            return []
+
+        self._entries[key] = (group_ids, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return group_ids
+
+    async def _fetch_group_ids(self, user_token: str) -> Optional[List[str]]:
+        headers = {"Authorization": "bearer " + user_token}
+        group_ids = []
+        endpoint = self.endpoint
+        try:
+            while endpoint:
+                response = await self.http_client.get(endpoint, headers=headers)
+                if response.status_code != httpx.codes.OK:
+                    logging.error(f"Error fetching user groups: {response.status_code} {response.text}")
+                    return None
+
+                page = response.json()
+                group_ids.extend(obj["id"] for obj in page.get("value", []))
+                endpoint = page.get("@odata.nextLink")
+        except Exception as e:
+            logging.error(f"Exception in fetching user groups: {e}")
+            return None
+
+        return group_ids
+
+    def clear(self):
+        self._entries.clear()
+
+    def metrics(self) -> Dict[str, float]:
+        lookups = self.hits + self.shared + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "shared": self.shared,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.shared) / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,216 @@
+import asyncio
+import json
+import logging
+import time
+
+import httpx
+from openai import AsyncAzureOpenAI
+from azure.identity.aio import DefaultAzureCredential
+
+from backend.auth.graph_groups import GraphGroupResolver
+
+COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+USER_AGENT = "GitHubSampleWebApp/AsyncAzureOpenAI/1.0.0"
+
+
+class EntraTokenRefresher:
+    """Caches an Entra ID access token and refreshes it before it expires."""
+
+    def __init__(self, credential, scope: str = COGNITIVE_SERVICES_SCOPE, refresh_margin: float = 300):
+        self.credential = credential
+        self.scope = scope
+        self.refresh_margin = refresh_margin
+        self._token = None
+        self._lock = asyncio.Lock()
+        self._task = None
+
+    def _is_stale(self) -> bool:
+        return (
+            self._token is None or
+            self._token.expires_on - self.refresh_margin <= time.time()
+        )
+
+    async def refresh(self):
+        async with self._lock:
+            if self._is_stale():
+                self._token = await self.credential.get_token(self.scope)
+        return self._token
+
+    async def __call__(self) -> str:
+        # Used as the azure_ad_token_provider of AsyncAzureOpenAI
+        if self._is_stale():
+            await self.refresh()
+        return self._token.token
+
+    async def _refresh_loop(self):
+        while True:
+            try:
+                token = await self.refresh()
+                delay = max(token.expires_on - self.refresh_margin - time.time(), 30)
+            except Exception:
+                logging.exception("Exception while refreshing Azure Entra ID token")
+                delay = 30
+            await asyncio.sleep(delay)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class ClientRegistry:
+    """Clients that live for the whole app lifetime and are shared by every request of a worker.
+
+    Created in the app's before_serving hook and closed in after_serving so that
+    connection pools, TLS sessions and Entra ID tokens are reused across requests.
+    """
+
+    def __init__(self, settings, minimum_api_version: str = None):
+        self.settings = settings
+        self.minimum_api_version = minimum_api_version
+        self.http_client = None
+        self.credential = None
+        self.token_provider = None
+        self.azure_openai_client = None
+        self.graph_group_resolver = None
+        self.azure_openai_tools = []
+        self.azure_openai_available_tools = []
+        self.tool_call_semaphore = asyncio.Semaphore(
+            settings.azure_openai.function_call_azure_functions_max_concurrency
+        )
+        self._init_lock = asyncio.Lock()
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        aoai = self.settings.azure_openai
+        return httpx.AsyncClient(
+            http2=aoai.http2,
+            limits=httpx.Limits(
+                max_connections=aoai.max_connections,
+                max_keepalive_connections=aoai.max_keepalive_connections,
+                keepalive_expiry=aoai.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(aoai.request_timeout, connect=aoai.connect_timeout),
+        )
+
+    def _create_graph_group_resolver(self) -> GraphGroupResolver:
+        datasource = getattr(self.settings, "datasource", None)
+        if not getattr(datasource, "permitted_groups_column", None):
+            return None
+
+        return GraphGroupResolver(
+            self.http_client,
+            ttl=datasource.permitted_groups_cache_ttl,
+            max_entries=datasource.permitted_groups_cache_max_entries,
+        )
+
+    def _ensure_http_client(self):
+        if self.http_client is None:
+            self.http_client = self._create_http_client()
+            self.graph_group_resolver = self._create_graph_group_resolver()
+
+    async def start(self):
+        self._ensure_http_client()
+        try:
+            await self.get_azure_openai_client()
+        except Exception:
+            # Retried lazily on the next call to get_azure_openai_client
+            logging.exception("Exception in Azure OpenAI initialization")
+
+    async def _load_remote_tools(self):
+        aoai = self.settings.azure_openai
+        azure_functions_tools_url = f"{aoai.function_call_azure_functions_tools_base_url}?code={aoai.function_call_azure_functions_tools_key}"
+        response = await self.http_client.get(azure_functions_tools_url)
+        if response.status_code == httpx.codes.OK:
+            self.azure_openai_tools = json.loads(response.text)
+            self.azure_openai_available_tools = [
+                tool["function"]["name"] for tool in self.azure_openai_tools
+            ]
+        else:
+            logging.error(f"An error occurred while getting OpenAI Function Call tools metadata: {response.status_code}")
+
+    async def _init_azure_openai_client(self) -> AsyncAzureOpenAI:
+        aoai = self.settings.azure_openai
+
+        # API version check
+        if (
+            self.minimum_api_version and
+            aoai.preview_api_version < self.minimum_api_version
+        ):
+            raise ValueError(
+                f"The minimum supported Azure OpenAI preview API version is '{self.minimum_api_version}'"
+            )
+
+        # Endpoint
+        if not aoai.endpoint and not aoai.resource:
+            raise ValueError(
+                "AZURE_OPENAI_ENDPOINT or AZURE_OPENAI_RESOURCE is required"
+            )
+
+        endpoint = (
+            aoai.endpoint
+            if aoai.endpoint
+            else f"https://{aoai.resource}.openai.azure.com/"
+        )
+
+        # Deployment
+        if not aoai.model:
+            raise ValueError("AZURE_OPENAI_MODEL is required")
+
+        # Authentication
+        if not aoai.key and self.token_provider is None:
+            logging.debug("No AZURE_OPENAI_KEY found, using Azure Entra ID auth")
+            credential = DefaultAzureCredential()
+            token_provider = EntraTokenRefresher(credential)
+            try:
+                await token_provider.refresh()
+            except Exception:
+                await credential.close()
+                raise
+            token_provider.start()
+            self.credential = credential
+            self.token_provider = token_provider
+
+        # Remote function calls
+        if aoai.function_call_azure_functions_enabled:
+            await self._load_remote_tools()
+
+        return AsyncAzureOpenAI(
+            api_version=aoai.preview_api_version,
+            api_key=aoai.key,
+            azure_ad_token_provider=self.token_provider,
+            default_headers={"x-ms-useragent": USER_AGENT},
+            azure_endpoint=endpoint,
+            http_client=self.http_client,
+        )
+
+    async def get_azure_openai_client(self) -> AsyncAzureOpenAI:
+        if self.azure_openai_client is None:
+            async with self._init_lock:
+                if self.azure_openai_client is None:
+                    self._ensure_http_client()
+                    self.azure_openai_client = await self._init_azure_openai_client()
+
+        return self.azure_openai_client
+
+    async def close(self):
+        if self.token_provider:
+            await self.token_provider.close()
+            self.token_provider = None
+        if self.credential:
+            await self.credential.close()
+            self.credential = None
+        if self.graph_group_resolver:
+            logging.info(f"Graph group cache metrics: {self.graph_group_resolver.metrics()}")
+            self.graph_group_resolver = None
+        if self.http_client:
+            await self.http_client.aclose()
+            self.http_client = None
+        self.azure_openai_client = None
@@ -1,126 +1,402 @@
 from typing import List, Dict, Any
+import asyncio
 import logging
-from neo4j import GraphDatabase
+import re
+import time
+from neo4j import AsyncGraphDatabase, GraphDatabase, READ_ACCESS
+
+
+VECTOR_FIELD = "embedding"  # self.settings.vector_column
+CONTENT_FIELD = "content"  # self.settings.content_column
+TITLE_FIELD = "title"  # self.settings.title_column
+ID_FIELD = "chunk_id"  # self.settings.id_column
+
+SEMANTIC_SEARCH_QUERY = f"""
+    MATCH (c)
+    WHERE c.{VECTOR_FIELD} IS NOT NULL
+    AND ($kind IS NULL OR c.kind = $kind)
+    WITH c, vector.similarity.cosine(c.{VECTOR_FIELD}, $query_vector) AS score
+    ORDER BY score DESC
+    LIMIT $top_k
+    RETURN
+        c.{ID_FIELD} AS id,
+        c.{TITLE_FIELD} AS title,
+        c.{CONTENT_FIELD} AS content,
+        c.webUrl AS webUrl,
+        c.kind as kind,
+        score
+"""
+
+# Approximate nearest neighbour search through the HNSW vector index. The kind
+# filter can only be applied after the index lookup, so callers over-fetch
+# candidates when a kind is given.
+VECTOR_INDEX_SEARCH_QUERY = f"""
+    CALL db.index.vector.queryNodes($index_name, $candidates, $query_vector)
+    YIELD node AS c, score
+    WHERE $kind IS NULL OR c.kind = $kind
+    RETURN
+        c.{ID_FIELD} AS id,
+        c.{TITLE_FIELD} AS title,
+        c.{CONTENT_FIELD} AS content,
+        c.webUrl AS webUrl,
+        c.kind as kind,
+        score
+    ORDER BY score DESC
+    LIMIT $top_k
+"""
+
+# Batched variants answer several query vectors in one round-trip. Each row
+# carries the position of the query vector it belongs to. The top_k of each
+# query is taken inside its subquery, so only those rows get their content.
+_SEMANTIC_HITS_RETURN = f"""
+    RETURN
+        query_index,
+        c.{ID_FIELD} AS id,
+        c.{TITLE_FIELD} AS title,
+        c.{CONTENT_FIELD} AS content,
+        c.webUrl AS webUrl,
+        c.kind as kind,
+        score
+    ORDER BY query_index, score DESC
+"""
+
+SEMANTIC_SEARCH_MANY_QUERY = f"""
+    UNWIND range(0, size($query_vectors) - 1) AS query_index
+    CALL {{
+        WITH query_index
+        MATCH (c)
+        WHERE c.{VECTOR_FIELD} IS NOT NULL
+        AND ($kind IS NULL OR c.kind = $kind)
+        WITH c, vector.similarity.cosine(c.{VECTOR_FIELD}, $query_vectors[query_index]) AS score
+        ORDER BY score DESC
+        LIMIT $top_k
+        RETURN c, score
+    }}
+""" + _SEMANTIC_HITS_RETURN
+
+VECTOR_INDEX_SEARCH_MANY_QUERY = """
+    UNWIND range(0, size($query_vectors) - 1) AS query_index
+    CALL {
+        WITH query_index
+        CALL db.index.vector.queryNodes($index_name, $candidates, $query_vectors[query_index])
+        YIELD node AS c, score
+        WHERE $kind IS NULL OR c.kind = $kind
+        WITH c, score
+        ORDER BY score DESC
+        LIMIT $top_k
+        RETURN c, score
+    }
+""" + _SEMANTIC_HITS_RETURN
+
+SHOW_VECTOR_INDEX_QUERY = """
+    SHOW VECTOR INDEXES
+    YIELD name, state, labelsOrTypes, properties
+    WHERE name = $index_name
+    RETURN name, state, labelsOrTypes, properties
+"""
+
+CREATE_VECTOR_INDEX_QUERY = """
+    CREATE VECTOR INDEX `{index_name}` IF NOT EXISTS
+    FOR (c:`{label}`) ON (c.`{property}`)
+    OPTIONS {{indexConfig: {{
+        `vector.dimensions`: {dimensions},
+        `vector.similarity_function`: '{similarity_function}'
+    }}}}
+"""
+
+# Whether any node the vector index would cover has an embedding
+CHUNK_LABEL_QUERY = """
+    MATCH (c:`{label}`)
+    WHERE c.`{property}` IS NOT NULL
+    RETURN 1
+    LIMIT 1
+"""
+
+SEARCH_MODE_INDEX = "index"
+SEARCH_MODE_SCAN = "scan"
+
+# Seconds before a vector index check that failed with an error is tried again
+VECTOR_INDEX_RETRY_SECONDS = 60
+
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+KEYWORD_SEARCH_QUERY = f"""
+    MATCH (c)-[:HAS_KEYWORD]->(k:Keyword)
+    WHERE k.name IN $keywords
+    WITH c, collect(k.name) AS matched_keywords, count(k) AS keyword_count
+    RETURN c,
+        c.{ID_FIELD} AS id,
+        c.{TITLE_FIELD} AS title,
+        c.{CONTENT_FIELD} AS content,
+        c.webUrl AS webUrl,
+        c.kind as kind,
+        matched_keywords, keyword_count
+    ORDER BY keyword_count DESC
+    LIMIT $top_k
+"""
+
+
+def _check_identifier(value: str, name: str) -> str:
+    # Labels and index names cannot be query parameters, so only plain
+    # identifiers are accepted before they are formatted into Cypher
+    if not value or not _IDENTIFIER_PATTERN.match(value):
+        raise ValueError(f"Invalid Neo4j {name}: {value!r}")
+    return value
+
+
+def format_semantic_record(record) -> Dict[str, Any]:
+    # Format results to match expected output format
+    return {
+        "id": str(record["id"]),
+        "title": record["title"] or "",
+        "webUrl": record["webUrl"] or "",
+        "kind": record["kind"] or "",
+        "content": record["content"],
+        #"path": record["path"] or "",
+        "@search.score": float(record["score"]),
+        "source": "neo4j"
+    }
+
+
+def format_keyword_record(record) -> Dict[str, Any]:
+    return {
+        "id": str(record["id"]),
+        "title": record["title"] or "",
+        "webUrl": record["webUrl"] or "",
+        "kind": record["kind"] or "",
+        "content": record["content"],
+        "matched_keywords": record["matched_keywords"],
+        "@search.score": float(record["keyword_count"]),
+        "source": "neo4j"
+    }
 
 
 # Implement as standalone class instead of inheriting from BaseDatasource
 class Neo4jDatasource:
     """Neo4j implementation for RAG retrieval."""
-    
+
     def __init__(self, settings):
         """Initialize with application settings."""
         # No inheritance, no super() call
         self.settings = settings.neo4j
         self.driver = GraphDatabase.driver(
-            self.settings.uri, 
+            self.settings.uri,
             auth=(self.settings.username, self.settings.password),
             database=self.settings.database
         )
         logging.info(f"Neo4j datasource initialized with URI: {self.settings.uri}, database: {self.settings.database}")
-        
+
     def close(self):
         """Close the Neo4j driver connection."""
         if hasattr(self, 'driver') and self.driver:
             self.driver.close()
-            
+
     def __del__(self):
         """Ensure driver is closed when object is deleted."""
         self.close()
 
-    
+
     def semantic_search(self, query_vector: List[float], top_k: int, kind: str) -> List[Dict[str, Any]]:
         """Semantic search using Neo4j vector search."""
         try:
             with self.driver.session(database=self.settings.database) as session:
                 # Execute semantic search query
-                vector_field = "embedding"#self.settings.vector_column
-                content_field = "content" #self.settings.content_column
-                title_field = "title" #self.settings.title_column
-                id_field = "chunk_id" #self.settings.id_column
-                
-                if kind is not None:
-                    kind_query = f"AND c.kind = '{kind}'"
-                else :
-                    kind_query = ""
-
-                result = session.run(f"""
-                    MATCH (c)
-                    WHERE c.{vector_field} IS NOT NULL
-                    {kind_query}
-                    WITH c, vector.similarity.cosine(c.{vector_field}, $query_vector) AS score
-                    ORDER BY score DESC
-                    LIMIT $top_k
-                    RETURN 
-                        c.{id_field} AS id, 
-                        c.{title_field} AS title, 
-                        c.{content_field} AS content, 
-                        c.webUrl AS webUrl,
-                        c.kind as kind,
-                        score
-                """, query_vector=query_vector, top_k=top_k)
-
-
-                # Format results to match expected output format
-                results = []
-                for record in result:
-                    results.append({
-                        "id": str(record["id"]),
-                        "title": record["title"] or "",
-                        "webUrl": record["webUrl"] or "",
-                        "kind": record["kind"] or "",
-                        "content": record["content"],
-                        #"path": record["path"] or "",
-                        "@search.score": float(record["score"]),
-                        "source": "neo4j"
-                    })
-                
-                return results
-                
+                result = session.run(
+                    SEMANTIC_SEARCH_QUERY, query_vector=query_vector, top_k=top_k, kind=kind
+                )
+                return [format_semantic_record(record) for record in result]
+
         except Exception as e:
             logging.exception(f"Error during Neo4j semantic search: {str(e)}")
             return []
-        
+
     def keyword_search(self, keywords: List[str], top_k: int) -> List[Dict[str, Any]]:
         """Keyword search using Neo4j vector search."""
         try:
             with self.driver.session(database=self.settings.database) as session:
-                
-                content_field = "content" 
-                title_field = "title" 
-                id_field = "chunk_id" 
-            
-                result = session.run(f"""
-                    MATCH (c)-[:HAS_KEYWORD]->(k:Keyword)
-                    WHERE k.name IN $keywords
-                    WITH c, collect(k.name) AS matched_keywords, count(k) AS keyword_count
-                    RETURN c,
-                        c.{id_field} AS id, 
-                        c.{title_field} AS title, 
-                        c.{content_field} AS content, 
-                        c.webUrl AS webUrl,
-                        c.kind as kind,
-                        matched_keywords, keyword_count
-                    ORDER BY keyword_count DESC
-                    LIMIT $top_k
-                """, keywords=keywords, top_k=top_k)
-                
-              
-                # Format results to match expected output format
-                results = []
-                for record in result:
-                    results.append({
-                        "id": str(record["id"]),
-                        "title": record["title"] or "",
-                        "webUrl": record["webUrl"] or "",
-                        "kind": record["kind"] or "",
-                        "content": record["content"],
-                        "matched_keywords": record["matched_keywords"],
-                        "@search.score": float(record["keyword_count"]),
-                        "source": "neo4j"
-                    })
-                
-                return results
-                
+                result = session.run(KEYWORD_SEARCH_QUERY, keywords=keywords, top_k=top_k)
+                return [format_keyword_record(record) for record in result]
+
         except Exception as e:
             logging.exception(f"Error during Neo4j keyword search: {str(e)}")
-            return []
\ No newline at end of file
+            return []
+
+
+class AsyncNeo4jDatasource:
+    """Neo4j implementation for RAG retrieval on the asyncio event loop.
+
+    The driver and its connection pool live as long as the datasource, so it
+    should be created once per worker and closed on shutdown.
+    """
+
+    def __init__(self, settings):
+        """Initialize with application settings."""
+        self.settings = settings.neo4j
+        self.search_mode = getattr(self.settings, "search_mode", SEARCH_MODE_SCAN)
+        if self.search_mode not in (SEARCH_MODE_INDEX, SEARCH_MODE_SCAN):
+            raise ValueError(f"Invalid Neo4j search mode: {self.search_mode!r}")
+        if self.search_mode == SEARCH_MODE_INDEX:
+            _check_identifier(self.settings.vector_index_name, "vector index name")
+            _check_identifier(self.settings.chunk_label, "chunk label")
+            if self.settings.vector_similarity_function not in ("cosine", "euclidean"):
+                raise ValueError(f"Invalid Neo4j vector similarity function: {self.settings.vector_similarity_function!r}")
+        self._vector_index_ready = None
+        self._vector_index_retry_at = 0.0
+        self._vector_index_lock = asyncio.Lock()
+        self.driver = AsyncGraphDatabase.driver(
+            self.settings.uri,
+            auth=(self.settings.username, self.settings.password),
+            max_connection_pool_size=self.settings.max_connection_pool_size,
+            connection_acquisition_timeout=self.settings.connection_acquisition_timeout,
+            liveness_check_timeout=self.settings.liveness_check_timeout,
+        )
+        logging.info(f"Async Neo4j datasource initialized with URI: {self.settings.uri}, database: {self.settings.database}, search mode: {self.search_mode}")
+
+    async def close(self):
+        """Close the Neo4j driver and its connection pool."""
+        if self.driver:
+            await self.driver.close()
+            self.driver = None
+
+    async def _run(self, query: str, **parameters) -> list:
+        async with self.driver.session(
+            database=self.settings.database,
+            default_access_mode=READ_ACCESS
+        ) as session:
+            result = await session.run(query, **parameters)
+            return [record async for record in result]
+
+    async def ensure_vector_index(self) -> bool:
+        """Verify the vector index exists, creating it if allowed.
+
+        Returns whether semantic search can use the index. A definite answer
+        is remembered, so the check only runs once per datasource; after an
+        error, e.g. Neo4j restarting, searches scan until the check is retried
+        VECTOR_INDEX_RETRY_SECONDS later.
+        """
+        if self._vector_index_ready is not None:
+            return self._vector_index_ready
+        if time.monotonic() < self._vector_index_retry_at:
+            return False
+
+        async with self._vector_index_lock:
+            if self._vector_index_ready is None and time.monotonic() >= self._vector_index_retry_at:
+                try:
+                    self._vector_index_ready = await self._check_vector_index()
+                except Exception as e:
+                    logging.exception(f"Error verifying Neo4j vector index: {str(e)}")
+                    self._vector_index_retry_at = time.monotonic() + VECTOR_INDEX_RETRY_SECONDS
+
+                if not self._vector_index_ready:
+                    logging.warning(
+                        f"Neo4j vector index {self.settings.vector_index_name} is unavailable, "
+                        "falling back to a full scan for semantic search"
+                    )
+
+        return bool(self._vector_index_ready)
+
+    async def _check_vector_index(self) -> bool:
+        index_name = self.settings.vector_index_name
+        label = self.settings.chunk_label
+        # An index on a label nothing writes is empty, a scan still finds the embedded nodes
+        if not await self._run(CHUNK_LABEL_QUERY.format(label=label, property=VECTOR_FIELD)):
+            logging.warning(
+                f"No :{label} nodes have a {VECTOR_FIELD} property, not using Neo4j vector index {index_name}; "
+                "set NEO4J_CHUNK_LABEL to the label of the embedded nodes"
+            )
+            return False
+
+        indexes = await self._run(SHOW_VECTOR_INDEX_QUERY, index_name=index_name)
+
+        if not indexes and self.settings.create_vector_index:
+            logging.info(f"Creating Neo4j vector index {index_name} on :{self.settings.chunk_label}({VECTOR_FIELD})")
+            async with self.driver.session(database=self.settings.database) as session:
+                result = await session.run(CREATE_VECTOR_INDEX_QUERY.format(
+                    index_name=index_name,
+                    label=self.settings.chunk_label,
+                    property=VECTOR_FIELD,
+                    dimensions=int(self.settings.vector_dimensions),
+                    similarity_function=self.settings.vector_similarity_function
+                ))
+                await result.consume()
+            indexes = await self._run(SHOW_VECTOR_INDEX_QUERY, index_name=index_name)
+
+        if not indexes:
+            return False
+
+        index = indexes[0]
+        if self.settings.chunk_label not in index["labelsOrTypes"] or VECTOR_FIELD not in index["properties"]:
+            logging.warning(
+                f"Neo4j vector index {index_name} covers {index['labelsOrTypes']}{index['properties']}, "
+                f"expected :{self.settings.chunk_label}({VECTOR_FIELD})"
+            )
+            return False
+
+        # A POPULATING index still answers queries, only FAILED is unusable
+        return index["state"] != "FAILED"
+
+    async def semantic_search(self, query_vector: List[float], top_k: int, kind: str) -> List[Dict[str, Any]]:
+        """Semantic search using the Neo4j vector index, or a full scan as fallback."""
+        try:
+            if self.search_mode == SEARCH_MODE_INDEX and await self.ensure_vector_index():
+                candidates = top_k * self.settings.vector_overfetch if kind else top_k
+                records = await self._run(
+                    VECTOR_INDEX_SEARCH_QUERY,
+                    index_name=self.settings.vector_index_name,
+                    candidates=candidates,
+                    query_vector=query_vector,
+                    top_k=top_k,
+                    kind=kind
+                )
+            else:
+                records = await self._run(
+                    SEMANTIC_SEARCH_QUERY, query_vector=query_vector, top_k=top_k, kind=kind
+                )
+            return [format_semantic_record(record) for record in records]
+
+        except Exception as e:
+            logging.exception(f"Error during Neo4j semantic search: {str(e)}")
+            return []
+
+    async def semantic_search_many(self, query_vectors: List[List[float]], top_k: int, kind: str) -> List[List[Dict[str, Any]]]:
+        """Semantic search for several query vectors in a single Cypher query.
+
+        Returns one result list per query vector, in the order given.
+        """
+        results = [[] for _ in query_vectors]
+        if not query_vectors:
+            return results
+
+        try:
+            if self.search_mode == SEARCH_MODE_INDEX and await self.ensure_vector_index():
+                candidates = top_k * self.settings.vector_overfetch if kind else top_k
+                records = await self._run(
+                    VECTOR_INDEX_SEARCH_MANY_QUERY,
+                    index_name=self.settings.vector_index_name,
+                    candidates=candidates,
+                    query_vectors=query_vectors,
+                    top_k=top_k,
+                    kind=kind
+                )
+            else:
+                records = await self._run(
+                    SEMANTIC_SEARCH_MANY_QUERY, query_vectors=query_vectors, top_k=top_k, kind=kind
+                )
+
+            for record in records:
+                results[record["query_index"]].append(format_semantic_record(record))
+            return results
+
+        except Exception as e:
+            logging.exception(f"Error during Neo4j batched semantic search: {str(e)}")
+            return results
+
+    async def keyword_search(self, keywords: List[str], top_k: int) -> List[Dict[str, Any]]:
+        """Keyword search using Neo4j keyword relationships."""
+        try:
+            records = await self._run(KEYWORD_SEARCH_QUERY, keywords=keywords, top_k=top_k)
+            return [format_keyword_record(record) for record in records]
+
+        except Exception as e:
+            logging.exception(f"Error during Neo4j keyword search: {str(e)}")
+            return []
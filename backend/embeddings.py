@@ -0,0 +1,241 @@
+import asyncio
+import logging
+import os
+import unicodedata
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from openai import AsyncAzureOpenAI
+from azure.identity.aio import DefaultAzureCredential
+
+from backend.clients import EntraTokenRefresher, USER_AGENT
+
+
+def normalize_text(text: str) -> str:
+    # Whitespace differences do not change the meaning of a query, case does
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """LRU cache of embedding vectors bounded by an approximate byte budget.
+
+    Vectors are stored as float32 arrays, which take a fraction of the memory
+    of a list of Python floats.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: "OrderedDict[Tuple[str, str], array]" = OrderedDict()
+
+    @staticmethod
+    def _entry_size(key: Tuple[str, str], vector: array) -> int:
+        return len(key[0]) + len(key[1]) + vector.itemsize * len(vector)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple[str, str]) -> Optional[List[float]]:
+        vector = self._entries.get(key)
+        if vector is None:
+            return None
+        self._entries.move_to_end(key)
+        return vector.tolist()
+
+    def put(self, key: Tuple[str, str], embedding: List[float]):
+        vector = array("f", embedding)
+        size = self._entry_size(key, vector)
+        if size > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.current_bytes -= self._entry_size(key, previous)
+
+        self._entries[key] = vector
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            old_key, old_vector = self._entries.popitem(last=False)
+            self.current_bytes -= self._entry_size(old_key, old_vector)
+
+
+@dataclass
+class EmbeddingMetrics:
+    requested: int = 0
+    cache_hits: int = 0
+    batches: int = 0
+    batched_inputs: int = 0
+    max_batch_size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.cache_hits / self.requested if self.requested else 0.0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.batched_inputs / self.batches if self.batches else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        return dict(asdict(self), hit_rate=self.hit_rate, mean_batch_size=self.mean_batch_size)
+
+
+class EmbeddingService:
+    """Async embeddings with micro-batching and an LRU cache, shared per worker.
+
+    Concurrent callers that ask for embeddings within batch_window seconds of
+    each other are served by a single embeddings request, and identical texts
+    that are already cached or in flight are not sent again.
+    """
+
+    def __init__(
+        self,
+        client: AsyncAzureOpenAI,
+        deployment: str,
+        max_batch_size: int = 16,
+        batch_window: float = 0.005,
+        cache_max_bytes: int = 64 * 1024 * 1024
+    ):
+        self.client = client
+        self.deployment = deployment
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.cache = EmbeddingCache(cache_max_bytes)
+        self.metrics = EmbeddingMetrics()
+        self._pending: List[Tuple[Tuple[str, str], str]] = []
+        self._in_flight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._flush_handle = None
+        self._batch_tasks = set()
+        self._owned_resources = []
+
+    @classmethod
+    def from_env(cls):
+        endpoint = os.environ.get("AZURE_OPENAI_EMBEDDING_ENDPOINT")
+        key = os.environ.get("AZURE_OPENAI_EMBEDDING_KEY")
+
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=int(os.environ.get("EMBEDDING_MAX_CONNECTIONS", 20)),
+                max_keepalive_connections=int(os.environ.get("EMBEDDING_MAX_CONNECTIONS", 20)),
+            ),
+            timeout=httpx.Timeout(float(os.environ.get("EMBEDDING_REQUEST_TIMEOUT", 30)), connect=5.0),
+        )
+
+        token_provider = None
+        credential = None
+        if not key:
+            logging.debug("No AZURE_OPENAI_EMBEDDING_KEY found, using Azure Entra ID auth")
+            credential = DefaultAzureCredential()
+            token_provider = EntraTokenRefresher(credential)
+
+        client = AsyncAzureOpenAI(
+            api_version=os.environ.get("AZURE_OPENAI_PREVIEW_API_VERSION"),
+            api_key=key,
+            azure_ad_token_provider=token_provider,
+            default_headers={"x-ms-useragent": USER_AGENT},
+            azure_endpoint=endpoint,
+            http_client=http_client,
+        )
+
+        service = cls(
+            client,
+            deployment=os.environ.get("AZURE_OPENAI_EMBEDDING_NAME"),
+            max_batch_size=int(os.environ.get("EMBEDDING_MAX_BATCH_SIZE", 16)),
+            batch_window=float(os.environ.get("EMBEDDING_BATCH_WINDOW_MS", 5)) / 1000,
+            cache_max_bytes=int(os.environ.get("EMBEDDING_CACHE_MAX_BYTES", 64 * 1024 * 1024)),
+        )
+        service._owned_resources = [r for r in (token_provider, credential) if r] + [client]
+        return service
+
+    def _key(self, text: str) -> Tuple[str, str]:
+        return (self.deployment, normalize_text(text))
+
+    async def embed(self, text: str) -> List[float]:
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, returning one vector per text in the order given."""
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        waiting = []
+        self.metrics.requested += len(texts)
+
+        for i, text in enumerate(texts):
+            key = self._key(text)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.metrics.cache_hits += 1
+                results[i] = cached
+                continue
+
+            future = self._in_flight.get(key)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._in_flight[key] = future
+                self._pending.append((key, key[1]))
+            waiting.append((i, future))
+
+        if waiting:
+            self._schedule_flush()
+            # Several callers may share a future, shield it so one cancelled
+            # caller does not fail the others
+            for i, future in waiting:
+                results[i] = list(await asyncio.shield(future))
+
+        return results
+
+    def _schedule_flush(self):
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.batch_window, self._flush)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        while self._pending:
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+            task = asyncio.create_task(self._embed_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _embed_batch(self, batch: List[Tuple[Tuple[str, str], str]]):
+        self.metrics.batches += 1
+        self.metrics.batched_inputs += len(batch)
+        self.metrics.max_batch_size = max(self.metrics.max_batch_size, len(batch))
+
+        try:
+            response = await self.client.embeddings.create(
+                input=[text for _, text in batch],
+                model=self.deployment
+            )
+            data = sorted(response.data, key=lambda item: item.index)
+            if len(data) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, received {len(data)}")
+        except Exception as e:
+            for key, _ in batch:
+                future = self._in_flight.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (key, _), item in zip(batch, data):
+            self.cache.put(key, item.embedding)
+            future = self._in_flight.pop(key)
+            if not future.done():
+                future.set_result(item.embedding)
+
+    async def close(self):
+        logging.info(f"Embedding service metrics: {self.metrics.snapshot()}")
+        # Send anything still waiting for the batch window instead of leaving
+        # callers hanging
+        self._flush()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        for resource in self._owned_resources:
+            await resource.close()
+        self._owned_resources = []
@@ -1,16 +1,66 @@
+import os
+import json
 import uuid
+import asyncio
 from datetime import datetime
 from azure.cosmos.aio import CosmosClient
 from azure.cosmos import exceptions
+
+## a transactional batch holds at most 100 operations
+DELETE_BATCH_SIZE = 100
+
+## recommended indexing policy of the conversations container: only the fields the queries filter and
+## sort on are indexed, message content is not, plus the composite indexes of the two sorted queries
+with open(os.path.join(os.path.dirname(__file__), "indexing_policy.json")) as f:
+    HISTORY_INDEXING_POLICY = json.load(f)
+
+
+def _is_path_indexed(indexing_policy, field):
+    paths = {f"/{field}/?", f"/{field}/*"}
+    included = {path['path'] for path in indexing_policy.get('includedPaths', [])}
+    excluded = {path['path'] for path in indexing_policy.get('excludedPaths', [])}
+    return bool(included & (paths | {"/*"})) and not excluded & paths
+
+
+def _has_composite_index(indexing_policy, composite_index):
+    wanted = [(path['path'], path.get('order', 'ascending')) for path in composite_index]
+    ## a composite index also serves the query sorted in exactly the opposite direction
+    reverse = {'ascending': 'descending', 'descending': 'ascending'}
+    reversed_wanted = [(path, reverse[order]) for path, order in wanted]
+    for index in indexing_policy.get('compositeIndexes', []):
+        existing = [(path['path'], path.get('order', 'ascending')) for path in index]
+        if existing in (wanted, reversed_wanted):
+            return True
+    return False
+
+
+def check_indexing_policy(indexing_policy):
+    ## what the container's indexing policy lacks compared to HISTORY_INDEXING_POLICY
+    issues = []
+    if indexing_policy.get('indexingMode', 'consistent') != 'consistent':
+        issues.append(f"Indexing mode is {indexing_policy.get('indexingMode')}, queries need consistent indexing")
+    for path in HISTORY_INDEXING_POLICY['includedPaths']:
+        field = path['path'].strip('/?')
+        if not _is_path_indexed(indexing_policy, field):
+            issues.append(f"{field} is not indexed")
+    for composite_index in HISTORY_INDEXING_POLICY['compositeIndexes']:
+        if not _has_composite_index(indexing_policy, composite_index):
+            fields = ", ".join(f"{path['path']} {path['order']}" for path in composite_index)
+            issues.append(f"Missing composite index ({fields})")
+    return issues
   
 class CosmosConversationClient():
     
-    def __init__(self, cosmosdb_endpoint: str, credential: any, database_name: str, container_name: str, enable_message_feedback: bool = False):
+    def __init__(self, cosmosdb_endpoint: str, credential: any, database_name: str, container_name: str, enable_message_feedback: bool = False, delete_max_concurrency: int = 4):
         self.cosmosdb_endpoint = cosmosdb_endpoint
         self.credential = credential
         self.database_name = database_name
         self.container_name = container_name
         self.enable_message_feedback = enable_message_feedback
+        self.delete_max_concurrency = delete_max_concurrency
+        ## set by verify_indexing_policy, queries sort on the composite indexes only once they are known to exist
+        self.indexing_policy_issues = None
+        self.composite_indexes = False
         try:
             self.cosmosdb_client = CosmosClient(self.cosmosdb_endpoint, credential=credential)
         except exceptions.CosmosHttpResponseError as e:
@@ -42,9 +92,19 @@ class CosmosConversationClient():
             container_info = await self.container_client.read()
         except:
             return False, f"CosmosDB container {self.container_name} not found"
-            
+
+        self._set_indexing_policy(container_info)
         return True, "CosmosDB client initialized successfully"
 
+    def _set_indexing_policy(self, container_info):
+        self.indexing_policy_issues = check_indexing_policy(container_info.get('indexingPolicy', {}))
+        self.composite_indexes = not any(issue.startswith("Missing composite index") for issue in self.indexing_policy_issues)
+
+    async def verify_indexing_policy(self):
+        container_info = await self.container_client.read()
+        self._set_indexing_policy(container_info)
+        return self.indexing_policy_issues
+
     async def create_conversation(self, user_id, title = ''):
         conversation = {
             'id': str(uuid.uuid4()),  
@@ -77,16 +137,63 @@ class CosmosConversationClient():
             return True
 
         
-    async def delete_messages(self, conversation_id, user_id):
-        ## get a list of all the messages in the conversation
-        messages = await self.get_messages(user_id, conversation_id)
-        response_list = []
-        if messages:
-            for message in messages:
-                resp = await self.container_client.delete_item(item=message['id'], partition_key=user_id)
-                response_list.append(resp)
-            return response_list
+    async def delete_items(self, user_id, item_ids, on_progress=None):
+        ## delete documents of one user in transactional batches, several batches at a time
+        semaphore = asyncio.Semaphore(self.delete_max_concurrency)
+
+        async def delete_batch(batch):
+            async with semaphore:
+                try:
+                    await self.container_client.execute_item_batch(
+                        batch_operations=[("delete", (item_id,)) for item_id in batch],
+                        partition_key=user_id
+                    )
+                except exceptions.CosmosBatchOperationError as e:
+                    if e.status_code != 404:
+                        raise
+                    ## some of the documents are already gone, delete the others one by one
+                    for item_id in batch:
+                        try:
+                            await self.container_client.delete_item(item=item_id, partition_key=user_id)
+                        except exceptions.CosmosResourceNotFoundError:
+                            pass
+            if on_progress:
+                await on_progress(len(batch))
+
+        await asyncio.gather(*(
+            delete_batch(item_ids[i:i + DELETE_BATCH_SIZE])
+            for i in range(0, len(item_ids), DELETE_BATCH_SIZE)
+        ))
+        return item_ids
 
+    async def delete_history_items(self, user_id, message_ids, conversation_ids, on_progress=None):
+        ## messages first, so a failed deletion never leaves messages without their conversation
+        await self.delete_items(user_id, message_ids, on_progress)
+        await self.delete_items(user_id, conversation_ids, on_progress)
+
+    async def get_message_ids(self, user_id, conversation_id=None):
+        parameters = [
+            {
+                'name': '@userId',
+                'value': user_id
+            }
+        ]
+        query = "SELECT c.id FROM c WHERE c.type='message' AND c.userId = @userId"
+        if conversation_id:
+            parameters.append({'name': '@conversationId', 'value': conversation_id})
+            query += " AND c.conversationId = @conversationId"
+
+        return [item['id'] async for item in self.container_client.query_items(query=query, parameters=parameters)]
+
+    async def get_conversation_ids(self, user_id):
+        parameters = [
+            {
+                'name': '@userId',
+                'value': user_id
+            }
+        ]
+        query = "SELECT c.id FROM c WHERE c.type='conversation' AND c.userId = @userId"
+        return [item['id'] async for item in self.container_client.query_items(query=query, parameters=parameters)]
 
     async def get_conversations(self, user_id, limit, sort_order = 'DESC', offset = 0):
         parameters = [
@@ -105,27 +212,59 @@ class CosmosConversationClient():
         
         return conversations
 
-    async def get_conversation(self, user_id, conversation_id):
+    def _conversation_order(self, sort_order):
+        if self.composite_indexes:
+            ## matches the (type, updatedAt) composite index, or its reverse
+            return f"c.type {'ASC' if sort_order == 'DESC' else 'DESC'}, c.updatedAt {sort_order}"
+        return f"c.updatedAt {sort_order}"
+
+    async def get_conversations_page(self, user_id, limit, continuation_token=None, sort_order = 'DESC'):
+        ## one page of the conversation list and the token of the next one, or None after the last page.
+        ## unlike OFFSET, a continuation token costs the same however deep the page is
         parameters = [
-            {
-                'name': '@conversationId',
-                'value': conversation_id
-            },
             {
                 'name': '@userId',
                 'value': user_id
             }
         ]
-        query = f"SELECT * FROM c where c.id = @conversationId and c.type='conversation' and c.userId = @userId"
+        query = f"SELECT c.id, c.title, c.updatedAt FROM c WHERE c.userId = @userId AND c.type='conversation' ORDER BY {self._conversation_order(sort_order)}"
+        pages = self.container_client.query_items(
+            query=query,
+            parameters=parameters,
+            partition_key=user_id,
+            max_item_count=limit
+        ).by_page(continuation_token)
+
         conversations = []
-        async for item in self.container_client.query_items(query=query, parameters=parameters):
-            conversations.append(item)
+        async for page in pages:
+            async for item in page:
+                conversations.append(item)
+            break
+
+        return conversations, pages.continuation_token
+
+    async def get_conversation(self, user_id, conversation_id):
+        ## point read, the user id is the partition key
+        try:
+            conversation = await self.container_client.read_item(item=conversation_id, partition_key=user_id)
+        except exceptions.CosmosResourceNotFoundError:
+            return None
 
-        ## if no conversations are found, return None
-        if len(conversations) == 0:
+        if conversation.get('type') != 'conversation':
+            return None
+        return conversation
+
+    async def rename_conversation(self, user_id, conversation_id, title):
+        ## only the title changes, patch it instead of replacing the whole document
+        try:
+            return await self.container_client.patch_item(
+                item=conversation_id,
+                partition_key=user_id,
+                patch_operations=[{'op': 'set', 'path': '/title', 'value': title}],
+                filter_predicate="from c where c.type = 'conversation'"
+            )
+        except (exceptions.CosmosResourceNotFoundError, exceptions.CosmosAccessConditionFailedError):
             return None
-        else:
-            return conversations[0]
  
     async def create_message(self, uuid, conversation_id, user_id, input_message: dict):
         message = {
@@ -142,17 +281,28 @@ class CosmosConversationClient():
         if self.enable_message_feedback:
             message['feedback'] = ''
         
-        resp = await self.container_client.upsert_item(message)  
-        if resp:
-            ## update the parent conversations's updatedAt field with the current message's createdAt datetime value
-            conversation = await self.get_conversation(user_id, conversation_id)
-            if not conversation:
+        ## write the message and bump the parent conversation's updatedAt field in one
+        ## transactional batch, both documents live in the user's partition
+        batch_operations = [
+            ("upsert", (message,)),
+            (
+                "patch",
+                (conversation_id, [{'op': 'set', 'path': '/updatedAt', 'value': message['createdAt']}]),
+                {'filter_predicate': "from c where c.type = 'conversation'"}
+            ),
+        ]
+        try:
+            results = await self.container_client.execute_item_batch(
+                batch_operations=batch_operations,
+                partition_key=user_id
+            )
+        except exceptions.CosmosBatchOperationError as e:
+            ## the message is not written either when the conversation is missing
+            if e.error_index == 1 and e.status_code in (404, 412):
                 return "Conversation not found"
-            conversation['updatedAt'] = message['createdAt']
-            await self.upsert_conversation(conversation)
-            return resp
-        else:
-            return False
+            raise
+
+        return results[0].get('resourceBody') or False
     
     async def update_message_feedback(self, user_id, message_id, feedback):
         message = await self.container_client.read_item(item=message_id, partition_key=user_id)
@@ -164,6 +314,7 @@ class CosmosConversationClient():
             return False
 
     async def get_messages(self, user_id, conversation_id):
+        ## only the fields /history/read returns, tool context payloads are left out
         parameters = [
             {
                 'name': '@conversationId',
@@ -174,9 +325,10 @@ class CosmosConversationClient():
                 'value': user_id
             }
         ]
-        query = f"SELECT * FROM c WHERE c.conversationId = @conversationId AND c.type='message' AND c.userId = @userId ORDER BY c.timestamp ASC"
+        order_by = "c.conversationId ASC, c.createdAt ASC" if self.composite_indexes else "c.createdAt ASC"
+        query = f"SELECT c.id, c.role, c.content, c.createdAt, c.feedback FROM c WHERE c.conversationId = @conversationId AND c.type='message' AND c.userId = @userId ORDER BY {order_by}"
         messages = []
-        async for item in self.container_client.query_items(query=query, parameters=parameters):
+        async for item in self.container_client.query_items(query=query, parameters=parameters, partition_key=user_id):
             messages.append(item)
 
         return messages
@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+
+from azure.cosmos import exceptions
+
+# Status documents are removed by Cosmos DB after a day when the container has
+# time to live enabled, i.e. a defaultTtl of -1 as set by the deployment templates
+JOB_TTL_SECONDS = 24 * 60 * 60
+
+# A running job reports progress after every batch, one that stopped updating
+# for this long lost its worker, e.g. to a restart
+JOB_STALE_SECONDS = 10 * 60
+
+
+class HistoryDeleteJobs:
+    """Chat history deletions that run in the background of a worker.
+
+    The status of each job is kept in a 'delete_job' document in the user's
+    partition, next to the history being deleted, so any worker can report it.
+    """
+
+    def __init__(self, cosmos_conversation_client):
+        self.cosmos_conversation_client = cosmos_conversation_client
+        self._tasks = set()
+
+    @property
+    def container_client(self):
+        return self.cosmos_conversation_client.container_client
+
+    async def start(self, user_id, message_ids, conversation_ids):
+        job = {
+            'id': str(uuid.uuid4()),
+            'type': 'delete_job',
+            'userId': user_id,
+            'status': 'running',
+            'total': len(message_ids) + len(conversation_ids),
+            'deleted': 0,
+            'error': None,
+            'createdAt': datetime.utcnow().isoformat(),
+            'updatedAt': datetime.utcnow().isoformat(),
+            'ttl': JOB_TTL_SECONDS
+        }
+        await self.container_client.upsert_item(job)
+
+        task = asyncio.create_task(self._run(job, message_ids, conversation_ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _update(self, job, patch_operations):
+        patch_operations.append({'op': 'set', 'path': '/updatedAt', 'value': datetime.utcnow().isoformat()})
+        await self.container_client.patch_item(
+            item=job['id'],
+            partition_key=job['userId'],
+            patch_operations=patch_operations
+        )
+
+    async def _run(self, job, message_ids, conversation_ids):
+        async def on_progress(count):
+            await self._update(job, [{'op': 'incr', 'path': '/deleted', 'value': count}])
+
+        try:
+            await self.cosmos_conversation_client.delete_history_items(
+                job['userId'], message_ids, conversation_ids, on_progress
+            )
+            await self._update(job, [{'op': 'set', 'path': '/status', 'value': 'succeeded'}])
+        except asyncio.CancelledError:
+            await self._fail(job, "The deletion was interrupted")
+            raise
+        except Exception as e:
+            logging.exception(f"Exception in chat history delete job {job['id']}")
+            await self._fail(job, str(e))
+
+    async def _fail(self, job, error):
+        try:
+            await self._update(job, [
+                {'op': 'set', 'path': '/status', 'value': 'failed'},
+                {'op': 'set', 'path': '/error', 'value': error}
+            ])
+        except Exception:
+            logging.exception(f"Exception while updating chat history delete job {job['id']}")
+
+    async def get(self, user_id, job_id):
+        try:
+            job = await self.container_client.read_item(item=job_id, partition_key=user_id)
+        except exceptions.CosmosResourceNotFoundError:
+            return None
+
+        if job.get('type') != 'delete_job':
+            return None
+
+        stale_before = datetime.utcnow() - timedelta(seconds=JOB_STALE_SECONDS)
+        if job['status'] == 'running' and datetime.fromisoformat(job['updatedAt']) < stale_before:
+            job['status'] = 'failed'
+            job['error'] = "The deletion stopped before it finished"
+        return job
+
+    async def close(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import zlib
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+class HistoryWriteBehind:
+    """Runs chat history writes in the background so requests don't wait on them.
+
+    Writes for the same conversation always go to the same worker, so they are
+    applied in the order they were submitted. Each worker queue holds at most
+    max_pending writes; beyond that, submit waits for room instead of letting
+    writes pile up in memory.
+
+    The queues belong to one process, so only requests served by the same
+    worker can wait for a conversation's pending writes.
+    """
+
+    def __init__(self, workers: int = 4, max_pending: int = 1000):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.failed = 0
+        self._queues: List[asyncio.Queue] = []
+        self._tasks: List[asyncio.Task] = []
+        # Last write submitted for each conversation that is not done yet
+        self._last_writes: Dict[str, asyncio.Future] = {}
+
+    def start(self):
+        if self._tasks:
+            return
+        self._queues = [asyncio.Queue(maxsize=self.max_pending) for _ in range(self.workers)]
+        self._tasks = [asyncio.create_task(self._run(queue)) for queue in self._queues]
+
+    def _queue_for(self, conversation_id: str) -> asyncio.Queue:
+        return self._queues[zlib.crc32(conversation_id.encode()) % len(self._queues)]
+
+    async def submit(self, conversation_id: str, write: Callable[[], Awaitable]) -> asyncio.Future:
+        """Queue a write, returning a future that is done once it has been applied."""
+        future = asyncio.get_running_loop().create_future()
+        self._last_writes[conversation_id] = future
+        await self._queue_for(conversation_id).put((conversation_id, write, future))
+        return future
+
+    async def _run(self, queue: asyncio.Queue):
+        while True:
+            conversation_id, write, future = await queue.get()
+            try:
+                result = await write()
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                self.failed += 1
+                logging.exception(f"Exception in chat history write for conversation {conversation_id}")
+                if not future.done():
+                    future.set_exception(e)
+                # Already logged, mark the error as retrieved
+                future.exception()
+            finally:
+                if self._last_writes.get(conversation_id) is future:
+                    del self._last_writes[conversation_id]
+                queue.task_done()
+
+    async def wait_for(self, conversation_id: Optional[str] = None):
+        """Wait until the writes submitted so far for a conversation, or all of them, are applied."""
+        if conversation_id is None:
+            await asyncio.gather(*(queue.join() for queue in self._queues))
+            return
+
+        future = self._last_writes.get(conversation_id)
+        if future is not None:
+            await asyncio.wait({future})
+
+    async def close(self):
+        await self.wait_for()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queues = []
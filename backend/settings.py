@@ -16,6 +16,8 @@ from pydantic import (
 )
 from pydantic.alias_generators import to_snake
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import cached_property
+from types import MappingProxyType
 from typing import List, Literal, Optional
 from typing_extensions import Self
 from quart import Request
@@ -64,6 +66,11 @@ class _ChatHistorySettings(BaseSettings):
     account_key: Optional[str] = None
     conversations_container: str
     enable_feedback: bool = False
+    write_behind_enabled: bool = False
+    write_behind_workers: int = 4
+    write_behind_max_pending: int = 1000
+    delete_max_concurrency: int = 4
+    delete_background_threshold: int = 0
 
 
 class _PromptflowSettings(BaseSettings):
@@ -109,6 +116,8 @@ class _AzureOpenAISettings(BaseSettings):
     top_p: float = 0
     max_tokens: int = 1000
     stream: bool = True
+    stream_coalesce_max_delay_ms: float = 0
+    stream_coalesce_max_chars: int = 256
     stop_sequence: Optional[List[str]] = None
     seed: Optional[int] = None
     choices_count: Optional[conint(ge=1, le=128)] = Field(default=1, serialization_alias="n")
@@ -128,7 +137,15 @@ class _AzureOpenAISettings(BaseSettings):
     function_call_azure_functions_tools_base_url: Optional[str] = None
     function_call_azure_functions_tool_key: Optional[str] = None
     function_call_azure_functions_tool_base_url: Optional[str] = None
-    
+    function_call_azure_functions_tool_timeout: float = 30.0
+    function_call_azure_functions_max_concurrency: int = 4
+    http2: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    request_timeout: float = 600.0
+    connect_timeout: float = 5.0
+
     @field_validator('tools', mode='before')
     @classmethod
     def deserialize_tools(cls, tools_json_str: str) -> List[_AzureOpenAITool]:
@@ -235,12 +252,38 @@ class DatasourcePayloadConstructor(BaseModel, ABC):
         self._settings = settings
     
     @abstractmethod
+    def build_payload_parameters(self) -> dict:
+        """Parameters that are the same for every request."""
+        pass
+
+    async def request_payload_parameters(self, request: Request, group_resolver=None) -> dict:
+        """Parameters that depend on the incoming request."""
+        return {}
+
+    @cached_property
+    def payload_template(self) -> MappingProxyType:
+        # Built once, normally when the app starts. Nested values are shared
+        # between requests and must not be modified.
+        return MappingProxyType({
+            "type": self._type,
+            "parameters": MappingProxyType(self.build_payload_parameters())
+        })
+
     def construct_payload_configuration(
         self,
         *args,
         **kwargs
     ):
-        pass
+        request_parameters = kwargs.pop('request_parameters', None)
+        template = self.payload_template
+        parameters = dict(template["parameters"])
+        if request_parameters:
+            parameters.update(request_parameters)
+
+        return {
+            "type": template["type"],
+            "parameters": parameters
+        }
 
 
 class _AzureSearchSettings(BaseSettings, DatasourcePayloadConstructor):
@@ -275,6 +318,8 @@ class _AzureSearchSettings(BaseSettings, DatasourcePayloadConstructor):
         'vectorSemanticHybrid'
     ] = "simple"
     permitted_groups_column: Optional[str] = Field(default=None, exclude=True)
+    permitted_groups_cache_ttl: float = Field(default=300, exclude=True)
+    permitted_groups_cache_max_entries: int = Field(default=1024, exclude=True)
     
     # Constructed fields
     endpoint: Optional[str] = None
@@ -320,7 +365,7 @@ class _AzureSearchSettings(BaseSettings, DatasourcePayloadConstructor):
     def set_query_type(self) -> Self:
         self.query_type = to_snake(self.query_type)
 
-    def _set_filter_string(self, request: Request) -> str:
+    async def _set_filter_string(self, request: Request, group_resolver) -> str:
         if self.permitted_groups_column:
             user_token = request.headers.get("X-MS-TOKEN-AAD-ACCESS-TOKEN", "")
             logging.debug(f"USER TOKEN is {'present' if user_token else 'not present'}")
@@ -329,30 +374,26 @@ class _AzureSearchSettings(BaseSettings, DatasourcePayloadConstructor):
                     "Document-level access control is enabled, but user access token could not be fetched."
                 )
 
-            filter_string = generateFilterString(user_token)
+            group_ids = await group_resolver.get_group_ids(user_token)
+            filter_string = generateFilterString(group_ids)
             logging.debug(f"FILTER: {filter_string}")
             return filter_string
         
         return None
             
-    def construct_payload_configuration(
-        self,
-        *args,
-        **kwargs
-    ):
-        request = kwargs.pop('request', None)
-        if request and self.permitted_groups_column:
-            self.filter = self._set_filter_string(request)
-            
+    async def request_payload_parameters(self, request: Request, group_resolver=None) -> dict:
+        if self.permitted_groups_column:
+            return {"filter": await self._set_filter_string(request, group_resolver)}
+
+        return {}
+
+    def build_payload_parameters(self) -> dict:
         self.embedding_dependency = \
             self._settings.azure_openai.extract_embedding_dependency()
         parameters = self.model_dump(exclude_none=True, by_alias=True)
         parameters.update(self._settings.search.model_dump(exclude_none=True, by_alias=True))
         
-        return {
-            "type": self._type,
-            "parameters": parameters
-        }
+        return parameters
 
 
 class _AzureCosmosDbMongoVcoreSettings(
@@ -412,19 +453,12 @@ class _AzureCosmosDbMongoVcoreSettings(
         }
         return self
     
-    def construct_payload_configuration(
-        self,
-        *args,
-        **kwargs
-    ):
+    def build_payload_parameters(self) -> dict:
         self.embedding_dependency = \
             self._settings.azure_openai.extract_embedding_dependency()
         parameters = self.model_dump(exclude_none=True, by_alias=True)
         parameters.update(self._settings.search.model_dump(exclude_none=True, by_alias=True))
-        return {
-            "type": self._type,
-            "parameters": parameters
-        }
+        return parameters
 
 
 class _ElasticsearchSettings(BaseSettings, DatasourcePayloadConstructor):
@@ -482,22 +516,15 @@ class _ElasticsearchSettings(BaseSettings, DatasourcePayloadConstructor):
         }
         return self
     
-    def construct_payload_configuration(
-        self,
-        *args,
-        **kwargs
-    ):
+    def build_payload_parameters(self) -> dict:
         self.embedding_dependency = \
             {"type": "model_id", "model_id": self.embedding_model_id} if self.embedding_model_id else \
             self._settings.azure_openai.extract_embedding_dependency() 
             
         parameters = self.model_dump(exclude_none=True, by_alias=True)
         parameters.update(self._settings.search.model_dump(exclude_none=True, by_alias=True))
-                
-        return {
-            "type": self._type,
-            "parameters": parameters
-        }
+        
+        return parameters
 
 
 class _PineconeSettings(BaseSettings, DatasourcePayloadConstructor):
@@ -554,20 +581,13 @@ class _PineconeSettings(BaseSettings, DatasourcePayloadConstructor):
         }
         return self
     
-    def construct_payload_configuration(
-        self,
-        *args,
-        **kwargs
-    ):
+    def build_payload_parameters(self) -> dict:
         self.embedding_dependency = \
             self._settings.azure_openai.extract_embedding_dependency()
         parameters = self.model_dump(exclude_none=True, by_alias=True)
         parameters.update(self._settings.search.model_dump(exclude_none=True, by_alias=True))
         
-        return {
-            "type": self._type,
-            "parameters": parameters
-        }
+        return parameters
 
 
 class _AzureMLIndexSettings(BaseSettings, DatasourcePayloadConstructor):
@@ -612,18 +632,11 @@ class _AzureMLIndexSettings(BaseSettings, DatasourcePayloadConstructor):
         }
         return self
     
-    def construct_payload_configuration(
-        self,
-        *args,
-        **kwargs
-    ):
+    def build_payload_parameters(self) -> dict:
         parameters = self.model_dump(exclude_none=True, by_alias=True)
         parameters.update(self._settings.search.model_dump(exclude_none=True, by_alias=True))
         
-        return {
-            "type": self._type,
-            "parameters": parameters
-        }
+        return parameters
 
 
 class _AzureSqlServerSettings(BaseSettings, DatasourcePayloadConstructor):
@@ -659,18 +672,11 @@ class _AzureSqlServerSettings(BaseSettings, DatasourcePayloadConstructor):
             }
         return self
     
-    def construct_payload_configuration(
-        self,
-        *args,
-        **kwargs
-    ):
+    def build_payload_parameters(self) -> dict:
         parameters = self.model_dump(exclude_none=True, by_alias=True)
         #parameters.update(self._settings.search.model_dump(exclude_none=True, by_alias=True))
         
-        return {
-            "type": self._type,
-            "parameters": parameters
-        }
+        return parameters
     
 
 class _MongoDbSettings(BaseSettings, DatasourcePayloadConstructor):
@@ -733,23 +739,29 @@ class _MongoDbSettings(BaseSettings, DatasourcePayloadConstructor):
         }
         return self
     
-    def construct_payload_configuration(
-        self,
-        *args,
-        **kwargs
-    ):
+    def build_payload_parameters(self) -> dict:
         self.embedding_dependency = \
             self._settings.azure_openai.extract_embedding_dependency()
             
         parameters = self.model_dump(exclude_none=True, by_alias=True)
         parameters.update(self._settings.search.model_dump(exclude_none=True, by_alias=True))
         
-        return {
-            "type": self._type,
-            "parameters": parameters
-        }
+        return parameters
         
         
+class _AgentSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="AGENT_",
+        env_file=DOTENV_PATH,
+        extra="ignore",
+        env_ignore_empty=True
+    )
+
+    # single_pass streams the CaseReviewer answer as the assistant response,
+    # resynthesize sends it through one more chat completion
+    pipeline_mode: Literal["single_pass", "resynthesize"] = "resynthesize"
+
+
 class _BaseSettings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=DOTENV_PATH,
@@ -768,6 +780,7 @@ class _AppSettings(BaseModel):
     azure_openai: _AzureOpenAISettings = _AzureOpenAISettings()
     search: _SearchCommonSettings = _SearchCommonSettings()
     ui: Optional[_UiSettings] = _UiSettings()
+    agents: _AgentSettings = _AgentSettings()
     
     # Constructed properties
     chat_history: Optional[_ChatHistorySettings] = None
@@ -1,11 +1,18 @@
 import os
 import json
+import asyncio
 import logging
-import requests
 import dataclasses
 
+from collections.abc import Mapping
+from json.encoder import encode_basestring_ascii
 from typing import List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DEBUG = os.environ.get("DEBUG", "false")
 if DEBUG.lower() == "true":
     logging.basicConfig(level=logging.DEBUG)
@@ -22,10 +29,82 @@ class JSONEncoder(json.JSONEncoder):
         return super().default(o)
 
 
+# Keys whose values are masked wherever they appear in logged payloads
+SECRET_PARAMS = frozenset([
+    "key",
+    "connection_string",
+    "embedding_key",
+    "encoded_api_key",
+    "api_key",
+    "password",
+])
+REDACTED = "*****"
+
+
+def _iter_redacted_json(obj, indent, level=0):
+    if isinstance(obj, Mapping) or isinstance(obj, (list, tuple)):
+        is_mapping = isinstance(obj, Mapping)
+        if not obj:
+            yield "{}" if is_mapping else "[]"
+            return
+
+        inner = "\n" + " " * (indent * (level + 1))
+        yield "{" if is_mapping else "["
+        items = obj.items() if is_mapping else enumerate(obj)
+        for i, (key, value) in enumerate(items):
+            yield ("," if i else "") + inner
+            if is_mapping:
+                yield json.dumps(str(key)) + ": "
+                if key in SECRET_PARAMS and value:
+                    yield json.dumps(REDACTED)
+                    continue
+            yield from _iter_redacted_json(value, indent, level + 1)
+        yield "\n" + " " * (indent * level) + ("}" if is_mapping else "]")
+    else:
+        yield json.dumps(obj, cls=JSONEncoder)
+
+
+class RedactedJSON:
+    """Formats an object as indented JSON with secret values masked.
+
+    Nothing is copied or serialized until the object is converted to a string,
+    which logging only does for records that are actually emitted.
+    """
+
+    __slots__ = ("obj", "indent")
+
+    def __init__(self, obj, indent: int = 4):
+        self.obj = obj
+        self.indent = indent
+
+    def __str__(self):
+        return "".join(_iter_redacted_json(self.obj, self.indent))
+
+
+def log_redacted_debug(message: str, obj, logger: logging.Logger = None):
+    logger = logger or logging.getLogger()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: %s", message, RedactedJSON(obj))
+
+
+def encode_ndjson(obj) -> str:
+    """Encode one NDJSON line, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, cls=JSONEncoder) + "\n"
+
+
 async def format_as_ndjson(r):
     try:
         async for event in r:
-            yield json.dumps(event, cls=JSONEncoder) + "\n"
+            # Frames from StreamResponseEncoder are already encoded
+            if isinstance(event, str):
+                yield event
+            else:
+                yield json.dumps(event, cls=JSONEncoder) + "\n"
     except Exception as error:
         logging.exception("Exception while generating response stream: %s", error)
         yield json.dumps({"error": str(error)})
@@ -38,40 +117,12 @@ def parse_multi_columns(columns: str) -> list:
         return columns.split(",")
 
 
-def fetchUserGroups(userToken, nextLink=None):
-    # Recursively fetch group membership
-    if nextLink:
-        endpoint = nextLink
-    else:
-        endpoint = "https://graph.microsoft.com/v1.0/me/transitiveMemberOf?$select=id"
-
-    headers = {"Authorization": "bearer " + userToken}
-    try:
-        r = requests.get(endpoint, headers=headers)
-        if r.status_code != 200:
-            logging.error(f"Error fetching user groups: {r.status_code} {r.text}")
-            return []
-
-        r = r.json()
-        if "@odata.nextLink" in r:
-            nextLinkData = fetchUserGroups(userToken, r["@odata.nextLink"])
-            r["value"].extend(nextLinkData)
-
-        return r["value"]
-    except Exception as e:
-        logging.error(f"Exception in fetchUserGroups: {e}")
-        return []
-
-
-def generateFilterString(userToken):
-    # Get list of groups user is a member of
-    userGroups = fetchUserGroups(userToken)
-
-    # Construct filter string
+def generateFilterString(userGroups):
+    # Construct filter string from the ids of the groups the user is a member of
     if not userGroups:
         logging.debug("No user groups found")
 
-    group_ids = ", ".join([obj["id"] for obj in userGroups])
+    group_ids = ", ".join(userGroups)
     return f"{AZURE_SEARCH_PERMITTED_GROUPS_COLUMN}/any(g:search.in(g, '{group_ids}'))"
 
 
@@ -159,6 +210,140 @@ def format_stream_response(chatCompletionChunk, history_metadata, apim_request_i
     return {}
 
 
+def _plain_content(chatCompletionChunk):
+    # The content of chunks format_stream_response turns into a single
+    # assistant message, None for anything else
+    if not chatCompletionChunk.choices:
+        return None
+    delta = chatCompletionChunk.choices[0].delta
+    if not delta or hasattr(delta, "context") or delta.tool_calls:
+        return None
+    return delta.content or None
+
+
+class StreamResponseEncoder:
+    """Encodes completion chunks as the NDJSON lines of format_stream_response.
+
+    history_metadata and apim-request-id are serialized once per response and
+    the id, model, created and object fields once per distinct value, so a
+    content chunk only costs encoding its text. Other chunks go through
+    format_stream_response. history_metadata must not change while the
+    response streams.
+    """
+
+    def __init__(self, history_metadata, apim_request_id):
+        self.history_metadata = history_metadata
+        self.apim_request_id = apim_request_id
+        self._suffix = (
+            '}]}], "history_metadata": ' + json.dumps(history_metadata, cls=JSONEncoder) +
+            ', "apim-request-id": ' + json.dumps(apim_request_id) + "}\n"
+        )
+        self._envelope = None
+        self._prefix = None
+
+    def encode(self, chatCompletionChunk) -> str:
+        content = _plain_content(chatCompletionChunk)
+        if content is None:
+            response_obj = format_stream_response(chatCompletionChunk, self.history_metadata, self.apim_request_id)
+            return encode_ndjson(response_obj)
+
+        envelope = (
+            chatCompletionChunk.id,
+            chatCompletionChunk.model,
+            chatCompletionChunk.created,
+            chatCompletionChunk.object
+        )
+        if envelope != self._envelope:
+            self._envelope = envelope
+            self._prefix = (
+                '{"id": %s, "model": %s, "created": %s, "object": %s, '
+                '"choices": [{"messages": [{"role": "assistant", "content": '
+            ) % tuple(json.dumps(value) for value in envelope)
+
+        return self._prefix + encode_basestring_ascii(content) + self._suffix
+
+
+def _merge_content_chunks(chunks, content):
+    first = chunks[0]
+    choice = first.choices[0]
+    return first.model_copy(update={
+        "choices": [choice.model_copy(update={
+            "delta": choice.delta.model_copy(update={"content": content})
+        })]
+    })
+
+
+async def coalesce_chunks(chunks, max_delay: float, max_chars: int):
+    """Merge consecutive content chunks of a completion stream.
+
+    Buffered content is sent as one chunk once max_delay seconds have passed
+    since the first buffered chunk, or once it reaches max_chars characters.
+    It is sent right away when the role or envelope changes, before any other
+    kind of chunk (tool calls, context, finish) and at the end of the stream.
+    """
+    iterator = chunks.__aiter__()
+    loop = asyncio.get_running_loop()
+    buffer = []
+    buffered_content = []
+    buffered_chars = 0
+    deadline = None
+    pending = None
+
+    def flush():
+        nonlocal buffer, buffered_content, buffered_chars, deadline
+        chunk = (
+            buffer[0] if len(buffer) == 1
+            else _merge_content_chunks(buffer, "".join(buffered_content))
+        )
+        buffer, buffered_content, buffered_chars, deadline = [], [], 0, None
+        return chunk
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            if buffer:
+                done, _ = await asyncio.wait({pending}, timeout=max(deadline - loop.time(), 0))
+                if not done:
+                    # The upstream is slow, send what has arrived so far
+                    yield flush()
+                    continue
+
+            try:
+                chunk = await pending
+            except StopAsyncIteration:
+                break
+            finally:
+                pending = None
+
+            content = _plain_content(chunk)
+            if buffer and (
+                content is None or
+                chunk.choices[0].delta.role not in (None, buffer[0].choices[0].delta.role) or
+                (chunk.id, chunk.model, chunk.created, chunk.object) !=
+                (buffer[0].id, buffer[0].model, buffer[0].created, buffer[0].object)
+            ):
+                yield flush()
+
+            if content is None:
+                yield chunk
+                continue
+
+            if not buffer:
+                deadline = loop.time() + max_delay
+            buffer.append(chunk)
+            buffered_content.append(content)
+            buffered_chars += len(content)
+            if buffered_chars >= max_chars:
+                yield flush()
+
+        if buffer:
+            yield flush()
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
 def format_pf_non_streaming_response(
     chatCompletion, history_metadata, response_field_name, citations_field_name, message_uuid=None
 ):
@@ -245,26 +430,3 @@ class NestedAppSettings:
     @classmethod
     def from_dict(cls, config_dict):
         return cls(**config_dict)
-    
-def get_ada_large_embeddings(text):
-    from openai import AzureOpenAI
-
-    _api_key = os.environ.get("AZURE_OPENAI_EMBEDDING_KEY")
-    _api_version = os.environ.get("AZURE_OPENAI_PREVIEW_API_VERSION")
-    _azure_endpoint = os.environ.get("AZURE_OPENAI_EMBEDDING_ENDPOINT")
-    _deployment_name = os.environ.get("AZURE_OPENAI_EMBEDDING_NAME")
-
-    client = AzureOpenAI(
-        api_key=_api_key,
-        api_version=_api_version,
-        azure_endpoint=_azure_endpoint
-    )
-    
-    response = client.embeddings.create(
-                input=text,
-                model=_deployment_name
-            )
-    
-    data = response.data
-    embeddings = [item.embedding for item in data]
-    return embeddings[0]
\ No newline at end of file
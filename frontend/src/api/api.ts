@@ -1,6 +1,14 @@
 import { chatHistorySampleData } from '../constants/chatHistory'
 
-import { ChatMessage, Conversation, ConversationRequest, CosmosDBHealth, CosmosDBStatus, UserInfo } from './models'
+import {
+  ChatMessage,
+  Conversation,
+  ConversationRequest,
+  CosmosDBHealth,
+  CosmosDBStatus,
+  HistoryListPage,
+  UserInfo
+} from './models'
 
 export async function conversationApi(options: ConversationRequest, abortSignal: AbortSignal): Promise<Response> {
   const response = await fetch('/conversation', {
@@ -35,8 +43,9 @@ export const fetchChatHistoryInit = (): Conversation[] | null => {
   return chatHistorySampleData
 }
 
-export const historyList = async (offset = 0): Promise<Conversation[] | null> => {
-  const response = await fetch(`/history/list?offset=${offset}`, {
+export const historyList = async (continuationToken: string | null = null): Promise<HistoryListPage | null> => {
+  const query = continuationToken ? `?continuation_token=${encodeURIComponent(continuationToken)}` : ''
+  const response = await fetch(`/history/list${query}`, {
     method: 'GET'
   })
     .then(async res => {
@@ -59,13 +68,13 @@ export const historyList = async (offset = 0): Promise<Conversation[] | null> =>
           const conversation: Conversation = {
             id: conv.id,
             title: conv.title,
-            date: conv.createdAt,
+            date: conv.updatedAt,
             messages: convMessages
           }
           return conversation
         })
       )
-      return conversations
+      return { conversations, continuationToken: res.headers.get('x-ms-continuation') }
     })
     .catch(_err => {
       console.error('There was an issue fetching your data.')
@@ -61,6 +61,12 @@ export type Conversation = {
   date: string
 }
 
+export type HistoryListPage = {
+  conversations: Conversation[]
+  // null after the last page
+  continuationToken: string | null
+}
+
 export enum ChatCompletionType {
   ChatCompletion = 'chat.completion',
   ChatCompletionChunk = 'chat.completion.chunk'
@@ -81,6 +87,7 @@ export type ChatResponse = {
     title: string
     date: string
   }
+  type?: string
   error?: any
 }
 
@@ -295,7 +295,6 @@ export const ChatHistoryListItemGroups: React.FC<ChatHistoryListItemGroupsProps>
   const appStateContext = useContext(AppStateContext)
   const observerTarget = useRef(null)
   const [, setSelectedItem] = React.useState<Conversation | null>(null)
-  const [offset, setOffset] = useState<number>(25)
   const [observerCounter, setObserverCounter] = useState(0)
   const [showSpinner, setShowSpinner] = useState(false)
   const firstRender = useRef(true)
@@ -316,17 +315,23 @@ export const ChatHistoryListItemGroups: React.FC<ChatHistoryListItemGroupsProps>
       return
     }
     handleFetchHistory()
-    setOffset(offset => (offset += 25))
   }, [observerCounter])
 
   const handleFetchHistory = async () => {
     const currentChatHistory = appStateContext?.state.chatHistory
+    const continuationToken = appStateContext?.state.chatHistoryContinuationToken
+    // No token means the last page has already been loaded
+    if (!continuationToken) {
+      return
+    }
     setShowSpinner(true)
 
-    await historyList(offset).then(response => {
-      const concatenatedChatHistory = currentChatHistory && response && currentChatHistory.concat(...response)
+    await historyList(continuationToken).then(response => {
+      const concatenatedChatHistory =
+        currentChatHistory && response && currentChatHistory.concat(...response.conversations)
       if (response) {
-        appStateContext?.dispatch({ type: 'FETCH_CHAT_HISTORY', payload: concatenatedChatHistory || response })
+        appStateContext?.dispatch({ type: 'FETCH_CHAT_HISTORY', payload: concatenatedChatHistory || response.conversations })
+        appStateContext?.dispatch({ type: 'SET_CHAT_HISTORY_CONTINUATION_TOKEN', payload: response.continuationToken })
       } else {
         appStateContext?.dispatch({ type: 'FETCH_CHAT_HISTORY', payload: null })
       }
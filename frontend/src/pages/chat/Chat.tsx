@@ -82,6 +82,7 @@ const Chat = () => {
 
   const [ASSISTANT, TOOL, ERROR] = ['assistant', 'tool', 'error']
   const NO_CONTENT_ERROR = 'No content in messages object.'
+  const AGENT_EVENT = 'agent_event'
 
   useEffect(() => {
     if (
@@ -242,6 +243,11 @@ const Chat = () => {
               if (obj !== '' && obj !== '{}') {
                 runningText += obj
                 result = JSON.parse(runningText)
+                if (result.type === AGENT_EVENT) {
+                  // Agent progress frames arrive before the answer and carry no chat messages
+                  runningText = ''
+                  return
+                }
                 if (result.choices?.length > 0) {
                   result.choices[0].messages.forEach(msg => {
                     msg.id = result.id
@@ -397,6 +403,11 @@ const Chat = () => {
               if (obj !== '' && obj !== '{}') {
                 runningText += obj
                 result = JSON.parse(runningText)
+                if (result.type === AGENT_EVENT) {
+                  // Agent progress frames arrive before the answer and carry no chat messages
+                  runningText = ''
+                  return
+                }
                 if (!result.choices?.[0]?.messages?.[0].content) {
                   errorResponseMessage = NO_CONTENT_ERROR
                   throw Error()
@@ -0,0 +1,82 @@
+"""On-disk cache of Document Intelligence analyze results."""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, Optional
+
+
+class AnalyzeResultCache:
+    """Content-addressed cache of serialized analyze results, with an LRU size cap.
+
+    Results are keyed by the hash of the analyzed file, the model and the
+    version of the SDK or API that produced them, so re-chunking the same files with other parameters doesn't call
+    the service again. Each result is a gzipped JSON file in directory; reading
+    one marks it as recently used, and once the cache grows over max_bytes the
+    least recently used results are evicted. Writes are atomic, so worker
+    processes can share the directory.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2 * 1024 ** 3):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(file_hash: str, model: str, version: str) -> str:
+        return hashlib.sha256(f"{file_hash}\0{model}\0{version}".encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json.gz")
+
+    def get(self, key: str) -> Optional[Dict]:
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                result = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            print(f"Ignoring unreadable cached analyze result {path}: {e}")
+            return None
+
+        try:
+            # The modification time is the last use for the LRU eviction
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return result
+
+    def put(self, key: str, result: Dict):
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+                json.dump(result, f)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json.gz"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Already evicted by another process
+                pass
+            total -= size
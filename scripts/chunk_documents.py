@@ -8,7 +8,7 @@ from azure.core.credentials import AzureKeyCredential
 from azure.keyvault.secrets import SecretClient
 from azure.ai.formrecognizer import DocumentAnalysisClient
 
-from data_utils import chunk_directory
+from data_utils import ChunkingResult, iter_chunk_directory, iter_chunks
 
 def get_document_intelligence_client(config, secret_client):
     print("Setting up Document Intelligence client...")
@@ -69,26 +69,28 @@ if __name__ == "__main__":
         # Crack and chunk documents
         print("Cracking and chunking documents...")
 
-        chunking_result = chunk_directory(
+        chunking_results = iter_chunk_directory(
                             directory_path=args.input_data_path, 
                             num_tokens=index_config.get("chunk_size", 1024),
                             token_overlap=index_config.get("token_overlap", 128),
                             form_recognizer_client=document_intelligence_client,
                             use_layout=index_config.get("use_layout", False),
                             njobs=1)
-        
-        print(f"Processed {chunking_result.total_files} files")
-        print(f"Unsupported formats: {chunking_result.num_unsupported_format_files} files")
-        print(f"Files with errors: {chunking_result.num_files_with_errors} files")
-        print(f"Found {len(chunking_result.chunks)} chunks")
 
+        # Write the chunks as they are produced instead of holding them all in memory
         print("Writing chunking result to {}...".format(args.output_file_path))
+        summary = ChunkingResult(chunks=[], total_files=0)
+        num_chunks = 0
         with open(args.output_file_path, "w") as f:
-            for chunk in chunking_result.chunks:
-                id = 0
+            for id, chunk in enumerate(iter_chunks(chunking_results, summary)):
                 d = dataclasses.asdict(chunk)
                 # add id to documents
-                d.update({"id": str(id)})
+                d.update({"id": d.get("id") or str(id)})
                 f.write(json.dumps(d) + "\n")
-                id += 1
+                num_chunks += 1
+
+        print(f"Processed {summary.total_files} files")
+        print(f"Unsupported formats: {summary.num_unsupported_format_files} files")
+        print(f"Files with errors: {summary.num_files_with_errors} files")
+        print(f"Found {num_chunks} chunks")
         print("Chunking result written to {}.".format(args.output_file_path))
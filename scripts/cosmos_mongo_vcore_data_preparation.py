@@ -9,10 +9,11 @@ from data_utils import Document
 from azure.ai.formrecognizer import DocumentAnalysisClient
 from azure.core.credentials import AzureKeyCredential
 from azure.identity import AzureCliCredential
+from pymongo.errors import BulkWriteError
 from pymongo.mongo_client import MongoClient
-from typing import List
+from typing import Iterable, List
 
-from data_utils import chunk_directory
+from data_utils import ChunkingResult, batched, iter_chunk_directory, iter_chunks
 
 SUPPORTED_LANGUAGE_CODES = {
     "ar": "Arabic",
@@ -122,27 +123,47 @@ def upsert_documents_to_index(
         mongo_client: MongoClient,
         database_name: str,
         collection_name: str,
-        docs: List[Document]
+        docs: Iterable[Document],
+        upsert_batch_size: int = 100
         ):
-    for document in docs:
-        finalDocChunk:dict = {}
-        finalDocChunk["_id"] = f"doc:{uuid.uuid4()}"
-        finalDocChunk['title'] = document.title
-        finalDocChunk["filepath"] = document.filepath
-        finalDocChunk["url"] = document.url
-        finalDocChunk["content"] = document.content
-        finalDocChunk["contentvector"] = document.contentVector
-        finalDocChunk["metadata"] = document.metadata
-
-        mongo_collection = mongo_client[database_name][collection_name]
+    """Inserts the documents in batches as docs is iterated, returning the number of documents inserted.
+
+    A failed document doesn't stop the remaining ones, but the insert raises
+    once all of them have been tried.
+    """
+    mongo_collection = mongo_client[database_name][collection_name]
+    num_upserted = 0
+    num_failures = 0
+    errors = set()
+    for batch in batched(docs, upsert_batch_size):
+        finalDocChunks = []
+        for document in batch:
+            finalDocChunk:dict = {}
+            finalDocChunk["_id"] = f"doc:{uuid.uuid4()}"
+            finalDocChunk['title'] = document.title
+            finalDocChunk["filepath"] = document.filepath
+            finalDocChunk["url"] = document.url
+            finalDocChunk["content"] = document.content
+            finalDocChunk["contentvector"] = document.contentVector
+            finalDocChunk["metadata"] = document.metadata
+            finalDocChunks.append(finalDocChunk)
 
         try:
-            mongo_collection.insert_one(finalDocChunk)
-            print(f"Upsert doc chunk {document.id} successfully")
-        
-        except Exception as e:
-            print(f"Failed to upsert doc chunk {document.id}")
-            continue
+            # Unordered, so one failed document doesn't stop the rest of the batch
+            result = mongo_collection.insert_many(finalDocChunks, ordered=False)
+            num_upserted += len(result.inserted_ids)
+            print(f"Upserted {len(result.inserted_ids)} doc chunks successfully")
+
+        except BulkWriteError as e:
+            num_upserted += e.details["nInserted"]
+            print(f"Failed to upsert {len(e.details['writeErrors'])} of {len(finalDocChunks)} doc chunks")
+            num_failures += len(e.details["writeErrors"])
+            errors.update(error["errmsg"] for error in e.details["writeErrors"])
+
+    if num_failures > 0:
+        raise Exception(f"INDEXING FAILED for {num_failures} doc chunks, {num_upserted} were upserted. "
+                        f"Please recreate the index. \n Error Messages: {list(errors)}")
+    return num_upserted
 
 def validate_index(
         mongo_client: MongoClient,
@@ -195,21 +216,22 @@ def create_index(config, credential, form_recognizer_client=None, embedding_mode
     print("Chunking directory...")
     add_embeddings = True
 
-    result = chunk_directory(config["data_path"], num_tokens=config["chunk_size"], token_overlap=config.get("token_overlap",0),
+    results = iter_chunk_directory(config["data_path"], num_tokens=config["chunk_size"], token_overlap=config.get("token_overlap",0),
                              azure_credential=credential, form_recognizer_client=form_recognizer_client, use_layout=use_layout, njobs=njobs,
                              add_embeddings=add_embeddings, embedding_endpoint=embedding_model_endpoint)
 
-    if len(result.chunks) == 0:
-        raise Exception("No chunks found. Please check the data path and chunk size.")
+    # upsert documents to index as they are chunked
+    print("Upserting documents to index...")
+    summary = ChunkingResult(chunks=[], total_files=0)
+    num_chunks = upsert_documents_to_index(mongo_client, database_name, collection_name, iter_chunks(results, summary))
 
-    print(f"Processed {result.total_files} files")
-    print(f"Unsupported formats: {result.num_unsupported_format_files} files")
-    print(f"Files with errors: {result.num_files_with_errors} files")
-    print(f"Found {len(result.chunks)} chunks")
+    if num_chunks == 0:
+        raise Exception("No chunks found. Please check the data path and chunk size.")
 
-    # upsert documents to index
-    print("Upserting documents to index...")
-    upsert_documents_to_index(mongo_client, database_name, collection_name, result.chunks)
+    print(f"Processed {summary.total_files} files")
+    print(f"Unsupported formats: {summary.num_unsupported_format_files} files")
+    print(f"Files with errors: {summary.num_files_with_errors} files")
+    print(f"Upserted {num_chunks} chunks")
 
     # check if index is ready/validate index
     print("Validating index...")
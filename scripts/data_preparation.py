@@ -1,9 +1,11 @@
 """Data Preparation Script for an Azure Cognitive Search Index."""
 import argparse
 import dataclasses
+import hashlib
 import json
 import os
 import subprocess
+import tempfile
 import time
 
 import requests
@@ -14,7 +16,8 @@ from azure.search.documents import SearchClient
 from dotenv import load_dotenv
 from tqdm import tqdm
 
-from data_utils import chunk_directory, chunk_blob_container
+from data_utils import ChunkingResult, batched, downloadBlobUrlToLocalFolder, file_sha256, get_files_recursively, iter_chunk_directory, iter_chunks
+from index_manifest import IndexManifest
 
 # Configure environment variables  
 load_dotenv() # take environment variables from .env.
@@ -277,23 +280,7 @@ def create_or_update_search_index(
     return True
 
 
-def upload_documents_to_index(service_name, subscription_id, resource_group, index_name, docs, credential=None, upload_batch_size = 50, admin_key=None):
-    if credential is None and admin_key is None:
-        raise ValueError("credential and admin_key cannot be None")
-    
-    to_upload_dicts = []
-
-    id = 0
-    for d in docs:
-        if type(d) is not dict:
-            d = dataclasses.asdict(d)
-        # add id to documents
-        d.update({"@search.action": "upload", "id": str(id)})
-        if "contentVector" in d and d["contentVector"] is None:
-            del d["contentVector"]
-        to_upload_dicts.append(d)
-        id += 1
-    
+def get_search_client(service_name, subscription_id, resource_group, index_name, admin_key=None):
     endpoint = "https://{}.search.windows.net/".format(service_name)
     if not admin_key:
         admin_key = json.loads(
@@ -304,25 +291,64 @@ def upload_documents_to_index(service_name, subscription_id, resource_group, ind
             ).stdout
         )["primaryKey"]
 
-    search_client = SearchClient(
+    return SearchClient(
         endpoint=endpoint,
         index_name=index_name,
         credential=AzureKeyCredential(admin_key),
     )
+
+
+def upload_documents_to_index(service_name, subscription_id, resource_group, index_name, docs, credential=None, upload_batch_size = 50, admin_key=None):
+    """Uploads the documents in batches as docs is iterated, returning the number of documents uploaded.
+
+    Documents without an id are given their position in docs as id.
+    """
+    if credential is None and admin_key is None:
+        raise ValueError("credential and admin_key cannot be None")
+
+    def to_upload_dicts():
+        for id, d in enumerate(docs):
+            if type(d) is not dict:
+                d = dataclasses.asdict(d)
+            # add id to documents
+            d.update({"@search.action": "upload", "id": d.get("id") or str(id)})
+            if "contentVector" in d and d["contentVector"] is None:
+                del d["contentVector"]
+            yield d
+
+    search_client = get_search_client(service_name, subscription_id, resource_group, index_name, admin_key)
     # Upload the documents in batches of upload_batch_size
-    for i in tqdm(range(0, len(to_upload_dicts), upload_batch_size), desc="Indexing Chunks..."):
-        batch = to_upload_dicts[i: i + upload_batch_size]
-        results = search_client.upload_documents(documents=batch)
-        num_failures = 0
-        errors = set()
-        for result in results:
-            if not result.succeeded:
-                print(f"Indexing Failed for {result.key} with ERROR: {result.error_message}")
-                num_failures += 1
-                errors.add(result.error_message)
-        if num_failures > 0:
-            raise Exception(f"INDEXING FAILED for {num_failures} documents. Please recreate the index."
-                            f"To Debug: PLEASE CHECK chunk_size and upload_batch_size. \n Error Messages: {list(errors)}")
+    num_uploaded = 0
+    with tqdm(desc="Indexing Chunks...", unit=" chunks") as progress:
+        for batch in batched(to_upload_dicts(), upload_batch_size):
+            results = search_client.upload_documents(documents=batch)
+            num_failures = 0
+            errors = set()
+            for result in results:
+                if not result.succeeded:
+                    print(f"Indexing Failed for {result.key} with ERROR: {result.error_message}")
+                    num_failures += 1
+                    errors.add(result.error_message)
+            if num_failures > 0:
+                raise Exception(f"INDEXING FAILED for {num_failures} documents. Please recreate the index."
+                                f"To Debug: PLEASE CHECK chunk_size and upload_batch_size. \n Error Messages: {list(errors)}")
+            num_uploaded += len(batch)
+            progress.update(len(batch))
+    return num_uploaded
+
+
+def delete_documents_from_index(service_name, subscription_id, resource_group, index_name, ids, credential=None, delete_batch_size = 1000, admin_key=None):
+    if credential is None and admin_key is None:
+        raise ValueError("credential and admin_key cannot be None")
+    if not ids:
+        return
+
+    search_client = get_search_client(service_name, subscription_id, resource_group, index_name, admin_key)
+    for batch in tqdm(list(batched(ids, delete_batch_size)), desc="Deleting Chunks..."):
+        results = search_client.delete_documents(documents=[{"id": id} for id in batch])
+        failures = [result for result in results if not result.succeeded]
+        if failures:
+            raise Exception(f"DELETING FAILED for {len(failures)} documents. Error Messages: {list({result.error_message for result in failures})}")
 
 def validate_index(service_name, subscription_id, resource_group, index_name):
     api_version = "2024-03-01-Preview"
@@ -364,7 +390,81 @@ def validate_index(service_name, subscription_id, resource_group, index_name):
                 print(f"Request failed. Please investigate. Status code: {response.status_code}")
             break
 
-def create_index(config, credential, form_recognizer_client=None, embedding_model_endpoint=None, use_layout=False, njobs=4, captioning_model_endpoint=None, captioning_model_key=None):
+def index_directory(config, source, directory, chunking_params, chunking_clients, credential, manifest=None):
+    """Chunks the files of a directory and uploads them to the index as they are chunked.
+
+    With a manifest, only the files that were added or changed since the last
+    run, or are to be chunked with different parameters, are chunked, and the
+    chunks of changed and removed files that are gone are deleted from the index.
+    """
+    service_name = config["search_service_name"]
+    subscription_id = config["subscription_id"]
+    resource_group = config["resource_group"]
+    index_name = config["index_name"]
+
+    file_paths = None
+    if manifest:
+        content_hashes = {
+            os.path.relpath(file_path, directory): file_sha256(file_path)
+            for file_path in get_files_recursively(directory) if os.path.isfile(file_path)
+        }
+        params_hash = hashlib.sha256(json.dumps(chunking_params, sort_keys=True).encode()).hexdigest()
+        changed, removed = manifest.plan(index_name, source, content_hashes, params_hash)
+        print(f"Manifest: {len(changed)} new or changed files, {len(removed)} removed files, {len(content_hashes) - len(changed)} unchanged files")
+        file_paths = [os.path.join(directory, filepath) for filepath in changed]
+
+    # Positional ids without a manifest, as runs without one re-upload every chunk and delete nothing
+    results = iter_chunk_directory(directory, file_paths=file_paths, content_ids=manifest is not None, source=source,
+                                   **chunking_params, **chunking_clients)
+
+    # Chunk ids of each file chunked without errors, by relative path
+    file_chunk_ids = {}
+    def track_chunk_ids(results):
+        # iter_chunk_directory yields one result per file, in the order of file_paths
+        for filepath, result in zip(changed, results):
+            if result.num_files_with_errors == 0:
+                file_chunk_ids[filepath] = [chunk.id for chunk in result.chunks]
+            yield result
+    if manifest:
+        results = track_chunk_ids(results)
+
+    # upload documents to index as they are chunked
+    print("Uploading documents to index...")
+    summary = ChunkingResult(chunks=[], total_files=0)
+    num_chunks = upload_documents_to_index(service_name, subscription_id, resource_group, index_name, iter_chunks(results, summary), credential)
+
+    if manifest:
+        # Files without chunks are recorded too, so a re-run skips them; only
+        # fail when none of the files to process could be chunked
+        no_chunks = bool(changed) and not file_chunk_ids
+    else:
+        no_chunks = num_chunks == 0
+    if no_chunks:
+        raise Exception("No chunks found. Please check the data path and chunk size.")
+
+    print(f"Processed {summary.total_files} files")
+    print(f"Unsupported formats: {summary.num_unsupported_format_files} files")
+    print(f"Files with errors: {summary.num_files_with_errors} files")
+    print(f"Found {num_chunks} chunks")
+
+    if manifest:
+        # Only delete once the new chunks are in, so there's no gap in the index
+        stale_chunk_ids = []
+        for filepath in removed:
+            stale_chunk_ids.extend(manifest.chunk_ids(index_name, source, filepath))
+        for filepath, chunk_ids in file_chunk_ids.items():
+            new_chunk_ids = set(chunk_ids)
+            stale_chunk_ids.extend(chunk_id for chunk_id in manifest.chunk_ids(index_name, source, filepath) if chunk_id not in new_chunk_ids)
+        print(f"Deleting {len(stale_chunk_ids)} chunks of changed and removed files...")
+        delete_documents_from_index(service_name, subscription_id, resource_group, index_name, stale_chunk_ids, credential)
+
+        for filepath in removed:
+            manifest.remove(index_name, source, filepath)
+        for filepath, chunk_ids in file_chunk_ids.items():
+            manifest.record(index_name, source, filepath, content_hashes[filepath], params_hash, chunk_ids)
+
+
+def create_index(config, credential, form_recognizer_client=None, embedding_model_endpoint=None, use_layout=False, njobs=4, captioning_model_endpoint=None, captioning_model_key=None, manifest=None):
     service_name = config["search_service_name"]
     subscription_id = config["subscription_id"]
     resource_group = config["resource_group"]
@@ -411,30 +511,23 @@ def create_index(config, credential, form_recognizer_client=None, embedding_mode
         if config.get("vector_config_name") and embedding_model_endpoint:
             add_embeddings = True
 
+        chunking_params = dict(num_tokens=config["chunk_size"], token_overlap=config.get("token_overlap",0), use_layout=use_layout,
+                               add_embeddings=add_embeddings, embedding_endpoint=embedding_model_endpoint, url_prefix=data_config["url_prefix"],
+                               captioning_model_endpoint=captioning_model_endpoint)
+        chunking_clients = dict(azure_credential=credential, form_recognizer_client=form_recognizer_client, njobs=njobs,
+                                captioning_model_key=captioning_model_key)
+
         if "blob.core" in data_config["path"]:
-            result = chunk_blob_container(data_config["path"], credential=credential, num_tokens=config["chunk_size"], token_overlap=config.get("token_overlap",0),
-                                azure_credential=credential, form_recognizer_client=form_recognizer_client, use_layout=use_layout, njobs=njobs,
-                                add_embeddings=add_embeddings, embedding_endpoint=embedding_model_endpoint, url_prefix=data_config["url_prefix"])
+            with tempfile.TemporaryDirectory() as local_data_folder:
+                print(f'Downloading {data_config["path"]} to local folder')
+                downloadBlobUrlToLocalFolder(data_config["path"], local_data_folder, credential)
+                print(f'Downloaded.')
+                index_directory(config, data_config["path"], local_data_folder, chunking_params, chunking_clients, credential, manifest)
         elif os.path.exists(data_config["path"]):
-            result = chunk_directory(data_config["path"], num_tokens=config["chunk_size"], token_overlap=config.get("token_overlap",0),
-                                    azure_credential=credential, form_recognizer_client=form_recognizer_client, use_layout=use_layout, njobs=njobs,
-                                    add_embeddings=add_embeddings, embedding_endpoint=embedding_model_endpoint, url_prefix=data_config["url_prefix"],
-                                    captioning_model_endpoint=captioning_model_endpoint, captioning_model_key=captioning_model_key)
+            index_directory(config, data_config["path"], data_config["path"], chunking_params, chunking_clients, credential, manifest)
         else:
             raise Exception(f"Path {data_config['path']} does not exist and is not a blob URL. Please check the path and try again.")
 
-        if len(result.chunks) == 0:
-            raise Exception("No chunks found. Please check the data path and chunk size.")
-
-        print(f"Processed {result.total_files} files")
-        print(f"Unsupported formats: {result.num_unsupported_format_files} files")
-        print(f"Files with errors: {result.num_files_with_errors} files")
-        print(f"Found {len(result.chunks)} chunks")
-
-        # upload documents to index
-        print("Uploading documents to index...")
-        upload_documents_to_index(service_name, subscription_id, resource_group, index_name, result.chunks, credential)
-
     # check if index is ready/validate index
     print("Validating index...")
     validate_index(service_name, subscription_id, resource_group, index_name)
@@ -453,12 +546,15 @@ if __name__ == "__main__":
     parser.add_argument("--form-rec-resource", type=str, help="Name of your Form Recognizer resource to use for PDF cracking.")
     parser.add_argument("--form-rec-key", type=str, help="Key for your Form Recognizer resource to use for PDF cracking.")
     parser.add_argument("--form-rec-use-layout", default=True, action='store_true', help="Whether to use Layout model for PDF cracking, if False will use Read model.")
+    parser.add_argument("--form-rec-cache-dir", type=str, help="Directory to cache Form Recognizer results in, so files that didn't change are not analyzed again, e.g. when trying other chunk sizes.")
+    parser.add_argument("--form-rec-cache-max-mb", type=float, default=2048, help="Size of the Form Recognizer cache in MB, beyond which the least recently used results are removed. Default=2048")
     parser.add_argument("--njobs", type=valid_range, default=4, help="Number of jobs to run (between 1 and 32). Default=4")
     parser.add_argument("--embedding-model-endpoint", type=str, help="Endpoint for the embedding model to use for vector search. Format: 'https://<AOAI resource name>.openai.azure.com/openai/deployments/<Ada deployment name>/embeddings?api-version=2024-03-01-Preview'")
     parser.add_argument("--embedding-model-key", type=str, help="Key for the embedding model to use for vector search.")
     parser.add_argument("--search-admin-key", type=str, help="Admin key for the search service. If not provided, will use Azure CLI to get the key.")
     parser.add_argument("--azure-openai-endpoint", type=str, help="Endpoint for the (Azure) OpenAI API. Format: 'https://<AOAI resource name>.openai.azure.com/openai/deployments/<vision model name>/chat/completions?api-version=2024-04-01-preview'")
     parser.add_argument("--azure-openai-key", type=str, help="Key for the (Azure) OpenAI API.")
+    parser.add_argument("--manifest", type=str, help="Path to a SQLite manifest of the indexed files. If provided, re-runs only process the files that were added or changed, and delete the chunks of removed files.")
     args = parser.parse_args()
 
     with open(args.config) as f:
@@ -471,6 +567,11 @@ if __name__ == "__main__":
     if args.search_admin_key:
         os.environ["AZURE_SEARCH_ADMIN_KEY"] = args.search_admin_key
 
+    if args.form_rec_cache_dir:
+        # Through the environment, so the worker processes use it too
+        os.environ["FORM_RECOGNIZER_CACHE_DIR"] = args.form_rec_cache_dir
+        os.environ["FORM_RECOGNIZER_CACHE_MAX_MB"] = str(args.form_rec_cache_max_mb)
+
     if args.form_rec_resource and args.form_rec_key:
         os.environ["FORM_RECOGNIZER_ENDPOINT"] = f"https://{args.form_rec_resource}.cognitiveservices.azure.com/"
         os.environ["FORM_RECOGNIZER_KEY"] = args.form_rec_key
@@ -478,12 +579,16 @@ if __name__ == "__main__":
             form_recognizer_client = DocumentIntelligenceClient(endpoint=f"https://{args.form_rec_resource}.cognitiveservices.azure.com/", credential=AzureKeyCredential(args.form_rec_key))
         print(f"Using Form Recognizer resource {args.form_rec_resource} for PDF cracking, with the {'Layout' if args.form_rec_use_layout else 'Read'} model.")
 
+    manifest = IndexManifest(args.manifest) if args.manifest else None
+
     for index_config in config:
         print("Preparing data for index:", index_config["index_name"])
         if index_config.get("vector_config_name") and not args.embedding_model_endpoint:
             raise Exception("ERROR: Vector search is enabled in the config, but no embedding model endpoint and key were provided. Please provide these values or disable vector search.")
     
-        create_index(index_config, credential, form_recognizer_client, embedding_model_endpoint=args.embedding_model_endpoint, use_layout=args.form_rec_use_layout, njobs=args.njobs, captioning_model_endpoint=args.azure_openai_endpoint, captioning_model_key=args.azure_openai_key)
+        create_index(index_config, credential, form_recognizer_client, embedding_model_endpoint=args.embedding_model_endpoint, use_layout=args.form_rec_use_layout, njobs=args.njobs, captioning_model_endpoint=args.azure_openai_endpoint, captioning_model_key=args.azure_openai_key, manifest=manifest)
         print("Data preparation for index", index_config["index_name"], "completed")
 
+    if manifest:
+        manifest.close()
     print(f"Data preparation script completed. {len(config)} indexes updated.")
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Data utilities for index preparation."""
 import ast
+import hashlib
 import html
 import json
 import os
@@ -10,11 +11,13 @@ import tempfile
 import time
 import urllib.request
 from abc import ABC, abstractmethod
+from collections import deque
 from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
-from azure.ai.documentintelligence.models import AnalyzeDocumentRequest
+from itertools import islice
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple, Union
+from azure.ai.documentintelligence.models import AnalyzeDocumentRequest, AnalyzeResult
 import fitz
 import requests
 import base64
@@ -23,6 +26,7 @@ import markdown
 import requests
 import tiktoken
 from azure.ai.documentintelligence import DocumentIntelligenceClient
+from azure.ai.documentintelligence import __version__ as DOCUMENT_INTELLIGENCE_SDK_VERSION
 from azure.core.credentials import AzureKeyCredential
 from azure.identity import DefaultAzureCredential
 from azure.storage.blob import ContainerClient
@@ -32,6 +36,9 @@ from langchain.text_splitter import TextSplitter, MarkdownTextSplitter, Recursiv
 from openai import AzureOpenAI
 from tqdm import tqdm
 
+from analyze_cache import AnalyzeResultCache
+from throttling import Throttle
+
 # Configure environment variables  
 load_dotenv() # take environment variables from .env.
 
@@ -54,6 +61,16 @@ FILE_FORMAT_DICT = {
 
 RETRY_COUNT = 5
 
+# Limits for a single embeddings request during ingestion
+EMBEDDING_BATCH_MAX_INPUTS = 16
+EMBEDDING_BATCH_MAX_TOKENS = 8191 * 4
+
+# Retries and optional per minute budgets (e.g. EMBEDDING_RATE_LIMIT_TPM) for
+# each service, shared with the processes chunking a directory
+EMBEDDING_THROTTLE = Throttle.from_env("embeddings", "EMBEDDING", max_attempts=RETRY_COUNT)
+CAPTIONING_THROTTLE = Throttle.from_env("captioning", "CAPTIONING", max_attempts=RETRY_COUNT)
+FORM_RECOGNIZER_THROTTLE = Throttle.from_env("Document Intelligence", "FORM_RECOGNIZER", max_attempts=RETRY_COUNT)
+
 SENTENCE_ENDINGS = [".", "!", "?"]
 WORDS_BREAKS = list(reversed([",", ";", ":", " ", "(", ")", "[", "]", "{", "}", "\t", "\n"]))
 
@@ -506,6 +523,31 @@ class ChunkingResult:
     # some chunks might be skipped to small number of tokens
     skipped_chunks: int = 0
 
+    def add_counts(self, other: "ChunkingResult"):
+        """Adds the file counts of another result to this one."""
+        self.total_files += other.total_files
+        self.num_unsupported_format_files += other.num_unsupported_format_files
+        self.num_files_with_errors += other.num_files_with_errors
+        self.skipped_chunks += other.skipped_chunks
+
+
+def batched(iterable: Iterable, batch_size: int) -> Generator[List, None, None]:
+    """Yields lists of up to batch_size items from iterable."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def iter_chunks(results: Iterable[ChunkingResult], summary: ChunkingResult) -> Generator[Document, None, None]:
+    """Yields the chunks of each result in turn, adding its file counts to summary.
+
+    Lets uploads consume the output of iter_chunk_directory one chunk at a time
+    while still reporting the totals once they are done.
+    """
+    for result in results:
+        summary.add_counts(result)
+        yield from result.chunks
+
 def extractStorageDetailsFromUrl(url):
     matches = re.fullmatch(r'https:\/\/([^\/.]*)\.blob\.core\.windows\.net\/([^\/]*)\/(.*)', url)
     if not matches:
@@ -546,6 +588,27 @@ def get_files_recursively(directory_path: str) -> List[str]:
             file_paths.append(file_path)
     return file_paths
 
+def file_sha256(file_path: str) -> str:
+    """Hex SHA-256 of the content of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def content_chunk_id(filepath: str, content: str, occurrence: int = 0, source: str = "") -> str:
+    """Search document key for a chunk, derived from its data source, file and content.
+
+    Unchanged chunks keep their key across runs, so re-indexing a file only
+    replaces the chunks that changed. occurrence tells identical chunks of
+    the same file apart, and source the same file in data sources that share
+    an index.
+    """
+    key = f"{source}\0{filepath}\0{content}\0{occurrence}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
 def convert_escaped_to_posix(escaped_path):
     windows_path = escaped_path.replace("\\\\", "\\")
     posix_path = windows_path.replace("\\", "/")
@@ -590,14 +653,45 @@ def polygon_to_bbox(polygon, dpi=72):
     x1, y1 = max(x_coords)*dpi, max(y_coords)*dpi
     return x0, y0, x1, y1
 
+_ANALYZE_RESULT_CACHE = None
+
+def get_analyze_result_cache() -> Optional[AnalyzeResultCache]:
+    """The Document Intelligence result cache in FORM_RECOGNIZER_CACHE_DIR, if set, capped at FORM_RECOGNIZER_CACHE_MAX_MB."""
+    global _ANALYZE_RESULT_CACHE
+    directory = os.getenv("FORM_RECOGNIZER_CACHE_DIR")
+    if not directory:
+        return None
+    if _ANALYZE_RESULT_CACHE is None or _ANALYZE_RESULT_CACHE.directory != directory:
+        max_bytes = int(float(os.getenv("FORM_RECOGNIZER_CACHE_MAX_MB", 2048)) * 1024 ** 2)
+        _ANALYZE_RESULT_CACHE = AnalyzeResultCache(directory, max_bytes)
+    return _ANALYZE_RESULT_CACHE
+
+
+def analyze_document(file_path, form_recognizer_client, model):
+    """Analyzes a file with Document Intelligence, reusing the cached result of an earlier run if there is one."""
+    cache = get_analyze_result_cache()
+    if cache:
+        # The clients use the API version the SDK pins, so results are keyed by the SDK version
+        cache_key = cache.key(file_sha256(file_path), model, DOCUMENT_INTELLIGENCE_SDK_VERSION)
+        cached_result = cache.get(cache_key)
+        if cached_result is not None:
+            return AnalyzeResult(cached_result)
+
+    base64file = base64.b64encode(open(file_path, "rb").read()).decode()
+    form_recognizer_results = FORM_RECOGNIZER_THROTTLE.call(
+        lambda: form_recognizer_client.begin_analyze_document(model, AnalyzeDocumentRequest(bytes_source=base64file)).result()
+    )
+    if cache:
+        cache.put(cache_key, form_recognizer_results.as_dict())
+    return form_recognizer_results
+
+
 def extract_pdf_content(file_path, form_recognizer_client, use_layout=False): 
     offset = 0
     page_map = []
     model = "prebuilt-layout" if use_layout else "prebuilt-read"
     
-    base64file = base64.b64encode(open(file_path, "rb").read()).decode()
-    poller = form_recognizer_client.begin_analyze_document(model, AnalyzeDocumentRequest(bytes_source=base64file))
-    form_recognizer_results = poller.result()
+    form_recognizer_results = analyze_document(file_path, form_recognizer_client, model)
 
     # (if using layout) mark all the positions of headers
     roles_start = {}
@@ -742,58 +836,123 @@ def get_payload_and_headers_cohere(
         "Authorization": f"Bearer {aad_token}",
     }
 
-    cohere_body = { "texts": [text], "input_type": "search_document" }
+    texts = text if isinstance(text, list) else [text]
+    cohere_body = { "texts": texts, "input_type": "search_document" }
     return cohere_body, oai_headers
-    
-def get_embedding(text, embedding_model_endpoint=None, embedding_model_key=None, azure_credential=None):
-    endpoint = embedding_model_endpoint if embedding_model_endpoint else os.environ.get("EMBEDDING_MODEL_ENDPOINT")
-    
-    FLAG_EMBEDDING_MODEL = os.getenv("FLAG_EMBEDDING_MODEL", "AOAI")
-    FLAG_COHERE = os.getenv("FLAG_COHERE", "ENGLISH")
-    FLAG_AOAI = os.getenv("FLAG_AOAI", "V3")
 
-    if azure_credential is None and (endpoint is None or key is None):
-        raise Exception("EMBEDDING_MODEL_ENDPOINT and EMBEDDING_MODEL_KEY are required for embedding")
 
-    try:
-        if FLAG_EMBEDDING_MODEL == "AOAI":
-            endpoint_parts = endpoint.split("/openai/deployments/")
+class Embedder:
+    """Embeds texts in batches with one client per embedding endpoint.
+
+    Texts are sent in batches of at most max_batch_inputs texts and
+    max_batch_tokens tokens, and the vectors are returned in the order of the
+    texts. With an azure_credential, the AAD token is cached and only
+    refreshed shortly before it expires.
+    """
+    # Refresh the AAD token this many seconds before it expires
+    TOKEN_REFRESH_MARGIN = 300
+
+    def __init__(self, embedding_model_endpoint=None, embedding_model_key=None, azure_credential=None,
+                 max_batch_inputs: int = EMBEDDING_BATCH_MAX_INPUTS, max_batch_tokens: int = EMBEDDING_BATCH_MAX_TOKENS):
+        self.endpoint = embedding_model_endpoint if embedding_model_endpoint else os.environ.get("EMBEDDING_MODEL_ENDPOINT")
+        self.azure_credential = azure_credential
+        self.max_batch_inputs = max_batch_inputs
+        self.max_batch_tokens = max_batch_tokens
+        self.model = os.getenv("FLAG_EMBEDDING_MODEL", "AOAI")
+        self._access_token = None
+
+        if self.endpoint is None or (azure_credential is None and embedding_model_key is None and self.model != "AOAI"):
+            raise Exception("EMBEDDING_MODEL_ENDPOINT and EMBEDDING_MODEL_KEY are required for embedding")
+
+        if self.model == "AOAI":
+            endpoint_parts = self.endpoint.split("/openai/deployments/")
             base_url = endpoint_parts[0]
-            deployment_id = endpoint_parts[1].split("/embeddings")[0]
+            self.deployment_id = endpoint_parts[1].split("/embeddings")[0]
             api_version = endpoint_parts[1].split("api-version=")[1].split("&")[0]
+            self.dimensions = int(os.getenv("VECTOR_DIMENSION", 1536)) if os.getenv("FLAG_AOAI", "V3") == "V3" else None
             if azure_credential is not None:
-                api_key = azure_credential.get_token("https://cognitiveservices.azure.com/.default").token
+                self.client = AzureOpenAI(api_version=api_version, azure_endpoint=base_url, azure_ad_token_provider=self._get_aad_token, max_retries=0)
             else:
                 api_key = embedding_model_key if embedding_model_key else os.getenv("AZURE_OPENAI_API_KEY")
-            
-            client = AzureOpenAI(api_version=api_version, azure_endpoint=base_url, api_key=api_key)
-            if FLAG_AOAI == "V2":
-                embeddings = client.embeddings.create(model=deployment_id, input=text)
-            elif FLAG_AOAI == "V3":   
-                embeddings = client.embeddings.create(model=deployment_id, 
-                                                      input=text, 
-                                                      dimensions=int(os.getenv("VECTOR_DIMENSION", 1536)))
-            
-            return embeddings.model_dump()['data'][0]['embedding']
-        
-        if FLAG_EMBEDDING_MODEL == "COHERE":
-            if FLAG_COHERE == "MULTILINGUAL":
-                key = embedding_model_key if embedding_model_key else os.getenv("COHERE_MULTILINGUAL_API_KEY")
-            elif FLAG_COHERE == "ENGLISH":
-                key = embedding_model_key if embedding_model_key else os.getenv("COHERE_ENGLISH_API_KEY")
-            data, headers = get_payload_and_headers_cohere(text, key)
-
-            body = str.encode(json.dumps(data))
-            req = urllib.request.Request(endpoint, body, headers)
-            response = urllib.request.urlopen(req)
-            result = response.read()
-            result_content = json.loads(result.decode('utf-8'))
-                        
-            return result_content["embeddings"][0]   
-        
+                self.client = AzureOpenAI(api_version=api_version, azure_endpoint=base_url, api_key=api_key, max_retries=0)
+        elif self.model == "COHERE":
+            if os.getenv("FLAG_COHERE", "ENGLISH") == "MULTILINGUAL":
+                self.key = embedding_model_key if embedding_model_key else os.getenv("COHERE_MULTILINGUAL_API_KEY")
+            else:
+                self.key = embedding_model_key if embedding_model_key else os.getenv("COHERE_ENGLISH_API_KEY")
+        else:
+            raise Exception(f"Unsupported embedding model {self.model}")
+
+    def _get_aad_token(self) -> str:
+        if self._access_token is None or self._access_token.expires_on - self.TOKEN_REFRESH_MARGIN < time.time():
+            self._access_token = self.azure_credential.get_token("https://cognitiveservices.azure.com/.default")
+        return self._access_token.token
+
+    def batches(self, texts: List[str]) -> Generator[Tuple[List[str], int], None, None]:
+        """Splits texts into batches within the input count and token budgets, with the tokens of each batch."""
+        batch = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = TOKEN_ESTIMATOR.estimate_tokens(text)
+            if batch and (len(batch) == self.max_batch_inputs or batch_tokens + tokens > self.max_batch_tokens):
+                yield batch, batch_tokens
+                batch = []
+                batch_tokens = 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            yield batch, batch_tokens
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        if self.model == "AOAI":
+            kwargs = {"dimensions": self.dimensions} if self.dimensions else {}
+            response = self.client.embeddings.with_raw_response.create(model=self.deployment_id, input=texts, **kwargs)
+            EMBEDDING_THROTTLE.update(response.headers)
+            embeddings = response.parse()
+            # The service doesn't promise to return the vectors in input order
+            return [item.embedding for item in sorted(embeddings.data, key=lambda item: item.index)]
+
+        data, headers = get_payload_and_headers_cohere(texts, self.key)
+        body = str.encode(json.dumps(data))
+        req = urllib.request.Request(self.endpoint, body, headers)
+        response = urllib.request.urlopen(req)
+        EMBEDDING_THROTTLE.update(response.headers)
+        result = response.read()
+        result_content = json.loads(result.decode('utf-8'))
+        return result_content["embeddings"]
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """Returns the embedding of each text, sending the batches through EMBEDDING_THROTTLE."""
+        vectors = []
+        for batch, batch_tokens in self.batches(texts):
+            try:
+                batch_vectors = EMBEDDING_THROTTLE.call(self._embed_batch, batch, tokens=batch_tokens)
+            except Exception as e:
+                raise Exception(f"Error getting embeddings with endpoint={self.endpoint} with error={e}")
+            if len(batch_vectors) != len(batch):
+                raise Exception(f"Got {len(batch_vectors)} embeddings for {len(batch)} chunks from endpoint={self.endpoint}")
+            vectors.extend(batch_vectors)
+        return vectors
 
+
+# Embedders by endpoint, so each process reuses its clients and tokens across files
+_EMBEDDERS: Dict[Tuple, Embedder] = {}
+
+def get_embedder(embedding_model_endpoint=None, embedding_model_key=None, azure_credential=None) -> Embedder:
+    # Credentials are pickled for every file sent to a worker process, so they
+    # can't be part of the key; one credential per endpoint is assumed
+    cache_key = (embedding_model_endpoint, embedding_model_key, azure_credential is None)
+    if cache_key not in _EMBEDDERS:
+        _EMBEDDERS[cache_key] = Embedder(embedding_model_endpoint, embedding_model_key, azure_credential)
+    return _EMBEDDERS[cache_key]
+
+
+def get_embedding(text, embedding_model_endpoint=None, embedding_model_key=None, azure_credential=None):
+    try:
+        embedder = get_embedder(embedding_model_endpoint, embedding_model_key, azure_credential)
+        return embedder.embed([text])[0]
     except Exception as e:
-        raise Exception(f"Error getting embeddings with endpoint={endpoint} with error={e}")
+        raise Exception(f"Error getting embeddings with endpoint={embedding_model_endpoint} with error={e}")
 
 
 def chunk_content_helper(
@@ -888,17 +1047,6 @@ def chunk_content(
         skipped_chunks = 0
         for chunk, chunk_size, doc in chunked_context:
             if chunk_size >= min_chunk_size:
-                if add_embeddings:
-                    for i in range(RETRY_COUNT):
-                        try:
-                            doc.contentVector = get_embedding(chunk, azure_credential=azure_credential, embedding_model_endpoint=embedding_endpoint)
-                            break
-                        except Exception as e:
-                            print(f"Error getting embedding for chunk with error={e}, retrying, current at {i + 1} retry, {RETRY_COUNT - (i + 1)} retries left")
-                            time.sleep(30)
-                    if doc.contentVector is None:
-                        raise Exception(f"Error getting embedding for chunk={chunk}")
-                    
                 doc.image_mapping = {}
                 for key, value in image_mapping.items():
                     if key in chunk:
@@ -916,6 +1064,12 @@ def chunk_content(
             else:
                 skipped_chunks += 1
 
+        if add_embeddings and chunks:
+            embedder = get_embedder(embedding_endpoint, azure_credential=azure_credential)
+            vectors = embedder.embed([chunk.content for chunk in chunks])
+            for chunk, vector in zip(chunks, vectors):
+                chunk.contentVector = vector
+
     except UnsupportedFormatError as e:
         if ignore_errors:
             return ChunkingResult(
@@ -979,17 +1133,16 @@ def get_caption(image_path, captioning_model_endpoint, captioning_model_key):
         "temperature": 0
     }
 
-    for i in range(RETRY_COUNT):
-        try:
-            response = requests.post(captioning_model_endpoint, headers=headers, json=payload)
-            response.raise_for_status()  # Will raise an HTTPError if the HTTP request returned an unsuccessful status code
-            break
-        except Exception as e:
-            print(f"Error getting caption with error={e}, retrying, current at {i + 1} retry, {RETRY_COUNT - (i + 1)} retries left")
-            time.sleep(15)
-
-    if response.status_code != 200:
-        raise Exception(f"Error getting caption with status_code={response.status_code}")
+    def post_caption_request():
+        response = requests.post(captioning_model_endpoint, headers=headers, json=payload)
+        response.raise_for_status()  # Will raise an HTTPError if the HTTP request returned an unsuccessful status code
+        CAPTIONING_THROTTLE.update(response.headers)
+        return response
+
+    try:
+        response = CAPTIONING_THROTTLE.call(post_caption_request)
+    except Exception as e:
+        raise Exception(f"Error getting caption with error={e}")
     
     caption = response.json()["choices"][0]["message"]["content"]
     img_tag = image_content_to_tag(caption)
@@ -1085,7 +1238,9 @@ def process_file(
         azure_credential = None,
         embedding_endpoint = None,
         captioning_model_endpoint = None,
-        captioning_model_key = None
+        captioning_model_key = None,
+        content_ids: bool = False,
+        source: str = ""
     ):
 
     if not form_recognizer_client:
@@ -1115,7 +1270,12 @@ def process_file(
             captioning_model_endpoint=captioning_model_endpoint,
             captioning_model_key=captioning_model_key
         )
+        occurrences = {}
         for chunk_idx, chunk_doc in enumerate(result.chunks):
+            if content_ids:
+                occurrence = occurrences.get(chunk_doc.content, 0)
+                occurrences[chunk_doc.content] = occurrence + 1
+                chunk_doc.id = content_chunk_id(rel_file_path, chunk_doc.content, occurrence, source)
             chunk_doc.filepath = rel_file_path
             chunk_doc.metadata = json.dumps({"chunk_id": str(chunk_idx)})
             chunk_doc.image_mapping = json.dumps(chunk_doc.image_mapping) if chunk_doc.image_mapping else None
@@ -1128,7 +1288,7 @@ def process_file(
         result =None
     return result, is_error
 
-def chunk_blob_container(
+def iter_chunk_blob_container(
         blob_url: str,
         credential,
         ignore_errors: bool = True,
@@ -1142,14 +1302,19 @@ def chunk_blob_container(
         njobs=4,
         add_embeddings = False,
         azure_credential = None,
-        embedding_endpoint = None
-):
+        embedding_endpoint = None,
+        batch_size: Optional[int] = None
+) -> Generator[ChunkingResult, None, None]:
+    """
+    Downloads the given blob container and chunks it like iter_chunk_directory.
+    The downloaded files are removed once the generator is exhausted or closed.
+    """
     with tempfile.TemporaryDirectory() as local_data_folder:
         print(f'Downloading {blob_url} to local folder')
         downloadBlobUrlToLocalFolder(blob_url, local_data_folder, credential)
         print(f'Downloaded.')
 
-        result = chunk_directory(
+        yield from iter_chunk_directory(
             local_data_folder,
             ignore_errors=ignore_errors,
             num_tokens=num_tokens,
@@ -1162,13 +1327,81 @@ def chunk_blob_container(
             njobs=njobs,
             add_embeddings=add_embeddings,
             azure_credential=azure_credential,
-            embedding_endpoint=embedding_endpoint
+            embedding_endpoint=embedding_endpoint,
+            batch_size=batch_size
         )
 
-    return result
 
+def chunk_blob_container(*args, **kwargs) -> ChunkingResult:
+    """
+    Downloads and chunks the given blob container, collecting every chunk in memory.
+    Takes the same arguments as iter_chunk_blob_container.
+    """
+    return _collect_chunking_results(iter_chunk_blob_container(*args, **kwargs))
+
+
+def _share_throttles(embedding_throttle, captioning_throttle, form_recognizer_throttle):
+    """Makes a worker process use the throttles of the process that started it."""
+    global EMBEDDING_THROTTLE, CAPTIONING_THROTTLE, FORM_RECOGNIZER_THROTTLE
+    EMBEDDING_THROTTLE = embedding_throttle
+    CAPTIONING_THROTTLE = captioning_throttle
+    FORM_RECOGNIZER_THROTTLE = form_recognizer_throttle
 
-def chunk_directory(
+
+def _process_files(files_to_process: List[str], process_file_partial, njobs: int) -> Generator[ChunkingResult, None, None]:
+    """Chunks the files in order, yielding one ChunkingResult per file."""
+    def to_chunking_result(result, is_error):
+        if is_error:
+            return ChunkingResult(chunks=[], total_files=1, num_files_with_errors=1)
+        result.total_files = 1
+        return result
+
+    if njobs == 1:
+        for file_path in tqdm(files_to_process):
+            yield to_chunking_result(*process_file_partial(file_path))
+        return
+
+    throttles = (EMBEDDING_THROTTLE, CAPTIONING_THROTTLE, FORM_RECOGNIZER_THROTTLE)
+    with ProcessPoolExecutor(max_workers=njobs, initializer=_share_throttles, initargs=throttles) as executor:
+        # Only keep a couple of files per worker in flight, so chunked files
+        # the consumer hasn't got to yet can't pile up in memory
+        files = iter(files_to_process)
+        pending = deque(executor.submit(process_file_partial, file_path) for file_path in islice(files, 2 * njobs))
+        with tqdm(total=len(files_to_process)) as progress:
+            while pending:
+                result, is_error = pending.popleft().result()
+                for file_path in islice(files, 1):
+                    pending.append(executor.submit(process_file_partial, file_path))
+                progress.update(1)
+                yield to_chunking_result(result, is_error)
+
+
+def _batch_chunking_results(results: Iterable[ChunkingResult], batch_size: int) -> Generator[ChunkingResult, None, None]:
+    """Regroups per file results into results of batch_size chunks.
+
+    File counts are added to the batch that is being filled when the file is done.
+    """
+    batch = ChunkingResult(chunks=[], total_files=0)
+    for result in results:
+        batch.add_counts(result)
+        for chunk in result.chunks:
+            batch.chunks.append(chunk)
+            if len(batch.chunks) == batch_size:
+                yield batch
+                batch = ChunkingResult(chunks=[], total_files=0)
+    if batch.chunks or batch.total_files:
+        yield batch
+
+
+def _collect_chunking_results(results: Iterable[ChunkingResult]) -> ChunkingResult:
+    collected = ChunkingResult(chunks=[], total_files=0)
+    for result in results:
+        collected.chunks.extend(result.chunks)
+        collected.add_counts(result)
+    return collected
+
+
+def iter_chunk_directory(
         directory_path: str,
         ignore_errors: bool = True,
         num_tokens: int = 1024,
@@ -1183,10 +1416,15 @@ def chunk_directory(
         azure_credential = None,
         embedding_endpoint = None,
         captioning_model_endpoint = None,
-        captioning_model_key = None
-):
+        captioning_model_key = None,
+        batch_size: Optional[int] = None,
+        file_paths: Optional[List[str]] = None,
+        content_ids: bool = False,
+        source: str = ""
+) -> Generator[ChunkingResult, None, None]:
     """
-    Chunks the given directory recursively
+    Chunks the given directory recursively, yielding the chunks as files are processed
+    so they can be uploaded without holding the whole directory in memory.
     Args:
         directory_path (str): The directory to chunk.
         ignore_errors (bool): If true, ignores errors and returns None.
@@ -1200,69 +1438,56 @@ def chunk_directory(
         form_recognizer_client: Optional form recognizer client to use for pdf files.
         use_layout (bool): If true, uses Layout model for pdf files. Otherwise, uses Read.
         add_embeddings (bool): If true, adds a vector embedding to each chunk using the embedding model endpoint and key.
-
-    Returns:
-        List[Document]: List of chunked documents.
+        batch_size (int): If set, yields results of batch_size chunks (the last one may be smaller) instead of one result per file.
+        file_paths (List[str]): If set, only chunks these files of the directory instead of all of them.
+        content_ids (bool): If true, gives each chunk an id derived from its source, file and content
+                            (see content_chunk_id). Otherwise chunks have no id and get their position when uploaded.
+        source (str): The data source the directory was loaded from, part of the content ids so that
+                            sources sharing an index can have files with the same relative path.
+
+    Yields:
+        ChunkingResult: The chunks and file counts of each file, in the order of file_paths if given,
+            or of each batch of chunks.
     """
-    chunks = []
-    total_files = 0
-    num_unsupported_format_files = 0
-    num_files_with_errors = 0
-    skipped_chunks = 0
-
     all_files_directory = get_files_recursively(directory_path)
-    files_to_process = [file_path for file_path in all_files_directory if os.path.isfile(file_path)]
+    if file_paths is None:
+        files_to_process = [file_path for file_path in all_files_directory if os.path.isfile(file_path)]
+    else:
+        files_to_process = list(file_paths)
     print(f"Total files to process={len(files_to_process)} out of total directory size={len(all_files_directory)}")
 
-
-    if njobs==1:
+    if njobs == 1:
         print("Single process to chunk and parse the files. --njobs > 1 can help performance.")
-        for file_path in tqdm(files_to_process):
-            total_files += 1
-            result, is_error = process_file(file_path=file_path,directory_path=directory_path, ignore_errors=ignore_errors,
-                                       num_tokens=num_tokens,
-                                       min_chunk_size=min_chunk_size, url_prefix=url_prefix,
-                                       token_overlap=token_overlap,
-                                       extensions_to_process=extensions_to_process,
-                                       form_recognizer_client=form_recognizer_client, use_layout=use_layout, add_embeddings=add_embeddings,
-                                       azure_credential=azure_credential, embedding_endpoint=embedding_endpoint,
-                                       captioning_model_endpoint=captioning_model_endpoint, captioning_model_key=captioning_model_key)
-            if is_error:
-                num_files_with_errors += 1
-                continue
-            chunks.extend(result.chunks)
-            num_unsupported_format_files += result.num_unsupported_format_files
-            num_files_with_errors += result.num_files_with_errors
-            skipped_chunks += result.skipped_chunks
-    elif njobs > 1:
+    else:
         print(f"Multiprocessing with njobs={njobs}")
-        process_file_partial = partial(process_file, directory_path=directory_path, ignore_errors=ignore_errors,
-                                       num_tokens=num_tokens,
-                                       min_chunk_size=min_chunk_size, url_prefix=url_prefix,
-                                       token_overlap=token_overlap,
-                                       extensions_to_process=extensions_to_process,
-                                       form_recognizer_client=None, use_layout=use_layout, add_embeddings=add_embeddings,
-                                       azure_credential=azure_credential, embedding_endpoint=embedding_endpoint,
-                                       captioning_model_endpoint=captioning_model_endpoint, captioning_model_key=captioning_model_key)
-        with ProcessPoolExecutor(max_workers=njobs) as executor:
-            futures = list(tqdm(executor.map(process_file_partial, files_to_process), total=len(files_to_process)))
-            for result, is_error in futures:
-                total_files += 1
-                if is_error:
-                    num_files_with_errors += 1
-                    continue
-                chunks.extend(result.chunks)
-                num_unsupported_format_files += result.num_unsupported_format_files
-                num_files_with_errors += result.num_files_with_errors
-                skipped_chunks += result.skipped_chunks
+        # Each worker process creates its own client
+        form_recognizer_client = None
+
+    process_file_partial = partial(process_file, directory_path=directory_path, ignore_errors=ignore_errors,
+                                   num_tokens=num_tokens,
+                                   min_chunk_size=min_chunk_size, url_prefix=url_prefix,
+                                   token_overlap=token_overlap,
+                                   extensions_to_process=extensions_to_process,
+                                   form_recognizer_client=form_recognizer_client, use_layout=use_layout, add_embeddings=add_embeddings,
+                                   azure_credential=azure_credential, embedding_endpoint=embedding_endpoint,
+                                   captioning_model_endpoint=captioning_model_endpoint, captioning_model_key=captioning_model_key,
+                                   content_ids=content_ids, source=source)
+
+    results = _process_files(files_to_process, process_file_partial, njobs)
+    if batch_size:
+        results = _batch_chunking_results(results, batch_size)
+    yield from results
+
+
+def chunk_directory(*args, **kwargs) -> ChunkingResult:
+    """
+    Chunks the given directory recursively, collecting every chunk in memory.
+    Takes the same arguments as iter_chunk_directory; prefer it for large directories.
 
-    return ChunkingResult(
-            chunks=chunks,
-            total_files=total_files,
-            num_unsupported_format_files=num_unsupported_format_files,
-            num_files_with_errors=num_files_with_errors,
-            skipped_chunks=skipped_chunks,
-        )
+    Returns:
+        ChunkingResult: The chunks and file counts of the whole directory.
+    """
+    return _collect_chunking_results(iter_chunk_directory(*args, **kwargs))
 
 
 class SingletonFormRecognizerClient:
@@ -1,13 +1,13 @@
 import argparse
-from asyncio import sleep
 import json
 
 from azure.identity import DefaultAzureCredential
 from azure.keyvault.secrets import SecretClient
 
-from data_utils import get_embedding
+from data_utils import Embedder, batched
 
-RETRY_COUNT = 5
+# Number of documents read and written at a time
+DOCUMENT_BATCH_SIZE = 256
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -48,20 +48,14 @@ if __name__ == "__main__":
 
         # Embed documents
         print("Generating embeddings...")
+        embedder = Embedder(embedding_endpoint, embedding_key)
         with open(args.input_data_path) as input_file, open(args.output_file_path, "w") as output_file:
-            for line in input_file:
-                document = json.loads(line)
-                # Sleep/Retry in case embedding model is rate limited.
-                for _ in range(RETRY_COUNT):
-                    try:
-                        embedding = get_embedding(document["content"], embedding_endpoint,  embedding_key)
-                        document["contentVector"] = embedding
-                        break
-                    except:
-                        print("Error generating embedding. Retrying...")
-                        sleep(30)
-                
-                output_file.write(json.dumps(document) + "\n")
+            for lines in batched(input_file, DOCUMENT_BATCH_SIZE):
+                documents = [json.loads(line) for line in lines]
+                # Embedder sends them in batches and retries in case the embedding model is rate limited
+                vectors = embedder.embed([document["content"] for document in documents])
+                for document, vector in zip(documents, vectors):
+                    document["contentVector"] = vector
+                    output_file.write(json.dumps(document) + "\n")
 
         print("Embeddings generated and saved to {}.".format(args.output_file_path))
-
@@ -0,0 +1,97 @@
+"""Local record of the files in a search index, for incremental re-indexing."""
+import sqlite3
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+
+class IndexManifest:
+    """SQLite manifest of the indexed files and the ids of their chunks.
+
+    Files are recorded per index and data source with the hash of their
+    content and of the parameters they were chunked with, so a re-run only
+    needs to process the files that were added or changed since, and knows
+    which chunks to delete for the files that changed or were removed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    index_name TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    filepath TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    params_hash TEXT NOT NULL,
+                    indexed_at TEXT NOT NULL,
+                    PRIMARY KEY (index_name, source, filepath)
+                )""")
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS chunks (
+                    index_name TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    filepath TEXT NOT NULL,
+                    chunk_id TEXT NOT NULL,
+                    PRIMARY KEY (index_name, source, filepath, chunk_id)
+                )""")
+
+    def plan(self, index_name: str, source: str, content_hashes: Dict[str, str], params_hash: str) -> Tuple[List[str], List[str]]:
+        """Compares the files of a source with the manifest.
+
+        Args:
+            content_hashes (Dict[str, str]): The content hash of each file in the source, by relative path.
+            params_hash (str): The hash of the chunking parameters of this run.
+
+        Returns:
+            Tuple[List[str], List[str]]: The files that are new or changed (content or
+            chunking parameters), and the recorded files that are no longer in the source.
+        """
+        recorded = {
+            filepath: (content_hash, recorded_params_hash)
+            for filepath, content_hash, recorded_params_hash in self.connection.execute(
+                "SELECT filepath, content_hash, params_hash FROM files WHERE index_name = ? AND source = ?",
+                (index_name, source)
+            )
+        }
+        changed = [
+            filepath for filepath, content_hash in content_hashes.items()
+            if recorded.get(filepath) != (content_hash, params_hash)
+        ]
+        removed = [filepath for filepath in recorded if filepath not in content_hashes]
+        return changed, removed
+
+    def chunk_ids(self, index_name: str, source: str, filepath: str) -> List[str]:
+        return [
+            chunk_id for chunk_id, in self.connection.execute(
+                "SELECT chunk_id FROM chunks WHERE index_name = ? AND source = ? AND filepath = ?",
+                (index_name, source, filepath)
+            )
+        ]
+
+    def record(self, index_name: str, source: str, filepath: str, content_hash: str, params_hash: str, chunk_ids: List[str]):
+        """Records a file as indexed with the given chunks, replacing what was recorded for it before."""
+        with self.connection:
+            self._delete(index_name, source, filepath)
+            self.connection.execute(
+                "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                (index_name, source, filepath, content_hash, params_hash, datetime.utcnow().isoformat())
+            )
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO chunks VALUES (?, ?, ?, ?)",
+                [(index_name, source, filepath, chunk_id) for chunk_id in chunk_ids]
+            )
+
+    def remove(self, index_name: str, source: str, filepath: str):
+        with self.connection:
+            self._delete(index_name, source, filepath)
+
+    def _delete(self, index_name: str, source: str, filepath: str):
+        for table in ("files", "chunks"):
+            self.connection.execute(
+                f"DELETE FROM {table} WHERE index_name = ? AND source = ? AND filepath = ?",
+                (index_name, source, filepath)
+            )
+
+    def close(self):
+        self.connection.close()
@@ -12,9 +12,9 @@ from azure.ai.formrecognizer import DocumentAnalysisClient
 from azure.core.credentials import AzureKeyCredential
 from azure.identity import AzureCliCredential
 
-from typing import List
+from typing import Iterable
 
-from data_utils import chunk_directory
+from data_utils import ChunkingResult, batched, iter_chunk_directory, iter_chunks
 
 SUPPORTED_LANGUAGE_CODES = {
     "ar": "Arabic",
@@ -101,27 +101,44 @@ def create_or_update_vector_search_index(
      
 def upsert_documents_to_index(
         index_name: str,
-        docs: List[Document]
+        docs: Iterable[Document],
+        upsert_batch_size: int = 100
         ):
-    
+    """Upserts the documents in batches as docs is iterated, returning the number of documents upserted.
+
+    A failed batch doesn't stop the remaining ones, but the upsert raises once
+    all of them have been tried.
+    """
     index = pinecone.Index(index_name)
-    for document in docs:
-        finalDocChunk:dict = {}
-        finalDocChunk["id"] = f"{uuid.uuid4()}"
-        finalDocChunk['title'] = document.title
-        finalDocChunk["filepath"] = document.filepath
-        finalDocChunk["url"] = ""
-        finalDocChunk["content"] = document.content
-        finalDocChunk["contentvector"] = document.contentVector
+    num_upserted = 0
+    num_failures = 0
+    errors = set()
+    for batch in batched(docs, upsert_batch_size):
+        vectors = []
+        for document in batch:
+            finalDocChunk:dict = {}
+            finalDocChunk["id"] = f"{uuid.uuid4()}"
+            finalDocChunk['title'] = document.title
+            finalDocChunk["filepath"] = document.filepath
+            finalDocChunk["url"] = ""
+            finalDocChunk["content"] = document.content
+            finalDocChunk["contentvector"] = document.contentVector
+            vectors.append((finalDocChunk["id"],finalDocChunk["contentvector"], {"title":finalDocChunk['title'], "filepath":finalDocChunk['filepath'],"url":finalDocChunk['url'],"content":finalDocChunk['content']}))
 
         try:
-            index.upsert([(finalDocChunk["id"],finalDocChunk["contentvector"], {"title":finalDocChunk['title'], "filepath":finalDocChunk['filepath'],"url":finalDocChunk['url'],"content":finalDocChunk['content']})])
-
-            print(f"Upsert doc chunk {document.id} successfully")
+            index.upsert(vectors)
+            num_upserted += len(vectors)
+            print(f"Upserted {len(vectors)} doc chunks successfully")
         
         except Exception as e:
-            print(f"Failed to upsert doc chunk {document.id}")
-            continue
+            print(f"Failed to upsert {len(vectors)} doc chunks: {e}")
+            num_failures += len(vectors)
+            errors.add(str(e))
+
+    if num_failures > 0:
+        raise Exception(f"INDEXING FAILED for {num_failures} doc chunks, {num_upserted} were upserted. "
+                        f"Please recreate the index. \n Error Messages: {list(errors)}")
+    return num_upserted
 
 def validate_index(
         index_name):
@@ -163,21 +180,22 @@ def create_index(config, credential, form_recognizer_client=None, embedding_mode
     print("Chunking directory...")
     add_embeddings = True
 
-    result = chunk_directory(config["data_path"], num_tokens=config["chunk_size"], token_overlap=config.get("token_overlap",0),
+    results = iter_chunk_directory(config["data_path"], num_tokens=config["chunk_size"], token_overlap=config.get("token_overlap",0),
                              azure_credential=credential, form_recognizer_client=form_recognizer_client, use_layout=use_layout, njobs=njobs,
                              add_embeddings=add_embeddings, embedding_endpoint=embedding_model_endpoint)
 
-    if len(result.chunks) == 0:
-        raise Exception("No chunks found. Please check the data path and chunk size.")
+    # upsert documents to index as they are chunked
+    print("Upserting documents to index...")
+    summary = ChunkingResult(chunks=[], total_files=0)
+    num_chunks = upsert_documents_to_index(index_name, iter_chunks(results, summary))
 
-    print(f"Processed {result.total_files} files")
-    print(f"Unsupported formats: {result.num_unsupported_format_files} files")
-    print(f"Files with errors: {result.num_files_with_errors} files")
-    print(f"Found {len(result.chunks)} chunks")
+    if num_chunks == 0:
+        raise Exception("No chunks found. Please check the data path and chunk size.")
 
-    # upsert documents to index
-    print("Upserting documents to index...")
-    upsert_documents_to_index(index_name, result.chunks)
+    print(f"Processed {summary.total_files} files")
+    print(f"Unsupported formats: {summary.num_unsupported_format_files} files")
+    print(f"Files with errors: {summary.num_files_with_errors} files")
+    print(f"Upserted {num_chunks} chunks")
 
     # check if index is ready/validate index
     print("Validating index...")
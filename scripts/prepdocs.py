@@ -23,7 +23,7 @@ from azure.search.documents import SearchClient
 from azure.ai.formrecognizer import DocumentAnalysisClient
 
 
-from data_utils import chunk_directory
+from data_utils import ChunkingResult, batched, iter_chunk_directory, iter_chunks
 
 
 def create_search_index(index_name, index_client):
@@ -76,38 +76,38 @@ def create_search_index(index_name, index_client):
 
 
 def upload_documents_to_index(docs, search_client, upload_batch_size=50):
-    to_upload_dicts = []
-
-    id = 0
-    for document in docs:
-        d = dataclasses.asdict(document)
-        # add id to documents
-        d.update({"@search.action": "upload", "id": str(id)})
-        if "contentVector" in d and d["contentVector"] is None:
-            del d["contentVector"]
-        to_upload_dicts.append(d)
-        id += 1
+    """Uploads the documents in batches as docs is iterated, returning the number of documents uploaded."""
+    def to_upload_dicts():
+        for id, document in enumerate(docs):
+            d = dataclasses.asdict(document)
+            # add id to documents
+            d.update({"@search.action": "upload", "id": d.get("id") or str(id)})
+            if "contentVector" in d and d["contentVector"] is None:
+                del d["contentVector"]
+            yield d
 
     # Upload the documents in batches of upload_batch_size
-    for i in tqdm(
-        range(0, len(to_upload_dicts), upload_batch_size), desc="Indexing Chunks..."
-    ):
-        batch = to_upload_dicts[i : i + upload_batch_size]
-        results = search_client.upload_documents(documents=batch)
-        num_failures = 0
-        errors = set()
-        for result in results:
-            if not result.succeeded:
-                print(
-                    f"Indexing Failed for {result.key} with ERROR: {result.error_message}"
+    num_uploaded = 0
+    with tqdm(desc="Indexing Chunks...", unit=" chunks") as progress:
+        for batch in batched(to_upload_dicts(), upload_batch_size):
+            results = search_client.upload_documents(documents=batch)
+            num_failures = 0
+            errors = set()
+            for result in results:
+                if not result.succeeded:
+                    print(
+                        f"Indexing Failed for {result.key} with ERROR: {result.error_message}"
+                    )
+                    num_failures += 1
+                    errors.add(result.error_message)
+            if num_failures > 0:
+                raise Exception(
+                    f"INDEXING FAILED for {num_failures} documents. Please recreate the index."
+                    f"To Debug: PLEASE CHECK chunk_size and upload_batch_size. \n Error Messages: {list(errors)}"
                 )
-                num_failures += 1
-                errors.add(result.error_message)
-        if num_failures > 0:
-            raise Exception(
-                f"INDEXING FAILED for {num_failures} documents. Please recreate the index."
-                f"To Debug: PLEASE CHECK chunk_size and upload_batch_size. \n Error Messages: {list(errors)}"
-            )
+            num_uploaded += len(batch)
+            progress.update(len(batch))
+    return num_uploaded
 
 
 def validate_index(index_name, index_client):
@@ -134,7 +134,7 @@ def create_and_populate_index(
 
     # chunk directory
     print("Chunking directory...")
-    result = chunk_directory(
+    results = iter_chunk_directory(
         "./data",
         form_recognizer_client=form_recognizer_client,
         use_layout=True,
@@ -145,17 +145,18 @@ def create_and_populate_index(
         embedding_endpoint=embedding_endpoint
     )
 
-    if len(result.chunks) == 0:
-        raise Exception("No chunks found. Please check the data path and chunk size.")
+    # upload documents to index as they are chunked
+    print("Uploading documents to index...")
+    summary = ChunkingResult(chunks=[], total_files=0)
+    num_chunks = upload_documents_to_index(iter_chunks(results, summary), search_client)
 
-    print(f"Processed {result.total_files} files")
-    print(f"Unsupported formats: {result.num_unsupported_format_files} files")
-    print(f"Files with errors: {result.num_files_with_errors} files")
-    print(f"Found {len(result.chunks)} chunks")
+    if num_chunks == 0:
+        raise Exception("No chunks found. Please check the data path and chunk size.")
 
-    # upload documents to index
-    print("Uploading documents to index...")
-    upload_documents_to_index(result.chunks, search_client)
+    print(f"Processed {summary.total_files} files")
+    print(f"Unsupported formats: {summary.num_unsupported_format_files} files")
+    print(f"Files with errors: {summary.num_files_with_errors} files")
+    print(f"Found {num_chunks} chunks")
 
     # check if index is ready/validate index
     print("Validating index...")
@@ -66,6 +66,9 @@ for key, cfg in tqdm.tqdm(run_config_by_data_path_3_small_512_512.items()):
         FORM_RECOGNIZER_KEY,
     ] + (["--form-rec-use-layout"] if form_rec_use_layout else []) + [
         "--njobs=8",
+        # only re-process the files that changed since the last run
+        "--manifest",
+        "manifest.sqlite",
     ]
     str_command = " ".join(command)
     with open(f"logs/stdout.{key}.txt", "w") as f_stdout, open(f"logs/stderr.{key}.txt", "w") as f_stderr:
@@ -0,0 +1,188 @@
+"""Retries and rate limits for the API calls made during ingestion."""
+import multiprocessing
+import os
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Mapping, Optional, Tuple
+
+# Status codes worth retrying; other client errors fail the same way every time
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+
+class TokenBucket:
+    """A per minute budget, shared with the worker processes the bucket is passed to.
+
+    Callers reserve what they need up front and wait until the bucket has
+    refilled enough to cover it, so concurrent callers queue up instead of
+    all retrying at the same moment.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        # [available, updated at]
+        self._state = multiprocessing.Array("d", [per_minute, time.time()])
+
+    def _refill(self, now: float):
+        available, updated_at = self._state[0], self._state[1]
+        self._state[0] = min(self.capacity, available + (now - updated_at) * self.rate)
+        self._state[1] = now
+
+    def reserve(self, amount: float) -> float:
+        """Takes amount from the bucket, returning how many seconds to wait before using it."""
+        # More than the whole budget at once waits for a full bucket
+        amount = min(amount, self.capacity)
+        with self._state.get_lock():
+            self._refill(time.time())
+            self._state[0] -= amount
+            return max(0.0, -self._state[0] / self.rate)
+
+    def limit(self, remaining: float):
+        """Lowers what is available to what the service reports as remaining."""
+        with self._state.get_lock():
+            self._refill(time.time())
+            self._state[0] = min(self._state[0], remaining)
+
+
+def _get_header(headers: Optional[Mapping], name: str) -> Optional[str]:
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is None and hasattr(headers, "items"):
+        # Case-insensitive lookup for mappings that don't do it themselves
+        value = next((v for k, v in headers.items() if k.lower() == name), None)
+    return value
+
+
+def _status_and_headers(error: Exception) -> Tuple[Optional[int], Optional[Mapping]]:
+    """Finds the HTTP status and headers of a failed request from the openai, requests, urllib or azure-core errors."""
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None) or getattr(error, "code", None)
+    headers = getattr(response, "headers", None) or getattr(error, "headers", None)
+    return (status if isinstance(status, int) else None), headers
+
+
+def retry_after_seconds(headers: Optional[Mapping]) -> Optional[float]:
+    """Reads the retry-after-ms or Retry-After (seconds or HTTP date) header."""
+    retry_after_ms = _get_header(headers, "retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = _get_header(headers, "retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(status: Optional[int]) -> bool:
+    # No status means the request didn't get a response, e.g. a timeout or dropped connection
+    return status is None or status in RETRYABLE_STATUS_CODES or status >= 500
+
+
+class Throttle:
+    """Retries and rate limits the calls to one service.
+
+    Before each call, waits for the requests per minute and tokens per minute
+    budgets, when set. A Retry-After header on a throttled call pauses every
+    process sharing the throttle, an x-ratelimit-remaining-* header lowers the
+    budgets to what the service has left, and other failures are retried with
+    jittered exponential backoff. Errors that won't go away by retrying, like
+    a 400 or 401, are raised right away.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            requests_per_minute: Optional[float] = None,
+            tokens_per_minute: Optional[float] = None,
+            max_attempts: int = 5,
+            base_delay: float = 1.0,
+            max_delay: float = 60.0
+    ):
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._paused_until = multiprocessing.Value("d", 0.0)
+
+    @classmethod
+    def from_env(cls, name: str, prefix: str, **kwargs) -> "Throttle":
+        """Creates a throttle with the <prefix>_RATE_LIMIT_RPM and <prefix>_RATE_LIMIT_TPM budgets, if set."""
+        rpm = os.getenv(f"{prefix}_RATE_LIMIT_RPM")
+        tpm = os.getenv(f"{prefix}_RATE_LIMIT_TPM")
+        return cls(name, float(rpm) if rpm else None, float(tpm) if tpm else None, **kwargs)
+
+    def pause(self, seconds: float):
+        """Holds back every call through this throttle for the given number of seconds."""
+        with self._paused_until.get_lock():
+            self._paused_until.value = max(self._paused_until.value, time.time() + seconds)
+
+    def wait(self, tokens: float = 0):
+        """Waits until a call costing the given number of tokens fits the budgets."""
+        paused = self._paused_until.value - time.time()
+        if paused > 0:
+            time.sleep(paused)
+
+        delay = 0.0
+        if self.requests:
+            delay = max(delay, self.requests.reserve(1))
+        if self.tokens and tokens:
+            delay = max(delay, self.tokens.reserve(tokens))
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, headers: Optional[Mapping]):
+        """Lowers the budgets to the x-ratelimit-remaining-* headers of a response."""
+        exhausted = False
+        for header, bucket in (("x-ratelimit-remaining-requests", self.requests), ("x-ratelimit-remaining-tokens", self.tokens)):
+            remaining = _get_header(headers, header)
+            if remaining is None:
+                continue
+            try:
+                remaining = float(remaining)
+            except ValueError:
+                continue
+            if bucket:
+                bucket.limit(remaining)
+            exhausted = exhausted or remaining <= 0
+        if exhausted:
+            # Give the service's window a moment to refill before the next call
+            self.pause(self.base_delay * (1 + random.random()))
+
+    def backoff(self, attempt: int) -> float:
+        """Full jitter exponential backoff for the given zero based attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def call(self, func: Callable[..., Any], *args, tokens: float = 0, **kwargs) -> Any:
+        """Calls func within the budgets, retrying it up to max_attempts times."""
+        for attempt in range(self.max_attempts):
+            self.wait(tokens)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                status, headers = _status_and_headers(e)
+                if not is_retryable(status) or attempt + 1 == self.max_attempts:
+                    raise
+
+                retry_after = retry_after_seconds(headers)
+                if retry_after is not None:
+                    self.pause(retry_after)
+                    delay = retry_after
+                else:
+                    delay = self.backoff(attempt)
+                print(f"Error calling {self.name} with error={e}, retrying in {delay:.1f}s, current at {attempt + 1} retry, {self.max_attempts - (attempt + 1)} retries left")
+                if retry_after is None:
+                    time.sleep(delay)
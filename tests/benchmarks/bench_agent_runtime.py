@@ -0,0 +1,104 @@
+"""Cold vs warm agent setup latency against stubbed model clients.
+
+Cold mirrors the previous get_agent_response(): every request loads the
+dotenv file, builds two Azure OpenAI chat clients, a Neo4j driver, both agents
+and the team. Warm reuses one AgentRuntime. The model calls themselves are
+served by ReplayChatCompletionClient so only setup cost differs.
+
+Usage: python tests/benchmarks/bench_agent_runtime.py [--requests 50]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import dotenv
+from autogen_ext.models.openai import AzureOpenAIChatCompletionClient
+from autogen_ext.models.replay import ReplayChatCompletionClient
+from neo4j import GraphDatabase
+
+from backend.agents.agents import AgentRuntime, MODEL_INFO
+
+
+class StubTools:
+    async def semantic_search(self, query, top_k=5, kind=None):
+        return f"DOCUMENT REF-1:\nContent: {query}\n"
+
+    async def close(self):
+        pass
+
+
+def stub_runtime():
+    return AgentRuntime(
+        model_client=ReplayChatCompletionClient(["search plan"], model_info=MODEL_INFO),
+        reviewer_model_client=ReplayChatCompletionClient(["review"], model_info=MODEL_INFO),
+        tools=StubTools(),
+    )
+
+
+async def cold_request(task):
+    dotenv.load_dotenv()
+    clients = [
+        AzureOpenAIChatCompletionClient(
+            model="gpt-4o",
+            azure_endpoint="https://localhost.openai.azure.com",
+            api_key="dummy",
+            api_version="2024-05-01-preview",
+            model_info=MODEL_INFO,
+        )
+        for _ in range(2)
+    ]
+    driver = GraphDatabase.driver("bolt://localhost:7687", auth=("neo4j", "dummy"))
+
+    runtime = stub_runtime()
+    result = await runtime.run(task)
+
+    driver.close()
+    for client in clients:
+        await client.close()
+    await runtime.close()
+    return result
+
+
+async def warm_request(runtime, task):
+    runtime.model_client.reset()
+    runtime.reviewer_model_client.reset()
+    return await runtime.run(task)
+
+
+async def measure(request, count):
+    timings = []
+    for i in range(count):
+        start = time.perf_counter()
+        await request(f"case {i}")
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(name, timings):
+    print(
+        f"{name:<5} mean={statistics.mean(timings):8.2f}ms "
+        f"p50={statistics.median(timings):8.2f}ms "
+        f"max={max(timings):8.2f}ms"
+    )
+
+
+async def main(count):
+    runtime = stub_runtime()
+    cold = await measure(cold_request, count)
+    warm = await measure(lambda task: warm_request(runtime, task), count)
+    await runtime.close()
+
+    report("cold", cold)
+    report("warm", warm)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
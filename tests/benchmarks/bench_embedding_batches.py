@@ -0,0 +1,112 @@
+"""Throughput of embedding chunks during ingestion against a local stub.
+
+Compares one embeddings request per chunk with a new client each time, as
+chunk_content used to do, against Embedder, which reuses one client and
+sends the chunks in batches. The stub answers like the Azure OpenAI and
+Cohere embedding endpoints after a fixed delay per request, standing in for
+the network round trip and service overhead.
+
+Usage: python tests/benchmarks/bench_embedding_batches.py [--chunks 256] [--latency-ms 20]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "scripts")))
+
+from openai import AzureOpenAI
+
+from data_utils import Embedder
+
+DIMENSIONS = 1536
+
+
+def make_handler(latency):
+    class EmbeddingStub(BaseHTTPRequestHandler):
+        requests = 0
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            EmbeddingStub.requests += 1
+            time.sleep(latency)
+
+            if "texts" in body:
+                response = {"embeddings": [[0.1] * DIMENSIONS for _ in body["texts"]]}
+            else:
+                inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+                response = {
+                    "object": "list",
+                    "model": "text-embedding-3-small",
+                    "data": [{"object": "embedding", "index": i, "embedding": [0.1] * DIMENSIONS} for i in range(len(inputs))],
+                    "usage": {"prompt_tokens": 0, "total_tokens": 0},
+                }
+            payload = json.dumps(response).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    return EmbeddingStub
+
+
+def per_chunk_aoai(endpoint, texts):
+    base_url, rest = endpoint.split("/openai/deployments/")
+    deployment_id = rest.split("/embeddings")[0]
+    for text in texts:
+        client = AzureOpenAI(api_version="2024-02-01", azure_endpoint=base_url, api_key="key")
+        client.embeddings.create(model=deployment_id, input=text, dimensions=DIMENSIONS)
+
+
+def per_chunk_cohere(endpoint, texts):
+    embedder = Embedder(endpoint, "key")
+    for text in texts:
+        embedder._embed_batch([text])
+
+
+def batched_embedder(endpoint, texts):
+    assert len(Embedder(endpoint, "key").embed(texts)) == len(texts)
+
+
+def measure(embed, endpoint, texts, handler):
+    handler.requests = 0
+    start = time.perf_counter()
+    embed(endpoint, texts)
+    elapsed = time.perf_counter() - start
+    return len(texts) / elapsed, handler.requests
+
+
+def main(count, latency_ms):
+    handler = make_handler(latency_ms / 1000)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"http://127.0.0.1:{server.server_address[1]}"
+
+    texts = [f"Chunk {i} about storage account failover. " * 40 for i in range(count)]
+    runs = (
+        ("AOAI", f"{host}/openai/deployments/embedding/embeddings?api-version=2024-02-01", per_chunk_aoai),
+        ("COHERE", f"{host}/v1/embed", per_chunk_cohere),
+    )
+    try:
+        for model, endpoint, per_chunk in runs:
+            os.environ["FLAG_EMBEDDING_MODEL"] = model
+            for name, embed in (("per chunk", per_chunk), ("batched", batched_embedder)):
+                rate, requests = measure(embed, endpoint, texts, handler)
+                print(f"{model:<7}{name:<10} {rate:10,.0f} chunks/s {requests:6} requests")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=256)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+    main(args.chunks, args.latency_ms)
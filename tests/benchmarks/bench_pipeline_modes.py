@@ -0,0 +1,133 @@
+"""Latency and token use of the single_pass and resynthesize agent pipelines.
+
+Both modes run the real AgentRuntime against replayed model clients that add a
+fixed time to first token and a per-token delay. resynthesize then streams one
+more completion over the reviewer answer, as send_chat_request does, while
+single_pass streams the reviewer tokens as the answer. Tokens are counted as
+whitespace separated words by the replay clients.
+
+Usage: python tests/benchmarks/bench_pipeline_modes.py [--requests 10] [--first-token-ms 300] [--token-ms 5]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from autogen_agentchat.base import TaskResult
+from autogen_core.models import SystemMessage, UserMessage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+from backend.agents.agents import AgentRuntime, MODEL_INFO
+from backend.agents.events import get_reviewer_message, is_reviewer_token
+
+SYSTEM_MESSAGE = "You are an AI assistant that helps people find information."
+SEARCH_PLAN = " ".join(["query"] * 200)
+REVIEW = " ".join(["answer"] * 400)
+FINAL_ANSWER = " ".join(["answer"] * 400)
+
+
+class StubTools:
+    async def semantic_search(self, query, top_k=5, kind=None):
+        return f"DOCUMENT REF-1:\nContent: {query}\n"
+
+    async def close(self):
+        pass
+
+
+class SlowReplayClient(ReplayChatCompletionClient):
+    """Replay client with a time to first token and a per-token delay."""
+
+    def __init__(self, chat_completions, first_token_latency, token_latency):
+        super().__init__(chat_completions, model_info=MODEL_INFO)
+        self.first_token_latency = first_token_latency
+        self.token_latency = token_latency
+
+    async def create(self, messages, **kwargs):
+        result = await super().create(messages, **kwargs)
+        await asyncio.sleep(self.first_token_latency + self.token_latency * result.usage.completion_tokens)
+        return result
+
+    async def create_stream(self, messages, **kwargs):
+        await asyncio.sleep(self.first_token_latency)
+        async for chunk in super().create_stream(messages, **kwargs):
+            if isinstance(chunk, str):
+                await asyncio.sleep(self.token_latency)
+            yield chunk
+
+
+def usage(*clients):
+    return sum(
+        client.total_usage().prompt_tokens + client.total_usage().completion_tokens
+        for client in clients
+    )
+
+
+async def run_request(mode, task, count, first_token_latency, token_latency):
+    def client(response):
+        return SlowReplayClient([response] * count, first_token_latency, token_latency)
+
+    runtime = AgentRuntime(
+        model_client=client(SEARCH_PLAN),
+        reviewer_model_client=client(REVIEW),
+        tools=StubTools(),
+    )
+    final_client = client(FINAL_ANSWER)
+
+    start = time.perf_counter()
+    first_token = None
+    result = None
+    async for message in runtime.run_stream(task):
+        if isinstance(message, TaskResult):
+            result = message
+        elif mode == "single_pass" and first_token is None and is_reviewer_token(message):
+            first_token = time.perf_counter()
+
+    if mode == "resynthesize":
+        messages = [
+            SystemMessage(content=SYSTEM_MESSAGE),
+            UserMessage(content=task, source="user"),
+            UserMessage(content=get_reviewer_message(result), source="user"),
+        ]
+        async for chunk in final_client.create_stream(messages):
+            if first_token is None and isinstance(chunk, str):
+                first_token = time.perf_counter()
+
+    end = time.perf_counter()
+    tokens = usage(runtime.model_client, runtime.reviewer_model_client, final_client)
+    await runtime.close()
+    return (first_token - start) * 1000, (end - start) * 1000, tokens
+
+
+async def measure(mode, count, first_token_latency, token_latency):
+    first_tokens, totals, tokens = [], [], []
+    for i in range(count):
+        first_token, total, used = await run_request(
+            mode, f"case {i} storage account returns 503", count, first_token_latency, token_latency
+        )
+        first_tokens.append(first_token)
+        totals.append(total)
+        tokens.append(used)
+    return first_tokens, totals, tokens
+
+
+async def main(count, first_token_latency, token_latency):
+    for mode in ("resynthesize", "single_pass"):
+        first_tokens, totals, tokens = await measure(mode, count, first_token_latency, token_latency)
+        print(
+            f"{mode:<13} first answer token p50={statistics.median(first_tokens):8.1f}ms "
+            f"total p50={statistics.median(totals):8.1f}ms "
+            f"tokens/request={statistics.mean(tokens):8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--first-token-ms", type=float, default=300)
+    parser.add_argument("--token-ms", type=float, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.first_token_ms / 1000, args.token_ms / 1000))
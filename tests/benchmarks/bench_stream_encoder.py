@@ -0,0 +1,76 @@
+"""Throughput of encoding streamed completion chunks as NDJSON.
+
+Compares format_stream_response followed by json.dumps, as the stream used to
+do for every chunk, against StreamResponseEncoder, which serializes the
+response envelope once and only encodes the content of each chunk.
+
+Usage: python tests/benchmarks/bench_stream_encoder.py [--chunks 20000]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from openai.types.chat import ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import Choice, ChoiceDelta
+
+from backend.utils import JSONEncoder, StreamResponseEncoder, format_stream_response, orjson
+
+HISTORY_METADATA = {
+    "conversation_id": "2b2c3f4e-0000-4000-8000-000000000000",
+    "title": "Storage account returns 503 after a failover",
+    "date": "2024-06-01T12:00:00.000000",
+}
+
+
+def make_chunks(count):
+    return [
+        ChatCompletionChunk(
+            id="chatcmpl-0123456789",
+            model="gpt-4o",
+            created=1717243200,
+            object="chat.completion.chunk",
+            choices=[Choice(index=0, delta=ChoiceDelta(role="assistant", content=f" token{i}"))]
+        )
+        for i in range(count)
+    ]
+
+
+def dict_and_dumps(chunks):
+    for chunk in chunks:
+        yield json.dumps(format_stream_response(chunk, HISTORY_METADATA, "apim-1"), cls=JSONEncoder) + "\n"
+
+
+def envelope_encoder(chunks):
+    encoder = StreamResponseEncoder(HISTORY_METADATA, "apim-1")
+    for chunk in chunks:
+        yield encoder.encode(chunk)
+
+
+def measure(encode, chunks, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in encode(chunks):
+            pass
+        best = min(best, time.perf_counter() - start)
+    return len(chunks) / best
+
+
+def main(count):
+    chunks = make_chunks(count)
+    assert list(dict_and_dumps(chunks[:10])) == list(envelope_encoder(chunks[:10]))
+
+    print(f"orjson installed: {orjson is not None}")
+    for name, encode in (("dict+dumps", dict_and_dumps), ("envelope", envelope_encoder)):
+        print(f"{name:<11} {measure(encode, chunks):12,.0f} chunks/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.chunks)
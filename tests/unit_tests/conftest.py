@@ -0,0 +1,224 @@
+import copy
+import re
+
+import pytest
+from azure.cosmos import exceptions
+
+from backend.history.cosmosdbservice import CosmosConversationClient
+
+
+def _not_found():
+    return exceptions.CosmosResourceNotFoundError(status_code=404, message="Entity with the specified id does not exist in the system.")
+
+
+def _matches_predicate(item, predicate):
+    # Supports the "from c where c.<field> = '<value>'" predicates the app uses
+    return all(
+        item.get(field) == value
+        for field, value in re.findall(r"c\.(\w+)\s*=\s*'([^']*)'", predicate or "")
+    )
+
+
+def _apply_patch(item, patch_operations):
+    for operation in patch_operations:
+        field = operation["path"].lstrip("/")
+        if operation["op"] in ("set", "replace", "add"):
+            item[field] = operation["value"]
+        elif operation["op"] == "incr":
+            item[field] = item.get(field, 0) + operation["value"]
+        elif operation["op"] == "remove":
+            item.pop(field, None)
+        else:
+            raise ValueError(f"Unsupported patch operation {operation['op']}")
+
+
+class InMemoryContainer:
+    """Stand-in for an azure.cosmos.aio ContainerProxy partitioned on /userId.
+
+    Keeps documents in memory and records every call, so tests can check both
+    the stored documents and the number of round trips. Queries support the
+    equality filters, ORDER BY and OFFSET/LIMIT clauses the app uses.
+    """
+
+    def __init__(self, indexing_policy=None):
+        self.items = {}
+        self.calls = []
+        self.indexing_policy = indexing_policy or {
+            "indexingMode": "consistent",
+            "automatic": True,
+            "includedPaths": [{"path": "/*"}],
+            "excludedPaths": [{"path": "/\"_etag\"/?"}]
+        }
+
+    def _read(self, item_id, partition_key):
+        item = self.items.get((partition_key, item_id))
+        if item is None:
+            raise _not_found()
+        return item
+
+    def add(self, item):
+        self.items[(item["userId"], item["id"])] = copy.deepcopy(item)
+
+    async def read(self):
+        self.calls.append("read")
+        return {"id": "conversations", "indexingPolicy": self.indexing_policy}
+
+    async def upsert_item(self, body, **kwargs):
+        self.calls.append("upsert_item")
+        self.add(body)
+        return copy.deepcopy(body)
+
+    async def read_item(self, item, partition_key, **kwargs):
+        self.calls.append("read_item")
+        return copy.deepcopy(self._read(item, partition_key))
+
+    async def delete_item(self, item, partition_key, **kwargs):
+        self.calls.append("delete_item")
+        self._read(item, partition_key)
+        del self.items[(partition_key, item)]
+
+    async def patch_item(self, item, partition_key, patch_operations, filter_predicate=None, **kwargs):
+        self.calls.append("patch_item")
+        stored = self._read(item, partition_key)
+        if not _matches_predicate(stored, filter_predicate):
+            raise exceptions.CosmosAccessConditionFailedError(status_code=412, message="Precondition failed")
+        _apply_patch(stored, patch_operations)
+        return copy.deepcopy(stored)
+
+    async def execute_item_batch(self, batch_operations, partition_key, **kwargs):
+        self.calls.append("execute_item_batch")
+        items = copy.deepcopy(self.items)
+        responses = []
+        for index, operation in enumerate(batch_operations):
+            operation_type, args = operation[0], operation[1]
+            options = operation[2] if len(operation) > 2 else {}
+            try:
+                if operation_type == "upsert":
+                    items[(partition_key, args[0]["id"])] = copy.deepcopy(args[0])
+                    body = args[0]
+                elif operation_type == "patch":
+                    body = items.get((partition_key, args[0]))
+                    if body is None:
+                        raise _not_found()
+                    if not _matches_predicate(body, options.get("filter_predicate")):
+                        raise exceptions.CosmosAccessConditionFailedError(status_code=412)
+                    _apply_patch(body, args[1])
+                elif operation_type == "delete":
+                    body = items.pop((partition_key, args[0]), None)
+                    if body is None:
+                        raise _not_found()
+                else:
+                    raise ValueError(f"Unsupported batch operation {operation_type}")
+            except exceptions.CosmosHttpResponseError as e:
+                responses.append({"statusCode": e.status_code})
+                responses.extend({"statusCode": 424} for _ in batch_operations[index + 1:])
+                raise exceptions.CosmosBatchOperationError(
+                    error_index=index,
+                    headers={},
+                    status_code=e.status_code,
+                    message=f"There was an error in the transactional batch on index {index}.",
+                    operation_responses=responses
+                )
+            responses.append({"statusCode": 200, "resourceBody": copy.deepcopy(body)})
+
+        self.items = items
+        return responses
+
+    def query_items(self, query, parameters=None, partition_key=None, max_item_count=None, **kwargs):
+        self.calls.append("query_items")
+        values = {parameter["name"]: parameter["value"] for parameter in parameters or []}
+        where = re.search(r"where (.*?)(?: order by | offset |$)", query, re.IGNORECASE)
+        conditions = re.split(r"\s+and\s+", where.group(1), flags=re.IGNORECASE) if where else []
+
+        def matches(item):
+            if partition_key is not None and item.get("userId") != partition_key:
+                return False
+            for condition in conditions:
+                field, value = re.match(r"c\.(\w+)\s*=\s*(@\w+|'[^']*')", condition.strip()).groups()
+                expected = values[value] if value.startswith("@") else value.strip("'")
+                if item.get(field) != expected:
+                    return False
+            return True
+
+        results = [copy.deepcopy(item) for item in self.items.values() if matches(item)]
+
+        order = re.search(r"order by (.*?)(?: offset |$)", query, re.IGNORECASE)
+        if order:
+            # Stable sorts from the last ORDER BY field to the first
+            for field, direction in reversed(re.findall(r"c\.(\w+)\s*(asc|desc)?", order.group(1), re.IGNORECASE)):
+                results.sort(key=lambda item: item.get(field) or "", reverse=direction.lower() == "desc")
+
+        page = re.search(r"offset (\d+) limit (\d+)", query, re.IGNORECASE)
+        if page:
+            offset, limit = int(page.group(1)), int(page.group(2))
+            results = results[offset:offset + limit]
+
+        projection = re.match(r"select (.*?) from c", query, re.IGNORECASE).group(1)
+        if projection.strip() != "*":
+            fields = [field.strip()[len("c."):] for field in projection.split(",")]
+            results = [{field: item[field] for field in fields if field in item} for item in results]
+
+        return _QueryResult(results, max_item_count)
+
+
+class InMemoryDatabase:
+    async def read(self):
+        return {"id": "db_conversation_history"}
+
+
+class _QueryResult:
+    """Query results that can be iterated item by item or page by page like AsyncItemPaged."""
+
+    def __init__(self, items, max_item_count):
+        self.items = items
+        self.max_item_count = max_item_count or len(items) or 1
+
+    async def __aiter__(self):
+        for item in self.items:
+            yield item
+
+    def by_page(self, continuation_token=None):
+        return _QueryPages(self, int(continuation_token or 0))
+
+
+class _QueryPages:
+    def __init__(self, result, start):
+        self.result = result
+        self.start = start
+        self.continuation_token = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.start >= len(self.result.items) and self.start > 0:
+            raise StopAsyncIteration
+        end = self.start + self.result.max_item_count
+        page = self.result.items[self.start:end]
+        self.continuation_token = str(end) if end < len(self.result.items) else None
+        self.start = end
+
+        async def items():
+            for item in page:
+                yield item
+        return items()
+
+
+@pytest.fixture
+def cosmos_container():
+    return InMemoryContainer()
+
+
+@pytest.fixture
+def cosmos_conversation_client(cosmos_container):
+    client = CosmosConversationClient(
+        cosmosdb_endpoint="https://localhost:8081/",
+        credential="a2V5",
+        database_name="db_conversation_history",
+        container_name="conversations",
+        enable_message_feedback=True,
+        delete_max_concurrency=2,
+    )
+    client.database_client = InMemoryDatabase()
+    client.container_client = cosmos_container
+    return client
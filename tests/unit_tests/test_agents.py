@@ -0,0 +1,160 @@
+import asyncio
+import pytest
+from autogen_agentchat.base import TaskResult
+from autogen_agentchat.messages import ToolCallExecutionEvent
+from autogen_core import FunctionCall
+from autogen_core.models import FunctionExecutionResult
+from autogen_ext.models.replay import ReplayChatCompletionClient
+from backend.agents.agent_tool import reciprocal_rank_fusion
+from backend.agents.agents import AgentRuntime, MODEL_INFO
+from backend.agents.events import answer_chunk, format_agent_event, get_reviewer_message
+from backend.utils import format_stream_response
+
+
+class DummyTools:
+    def __init__(self):
+        self.closed = False
+
+    async def semantic_search(self, query, top_k=5, kind=None):
+        return f"DOCUMENT REF-1:\nContent: {query}\n"
+
+    async def close(self):
+        self.closed = True
+
+
+def create_runtime(turns=4, max_teams=8):
+    return AgentRuntime(
+        model_client=ReplayChatCompletionClient(
+            [f"search plan {i}" for i in range(turns)], model_info=MODEL_INFO
+        ),
+        reviewer_model_client=ReplayChatCompletionClient(
+            [f"review {i}" for i in range(turns)], model_info=MODEL_INFO
+        ),
+        tools=DummyTools(),
+        max_teams=max_teams
+    )
+
+
+@pytest.mark.asyncio
+async def test_agent_runtime_reuses_team():
+    runtime = create_runtime()
+    built = []
+    build_team = runtime.build_team
+    runtime.build_team = lambda: built.append(1) or build_team()
+
+    first = await runtime.run("case one")
+    second = await runtime.run("case two")
+
+    assert len(built) == 1
+    assert [m.source for m in first.messages] == ["user", "QueryOptimizer", "CaseReviewer"]
+    assert second.messages[0].content == "case two"
+    assert second.messages[-1].content == "review 1"
+    # The reset team must not carry the previous conversation
+    assert len(second.messages) == 3
+
+    await runtime.close()
+    assert runtime.tools.closed
+
+
+@pytest.mark.asyncio
+async def test_agent_runtime_caps_team_count():
+    runtime = create_runtime(max_teams=1)
+
+    results = await asyncio.gather(
+        runtime.run("case one"),
+        runtime.run("case two"),
+    )
+
+    assert runtime._team_count == 1
+    assert len(runtime._idle_teams) == 1
+    assert {r.messages[0].content for r in results} == {"case one", "case two"}
+
+
+@pytest.mark.asyncio
+async def test_agent_runtime_releases_slot_when_build_fails():
+    runtime = create_runtime(max_teams=1)
+    build_team = runtime.build_team
+
+    def failing_build_team():
+        raise ValueError("bad model config")
+    runtime.build_team = failing_build_team
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(runtime.acquire_team(), timeout=1)
+    assert runtime._team_count == 0
+
+    runtime.build_team = build_team
+    result = await asyncio.wait_for(runtime.run("case one"), timeout=5)
+    assert result.messages[0].content == "case one"
+
+
+def test_reciprocal_rank_fusion_deduplicates_results():
+    fused = reciprocal_rank_fusion([
+        [{"id": "a"}, {"id": "b"}],
+        [{"id": "b"}, {"id": "c"}],
+        [],
+    ])
+
+    assert [doc["id"] for doc in fused] == ["b", "a", "c"]
+    assert fused[0]["matched_queries"] == [1, 2]
+    assert fused[0]["@search.rrf_score"] == pytest.approx(1 / 62 + 1 / 61)
+
+
+@pytest.mark.asyncio
+async def test_agent_runtime_streams_events():
+    runtime = create_runtime()
+
+    messages = [message async for message in runtime.run_stream("case one")]
+    frames = [format_agent_event(message) for message in messages[:-1]]
+
+    assert isinstance(messages[-1], TaskResult)
+    tokens = [f["content"] for f in frames if f and f["event"] == "token"]
+    assert "".join(tokens) == "review 0"
+    assert [f["source"] for f in frames if f and f["event"] == "message"] == ["QueryOptimizer", "CaseReviewer"]
+    # The task itself is not echoed back
+    assert frames[0] is None
+
+    await runtime.close()
+
+
+def test_format_agent_event_extracts_references():
+    event = ToolCallExecutionEvent(
+        source="QueryOptimizer",
+        content=[FunctionExecutionResult(
+            call_id="call-1",
+            name="semantic_search",
+            content="DOCUMENT REF-1:\nContent: text\n\n=== DOCUMENT REFERENCES ===\nREF-1: tsg - Storage limits\n",
+            is_error=False
+        )]
+    )
+
+    assert format_agent_event(event) == {
+        "type": "agent_event",
+        "source": "QueryOptimizer",
+        "event": "tool_result",
+        "results": [{
+            "call_id": "call-1",
+            "name": "semantic_search",
+            "is_error": False,
+            "references": ["REF-1: tsg - Storage limits"],
+        }],
+    }
+
+
+@pytest.mark.asyncio
+async def test_reviewer_answer_uses_completion_wire_format():
+    runtime = create_runtime()
+    result = await runtime.run("case one")
+    await runtime.close()
+
+    chunk = answer_chunk("response-1", "gpt-4o", 0, get_reviewer_message(result))
+    assert format_stream_response(chunk, {"conversation_id": "c"}, None) == {
+        "id": "response-1",
+        "model": "gpt-4o",
+        "created": 0,
+        "object": "chat.completion.chunk",
+        "choices": [{"messages": [{"role": "assistant", "content": "review 0"}]}],
+        "history_metadata": {"conversation_id": "c"},
+        "apim-request-id": None,
+    }
@@ -0,0 +1,92 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "scripts")))
+
+from analyze_cache import AnalyzeResultCache
+
+try:
+    import data_utils
+except Exception:
+    # tiktoken downloads its encodings when data_utils is imported
+    data_utils = None
+
+
+def result(i):
+    return {"content": f"page {i:03d} " * 50, "pages": []}
+
+
+def test_analyze_cache_round_trip(tmp_path):
+    cache = AnalyzeResultCache(str(tmp_path))
+    key = cache.key("file-hash", "prebuilt-read", "1.0.0")
+
+    assert cache.get(key) is None
+    cache.put(key, result(1))
+    assert cache.get(key) == result(1)
+    assert key != cache.key("file-hash", "prebuilt-layout", "1.0.0")
+    assert key != cache.key("file-hash", "prebuilt-read", "1.0.1")
+
+
+def test_analyze_cache_evicts_least_recently_used(tmp_path):
+    cache = AnalyzeResultCache(str(tmp_path))
+    for i, mtime in enumerate((1000, 2000, 3000)):
+        cache.put(f"key-{i}", result(i))
+        os.utime(cache._path(f"key-{i}"), (mtime, mtime))
+    size = os.path.getsize(cache._path("key-0"))
+
+    # Reading key-0 makes it the most recently used
+    assert cache.get("key-0") == result(0)
+    cache.max_bytes = int(size * 2.5)
+    cache.put("key-3", result(3))
+
+    assert cache.get("key-1") is None
+    assert cache.get("key-2") is None
+    assert cache.get("key-0") == result(0)
+    assert cache.get("key-3") == result(3)
+    total = sum(entry.stat().st_size for entry in os.scandir(tmp_path))
+    assert total <= cache.max_bytes
+
+
+def test_analyze_cache_ignores_corrupt_results(tmp_path):
+    cache = AnalyzeResultCache(str(tmp_path))
+    with open(cache._path("corrupt"), "wb") as f:
+        f.write(b"not gzip")
+
+    assert cache.get("corrupt") is None
+
+
+class FakePoller:
+    def __init__(self, result):
+        self._result = result
+
+    def result(self):
+        return self._result
+
+
+class FakeDocumentIntelligenceClient:
+    def __init__(self):
+        self.calls = 0
+
+    def begin_analyze_document(self, model, request):
+        self.calls += 1
+        return FakePoller(data_utils.AnalyzeResult({"content": "analyzed", "pages": []}))
+
+
+@pytest.mark.skipif(data_utils is None, reason="data_utils could not be imported")
+def test_analyze_document_skips_the_service_for_cached_results(tmp_path, monkeypatch):
+    monkeypatch.setenv("FORM_RECOGNIZER_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(data_utils, "_ANALYZE_RESULT_CACHE", None)
+    file_path = tmp_path / "document.pdf"
+    file_path.write_bytes(b"%PDF-1.4 document")
+    client = FakeDocumentIntelligenceClient()
+
+    first = data_utils.analyze_document(str(file_path), client, "prebuilt-read")
+    second = data_utils.analyze_document(str(file_path), client, "prebuilt-read")
+
+    assert client.calls == 1
+    assert first.content == second.content == "analyzed"
+
+    data_utils.analyze_document(str(file_path), client, "prebuilt-layout")
+    assert client.calls == 2
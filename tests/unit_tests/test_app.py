@@ -0,0 +1,167 @@
+import asyncio
+import json
+import os
+import httpx
+import pytest
+from importlib import import_module, reload
+from types import SimpleNamespace
+
+
+@pytest.fixture(scope="function")
+def app_module():
+    # app reads its settings at import time
+    os.environ["DOTENV_PATH"] = os.path.join(
+        os.path.dirname(__file__), "dotenv_data", "dotenv_no_datasource_1"
+    )
+    reload(import_module("backend.settings"))
+    yield reload(import_module("app"))
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_calls_runs_concurrently_in_order(app_module, monkeypatch):
+    monkeypatch.setattr(app_module.app_settings.azure_openai, "function_call_azure_functions_enabled", True)
+    monkeypatch.setattr(
+        app_module.app_settings.azure_openai,
+        "function_call_azure_functions_tool_base_url",
+        "https://dummy.azurewebsites.net/api/tool"
+    )
+    running = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal running, peak
+        tool_name = json.loads(request.content)["tool_name"]
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep({"slow": 0.05, "fast": 0.01}.get(tool_name, 0.02))
+        running -= 1
+        if tool_name == "hang":
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(200, text=f"{tool_name} result")
+
+    quart_app = app_module.create_app()
+    quart_app.client_registry = SimpleNamespace(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        tool_call_semaphore=asyncio.Semaphore(2)
+    )
+
+    async with quart_app.app_context():
+        results = await app_module.execute_tool_calls([
+            ("slow", "{}"), ("fast", "{}"), ("hang", "{}"), ("other", "{}")
+        ])
+
+    assert results == [
+        "slow result",
+        "fast result",
+        json.dumps({"error": "Tool hang timed out"}),
+        "other result",
+    ]
+    assert peak == 2
+    await quart_app.client_registry.http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_calls_bounds_each_call_including_semaphore_wait(app_module, monkeypatch):
+    monkeypatch.setattr(app_module.app_settings.azure_openai, "function_call_azure_functions_enabled", True)
+    monkeypatch.setattr(
+        app_module.app_settings.azure_openai,
+        "function_call_azure_functions_tool_base_url",
+        "https://dummy.azurewebsites.net/api/tool"
+    )
+    monkeypatch.setattr(app_module.app_settings.azure_openai, "function_call_azure_functions_tool_timeout", 0.1)
+
+    async def handler(request):
+        tool_name = json.loads(request.content)["tool_name"]
+        # The mock transport applies no httpx timeouts, only the total deadline
+        await asyncio.sleep({"slow": 5, "fast": 0}[tool_name])
+        return httpx.Response(200, text=f"{tool_name} result")
+
+    quart_app = app_module.create_app()
+    quart_app.client_registry = SimpleNamespace(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        tool_call_semaphore=asyncio.Semaphore(1)
+    )
+
+    async with quart_app.app_context():
+        results = await asyncio.wait_for(
+            app_module.execute_tool_calls([("slow", "{}"), ("fast", "{}")]),
+            timeout=1
+        )
+
+    # fast is stuck behind slow on the semaphore, so it times out too
+    assert results == [
+        json.dumps({"error": "Tool slow timed out"}),
+        json.dumps({"error": "Tool fast timed out"}),
+    ]
+    await quart_app.client_registry.http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_history_list_pages_with_continuation_token(app_module, cosmos_conversation_client):
+    quart_app = app_module.create_app()
+    quart_app.cosmos_conversation_client = cosmos_conversation_client
+    quart_app.history_write_behind = None
+    app_module.cosmos_db_ready.set()
+
+    user_id = app_module.get_authenticated_user_details({})["user_principal_id"]
+    for i in range(30):
+        conversation = await cosmos_conversation_client.create_conversation(user_id, title=f"conversation {i}")
+        cosmos_conversation_client.container_client.items[(user_id, conversation["id"])]["updatedAt"] = f"2024-01-01T00:00:{i:02d}"
+
+    client = quart_app.test_client()
+    response = await client.get("/history/list")
+    first_page = await response.get_json()
+    continuation_token = response.headers[app_module.HISTORY_CONTINUATION_HEADER]
+    assert [c["title"] for c in first_page] == [f"conversation {i}" for i in range(29, 4, -1)]
+    assert set(first_page[0]) == {"id", "title", "updatedAt"}
+
+    response = await client.get("/history/list", query_string={"continuation_token": continuation_token})
+    second_page = await response.get_json()
+    assert [c["title"] for c in second_page] == [f"conversation {i}" for i in range(4, -1, -1)]
+    assert app_module.HISTORY_CONTINUATION_HEADER not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_history_list_with_offset_returns_whole_conversations(app_module, cosmos_conversation_client):
+    quart_app = app_module.create_app()
+    quart_app.cosmos_conversation_client = cosmos_conversation_client
+    quart_app.history_write_behind = None
+    app_module.cosmos_db_ready.set()
+
+    user_id = app_module.get_authenticated_user_details({})["user_principal_id"]
+    for i in range(30):
+        await cosmos_conversation_client.create_conversation(user_id, title=f"conversation {i}")
+
+    client = quart_app.test_client()
+    response = await client.get("/history/list", query_string={"offset": 0})
+    first_page = await response.get_json()
+    assert len(first_page) == 25
+    assert "createdAt" in first_page[0]
+    assert app_module.HISTORY_CONTINUATION_HEADER not in response.headers
+
+    response = await client.get("/history/list", query_string={"offset": 25})
+    assert len(await response.get_json()) == 5
+
+
+@pytest.mark.asyncio
+async def test_history_delete_all_deletes_every_conversation(app_module, cosmos_conversation_client, monkeypatch):
+    monkeypatch.setattr(app_module.app_settings, "chat_history", SimpleNamespace(delete_background_threshold=0))
+    quart_app = app_module.create_app()
+    quart_app.cosmos_conversation_client = cosmos_conversation_client
+    quart_app.history_write_behind = None
+    app_module.cosmos_db_ready.set()
+
+    client = quart_app.test_client()
+    response = await client.delete("/history/delete_all")
+    assert response.status_code == 404
+
+    user_id = app_module.get_authenticated_user_details({})["user_principal_id"]
+    for i in range(3):
+        conversation = await cosmos_conversation_client.create_conversation(user_id, title=f"conversation {i}")
+        await cosmos_conversation_client.create_message(
+            f"message-{i}", conversation["id"], user_id, {"role": "user", "content": "hello"}
+        )
+
+    response = await client.delete("/history/delete_all")
+    assert response.status_code == 200
+    assert cosmos_conversation_client.container_client.items == {}
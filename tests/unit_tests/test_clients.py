@@ -0,0 +1,78 @@
+import time
+import pytest
+from types import SimpleNamespace
+from backend.clients import ClientRegistry, EntraTokenRefresher
+
+
+def azure_openai_settings(**overrides):
+    values = {
+        "model": "gpt-4o",
+        "key": "dummy-key",
+        "resource": None,
+        "endpoint": "https://dummy.openai.azure.com/",
+        "preview_api_version": "2024-05-01-preview",
+        "function_call_azure_functions_enabled": False,
+        "function_call_azure_functions_max_concurrency": 4,
+        "http2": True,
+        "max_connections": 10,
+        "max_keepalive_connections": 5,
+        "keepalive_expiry": 30.0,
+        "request_timeout": 60.0,
+        "connect_timeout": 5.0,
+    }
+    values.update(overrides)
+    return SimpleNamespace(azure_openai=SimpleNamespace(**values))
+
+
+class DummyCredential:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_token(self, scope):
+        self.calls += 1
+        return SimpleNamespace(token=f"token-{self.calls}", expires_on=time.time() + 3600)
+
+
+@pytest.mark.asyncio
+async def test_client_registry_reuses_client():
+    registry = ClientRegistry(azure_openai_settings())
+    await registry.start()
+
+    first = await registry.get_azure_openai_client()
+    second = await registry.get_azure_openai_client()
+    assert first is second
+    assert first._client is registry.http_client
+
+    await registry.close()
+    assert registry.http_client is None
+    assert registry.azure_openai_client is None
+
+
+@pytest.mark.asyncio
+async def test_client_registry_rejects_old_api_version():
+    registry = ClientRegistry(
+        azure_openai_settings(preview_api_version="2023-01-01"),
+        minimum_api_version="2024-05-01-preview"
+    )
+    await registry.start()
+    assert registry.azure_openai_client is None
+
+    with pytest.raises(ValueError):
+        await registry.get_azure_openai_client()
+
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_entra_token_refresher_caches_token():
+    credential = DummyCredential()
+    refresher = EntraTokenRefresher(credential)
+
+    assert await refresher() == "token-1"
+    assert await refresher() == "token-1"
+    assert credential.calls == 1
+
+    # Force the cached token to look expired
+    refresher._token.expires_on = time.time()
+    assert await refresher() == "token-2"
+    assert credential.calls == 2
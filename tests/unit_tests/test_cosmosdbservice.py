@@ -0,0 +1,240 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.history.cosmosdbservice import HISTORY_INDEXING_POLICY, check_indexing_policy
+from backend.history.delete_jobs import JOB_STALE_SECONDS, HistoryDeleteJobs
+from backend.history.write_behind import HistoryWriteBehind
+
+USER_ID = "user-1"
+
+
+@pytest.mark.asyncio
+async def test_create_message_writes_message_and_conversation_in_one_batch(cosmos_conversation_client, cosmos_container):
+    conversation = await cosmos_conversation_client.create_conversation(USER_ID, title="Storage")
+    cosmos_container.calls.clear()
+
+    message = await cosmos_conversation_client.create_message(
+        "message-1", conversation["id"], USER_ID, {"role": "user", "content": "hello"}
+    )
+
+    assert cosmos_container.calls == ["execute_item_batch"]
+    assert message["id"] == "message-1"
+    assert message["feedback"] == ""
+    stored_conversation = cosmos_container.items[(USER_ID, conversation["id"])]
+    assert stored_conversation["updatedAt"] == message["createdAt"]
+    assert stored_conversation["title"] == "Storage"
+
+
+@pytest.mark.asyncio
+async def test_create_message_for_missing_conversation_writes_nothing(cosmos_conversation_client, cosmos_container):
+    result = await cosmos_conversation_client.create_message(
+        "message-1", "missing", USER_ID, {"role": "user", "content": "hello"}
+    )
+
+    assert result == "Conversation not found"
+    assert cosmos_container.items == {}
+
+
+@pytest.mark.asyncio
+async def test_create_message_does_not_patch_a_message_with_the_conversation_id(cosmos_conversation_client, cosmos_container):
+    cosmos_container.add({"id": "message-0", "type": "message", "userId": USER_ID})
+
+    result = await cosmos_conversation_client.create_message(
+        "message-1", "message-0", USER_ID, {"role": "user", "content": "hello"}
+    )
+
+    assert result == "Conversation not found"
+    assert (USER_ID, "message-1") not in cosmos_container.items
+
+
+@pytest.mark.asyncio
+async def test_get_conversation_is_a_point_read(cosmos_conversation_client, cosmos_container):
+    conversation = await cosmos_conversation_client.create_conversation(USER_ID, title="Storage")
+    cosmos_container.add({"id": "message-0", "type": "message", "userId": USER_ID})
+    cosmos_container.calls.clear()
+
+    assert await cosmos_conversation_client.get_conversation(USER_ID, conversation["id"]) == conversation
+    assert await cosmos_conversation_client.get_conversation("user-2", conversation["id"]) is None
+    assert await cosmos_conversation_client.get_conversation(USER_ID, "message-0") is None
+    assert cosmos_container.calls == ["read_item"] * 3
+
+
+@pytest.mark.asyncio
+async def test_rename_conversation_patches_the_title(cosmos_conversation_client, cosmos_container):
+    conversation = await cosmos_conversation_client.create_conversation(USER_ID, title="Storage")
+    cosmos_container.add({"id": "message-0", "type": "message", "userId": USER_ID})
+    cosmos_container.calls.clear()
+
+    renamed = await cosmos_conversation_client.rename_conversation(USER_ID, conversation["id"], "Networking")
+    assert renamed == dict(conversation, title="Networking")
+    assert cosmos_container.calls == ["patch_item"]
+
+    assert await cosmos_conversation_client.rename_conversation("user-2", conversation["id"], "Other") is None
+    assert await cosmos_conversation_client.rename_conversation(USER_ID, "message-0", "Other") is None
+    assert "title" not in cosmos_container.items[(USER_ID, "message-0")]
+
+
+@pytest.mark.asyncio
+async def test_write_behind_keeps_conversation_order():
+    write_behind = HistoryWriteBehind(workers=2, max_pending=2)
+    write_behind.start()
+    applied = []
+
+    def write(conversation_id, i, delay):
+        async def run():
+            await asyncio.sleep(delay)
+            applied.append((conversation_id, i))
+        return run
+
+    for i in range(5):
+        await write_behind.submit("a", write("a", i, 0.005 * (5 - i)))
+        await write_behind.submit("b", write("b", i, 0))
+
+    await write_behind.wait_for("a")
+    assert [i for conversation_id, i in applied if conversation_id == "a"] == list(range(5))
+
+    await write_behind.close()
+    assert [i for conversation_id, i in applied if conversation_id == "b"] == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_write_behind_logs_failed_writes(cosmos_conversation_client, cosmos_container):
+    write_behind = HistoryWriteBehind(workers=1)
+    write_behind.start()
+
+    async def create_message():
+        result = await cosmos_conversation_client.create_message(
+            "message-1", "missing", USER_ID, {"role": "user", "content": "hello"}
+        )
+        if result == "Conversation not found":
+            raise Exception("Conversation not found")
+
+    future = await write_behind.submit("missing", create_message)
+    await write_behind.wait_for("missing")
+
+    assert write_behind.failed == 1
+    assert isinstance(future.exception(), Exception)
+    await write_behind.close()
+
+
+async def add_history(cosmos_conversation_client, conversations=2, messages=120):
+    conversation_ids = []
+    for _ in range(conversations):
+        conversation = await cosmos_conversation_client.create_conversation(USER_ID)
+        conversation_ids.append(conversation["id"])
+        for i in range(messages):
+            await cosmos_conversation_client.create_message(
+                f"{conversation['id']}-{i}", conversation["id"], USER_ID, {"role": "user", "content": "hello"}
+            )
+    return conversation_ids
+
+
+@pytest.mark.asyncio
+async def test_delete_conversation_messages_uses_batches(cosmos_conversation_client, cosmos_container):
+    conversation_ids = await add_history(cosmos_conversation_client)
+    cosmos_container.add({"id": "other-0", "type": "message", "userId": "user-2", "conversationId": conversation_ids[0]})
+    cosmos_container.calls.clear()
+
+    message_ids = await cosmos_conversation_client.get_message_ids(USER_ID, conversation_ids[0])
+    deleted = await cosmos_conversation_client.delete_items(USER_ID, message_ids)
+
+    assert len(deleted) == 120
+    assert cosmos_container.calls == ["query_items", "execute_item_batch", "execute_item_batch"]
+    assert await cosmos_conversation_client.get_message_ids(USER_ID, conversation_ids[0]) == []
+    assert len(await cosmos_conversation_client.get_message_ids(USER_ID, conversation_ids[1])) == 120
+    assert (USER_ID, conversation_ids[0]) in cosmos_container.items
+    assert ("user-2", "other-0") in cosmos_container.items
+
+
+@pytest.mark.asyncio
+async def test_delete_items_skips_documents_that_are_already_gone(cosmos_conversation_client, cosmos_container):
+    conversation_ids = await add_history(cosmos_conversation_client, conversations=1, messages=3)
+    message_ids = await cosmos_conversation_client.get_message_ids(USER_ID)
+    del cosmos_container.items[(USER_ID, message_ids[0])]
+
+    await cosmos_conversation_client.delete_history_items(USER_ID, message_ids, conversation_ids)
+
+    assert cosmos_container.items == {}
+
+
+@pytest.mark.asyncio
+async def test_delete_job_reports_progress(cosmos_conversation_client, cosmos_container):
+    conversation_ids = await add_history(cosmos_conversation_client, conversations=3, messages=50)
+    message_ids = await cosmos_conversation_client.get_message_ids(USER_ID)
+    jobs = HistoryDeleteJobs(cosmos_conversation_client)
+
+    job = await jobs.start(USER_ID, message_ids, conversation_ids)
+    assert job["total"] == 153
+    await asyncio.gather(*jobs._tasks)
+
+    status = await jobs.get(USER_ID, job["id"])
+    assert status["status"] == "succeeded"
+    assert status["deleted"] == 153
+    assert await cosmos_conversation_client.get_conversation_ids(USER_ID) == []
+    assert await jobs.get("user-2", job["id"]) is None
+    await jobs.close()
+
+
+@pytest.mark.asyncio
+async def test_delete_job_that_stopped_updating_is_reported_failed(cosmos_conversation_client, cosmos_container):
+    jobs = HistoryDeleteJobs(cosmos_conversation_client)
+    job = await jobs.start(USER_ID, [], [])
+    await asyncio.gather(*jobs._tasks)
+
+    # A worker killed mid-deletion leaves the job running
+    stored = cosmos_container.items[(USER_ID, job["id"])]
+    stored["status"] = "running"
+    assert (await jobs.get(USER_ID, job["id"]))["status"] == "running"
+
+    stored["updatedAt"] = (datetime.utcnow() - timedelta(seconds=JOB_STALE_SECONDS + 1)).isoformat()
+    status = await jobs.get(USER_ID, job["id"])
+    assert status["status"] == "failed"
+    assert status["error"]
+
+
+def test_check_indexing_policy():
+    assert check_indexing_policy(HISTORY_INDEXING_POLICY) == []
+
+    default_policy = {"indexingMode": "consistent", "includedPaths": [{"path": "/*"}], "excludedPaths": []}
+    assert check_indexing_policy(default_policy) == [
+        "Missing composite index (/conversationId ascending, /createdAt ascending)",
+        "Missing composite index (/type ascending, /updatedAt descending)",
+    ]
+
+    reversed_policy = dict(default_policy, compositeIndexes=[
+        [{"path": "/conversationId", "order": "descending"}, {"path": "/createdAt", "order": "descending"}],
+        [{"path": "/type", "order": "descending"}, {"path": "/updatedAt", "order": "ascending"}],
+    ])
+    assert check_indexing_policy(reversed_policy) == []
+
+    no_dates_policy = dict(default_policy, excludedPaths=[{"path": "/createdAt/?"}])
+    assert "createdAt is not indexed" in check_indexing_policy(no_dates_policy)
+
+
+@pytest.mark.parametrize("indexing_policy", [None, HISTORY_INDEXING_POLICY])
+@pytest.mark.asyncio
+async def test_get_messages_projects_and_orders_by_creation(cosmos_conversation_client, cosmos_container, indexing_policy):
+    if indexing_policy:
+        cosmos_container.indexing_policy = indexing_policy
+    success, _ = await cosmos_conversation_client.ensure()
+    assert success
+    assert cosmos_conversation_client.composite_indexes == bool(indexing_policy)
+
+    conversation = await cosmos_conversation_client.create_conversation(USER_ID)
+    for i in range(3):
+        cosmos_container.add({
+            "id": f"message-{i}",
+            "type": "message",
+            "userId": USER_ID,
+            "conversationId": conversation["id"],
+            "createdAt": f"2024-01-01T00:00:0{2 - i}",
+            "role": "tool",
+            "content": "answer",
+            "context": "large tool context",
+        })
+
+    messages = await cosmos_conversation_client.get_messages(USER_ID, conversation["id"])
+    assert [message["id"] for message in messages] == ["message-2", "message-1", "message-0"]
+    assert set(messages[0]) == {"id", "role", "content", "createdAt"}
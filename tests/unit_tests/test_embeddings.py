@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from backend.embeddings import EmbeddingCache, EmbeddingService
+
+
+class FakeEmbeddings:
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    async def create(self, input, model):
+        self.calls.append((list(input), model))
+        await asyncio.sleep(0)
+        if self.error:
+            raise self.error
+        # Return the items out of order, the service must sort them by index
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[float(len(text)), float(i)])
+            for i, text in reversed(list(enumerate(input)))
+        ])
+
+
+def create_service(error=None, **kwargs):
+    client = SimpleNamespace(embeddings=FakeEmbeddings(error))
+    return EmbeddingService(client, deployment="embedding", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_embedding_service_coalesces_concurrent_requests():
+    service = create_service(batch_window=0.01)
+
+    results = await asyncio.gather(
+        service.embed("one"),
+        service.embed("three"),
+        service.embed_many(["one", "four"]),
+    )
+
+    assert service.client.embeddings.calls == [(["one", "three", "four"], "embedding")]
+    assert results[0] == [3.0, 0.0]
+    assert results[1] == [5.0, 1.0]
+    assert results[2] == [[3.0, 0.0], [4.0, 2.0]]
+    assert service.metrics.batches == 1
+    assert service.metrics.mean_batch_size == 3
+
+
+@pytest.mark.asyncio
+async def test_embedding_service_caches_normalized_text():
+    service = create_service(batch_window=0)
+
+    await service.embed("storage  limits")
+    assert await service.embed(" storage limits\n") == [14.0, 0.0]
+
+    assert len(service.client.embeddings.calls) == 1
+    assert service.metrics.cache_hits == 1
+    assert service.metrics.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_embedding_service_splits_large_batches():
+    service = create_service(max_batch_size=2, batch_window=0.01)
+
+    await service.embed_many(["a", "b", "c"])
+
+    assert [call[0] for call in service.client.embeddings.calls] == [["a", "b"], ["c"]]
+
+
+@pytest.mark.asyncio
+async def test_embedding_service_propagates_errors():
+    service = create_service(error=RuntimeError("throttled"), batch_window=0)
+
+    with pytest.raises(RuntimeError):
+        await asyncio.gather(service.embed("a"), service.embed("a"))
+
+    # Failures are not cached
+    assert len(service.cache) == 0
+    assert not service._in_flight
+
+
+def test_embedding_cache_evicts_least_recently_used():
+    # Each entry is 1 + 1 + 2 * 4 bytes
+    cache = EmbeddingCache(max_bytes=25)
+    cache.put(("d", "a"), [1.0, 1.0])
+    cache.put(("d", "b"), [2.0, 2.0])
+    cache.get(("d", "a"))
+    cache.put(("d", "c"), [3.0, 3.0])
+
+    assert cache.get(("d", "b")) is None
+    assert cache.get(("d", "a")) == [1.0, 1.0]
+    assert cache.current_bytes == 20
@@ -0,0 +1,123 @@
+import asyncio
+import base64
+import json
+
+import httpx
+import pytest
+
+from backend.auth.graph_groups import GRAPH_GROUPS_ENDPOINT, GraphGroupResolver, token_cache_key
+from backend.utils import generateFilterString
+
+NEXT_PAGE = "https://graph.microsoft.com/v1.0/me/transitiveMemberOf?$skiptoken=page2"
+
+
+def make_token(**claims):
+    def encode(value):
+        return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+    return f"{encode({'alg': 'none'})}.{encode(claims)}.signature"
+
+
+class GraphStub:
+    """Serves two pages of group membership, like /me/transitiveMemberOf."""
+
+    def __init__(self, status_code=200, delay=0):
+        self.status_code = status_code
+        self.delay = delay
+        self.requests = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await asyncio.sleep(self.delay)
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, text="Forbidden")
+        if "skiptoken" in str(request.url):
+            return httpx.Response(200, json={"value": [{"id": "group-3"}]})
+        return httpx.Response(200, json={
+            "value": [{"id": "group-1"}, {"id": "group-2"}],
+            "@odata.nextLink": NEXT_PAGE
+        })
+
+
+def resolver_for(stub, **kwargs):
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(stub))
+    return GraphGroupResolver(http_client, **kwargs)
+
+
+def test_token_cache_key():
+    assert token_cache_key(make_token(tid="tenant", oid="user")) == token_cache_key(make_token(tid="tenant", oid="user"))
+    assert token_cache_key(make_token(tid="tenant", oid="user", uti="a")) != \
+        token_cache_key(make_token(tid="tenant", oid="user", uti="b"))
+
+
+@pytest.mark.asyncio
+async def test_resolver_follows_next_link_and_caches_by_token():
+    stub = GraphStub()
+    resolver = resolver_for(stub)
+    token = make_token(tid="tenant", oid="user", uti="a")
+
+    group_ids = await resolver.get_group_ids(token)
+    assert group_ids == ["group-1", "group-2", "group-3"]
+    assert len(stub.requests) == 2
+    assert str(stub.requests[0].url) == str(httpx.URL(GRAPH_GROUPS_ENDPOINT))
+    assert stub.requests[1].headers["Authorization"].startswith("bearer ")
+
+    assert await resolver.get_group_ids(token) == group_ids
+    assert len(stub.requests) == 2
+    assert resolver.metrics()["hits"] == 1
+
+    await resolver.get_group_ids(make_token(tid="tenant", oid="other"))
+    assert len(stub.requests) == 4
+    await resolver.http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_resolver_does_not_serve_cached_groups_to_a_forged_token():
+    stub = GraphStub()
+    resolver = resolver_for(stub)
+    assert await resolver.get_group_ids(make_token(tid="tenant", oid="victim")) == ["group-1", "group-2", "group-3"]
+
+    # An unsigned token with the victim's claims misses the cache and is sent
+    # to Graph, which rejects it
+    stub.status_code = 401
+    forged = make_token(tid="tenant", oid="victim").rsplit(".", 1)[0] + ".forged"
+    assert await resolver.get_group_ids(forged) == []
+    assert len(stub.requests) == 3
+    assert resolver.metrics()["hits"] == 0
+    await resolver.http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_resolver_shares_concurrent_lookups():
+    stub = GraphStub(delay=0.01)
+    resolver = resolver_for(stub)
+    token = make_token(tid="tenant", oid="user")
+
+    results = await asyncio.gather(*(resolver.get_group_ids(token) for _ in range(5)))
+    assert all(result == ["group-1", "group-2", "group-3"] for result in results)
+    assert len(stub.requests) == 2
+    assert resolver.metrics()["shared"] == 4
+    await resolver.http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_resolver_expires_and_does_not_cache_failures():
+    stub = GraphStub(status_code=403)
+    resolver = resolver_for(stub, ttl=0)
+    token = make_token(tid="tenant", oid="user")
+
+    assert await resolver.get_group_ids(token) == []
+    assert len(resolver) == 0
+
+    stub.status_code = 200
+    assert await resolver.get_group_ids(token) == ["group-1", "group-2", "group-3"]
+    # With a ttl of 0 the entry is already stale
+    await resolver.get_group_ids(token)
+    assert len(stub.requests) == 5
+    await resolver.http_client.aclose()
+
+
+def test_generate_filter_string(monkeypatch):
+    monkeypatch.setattr("backend.utils.AZURE_SEARCH_PERMITTED_GROUPS_COLUMN", "group_ids")
+    assert generateFilterString(["group-1", "group-2"]) == \
+        "group_ids/any(g:search.in(g, 'group-1, group-2'))"
@@ -0,0 +1,43 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "scripts")))
+
+from index_manifest import IndexManifest
+
+INDEX = "index"
+SOURCE = "data"
+PARAMS = "params-1"
+
+
+def test_index_manifest_plans_added_changed_and_removed_files(tmp_path):
+    manifest = IndexManifest(str(tmp_path / "manifest.db"))
+
+    changed, removed = manifest.plan(INDEX, SOURCE, {"a.md": "hash-a", "b.md": "hash-b"}, PARAMS)
+    assert sorted(changed) == ["a.md", "b.md"]
+    assert removed == []
+    manifest.record(INDEX, SOURCE, "a.md", "hash-a", PARAMS, ["a-1", "a-2"])
+    manifest.record(INDEX, SOURCE, "b.md", "hash-b", PARAMS, ["b-1"])
+
+    # a.md changed, b.md was removed and c.md added
+    changed, removed = manifest.plan(INDEX, SOURCE, {"a.md": "hash-a2", "c.md": "hash-c"}, PARAMS)
+    assert sorted(changed) == ["a.md", "c.md"]
+    assert removed == ["b.md"]
+    assert manifest.chunk_ids(INDEX, SOURCE, "b.md") == ["b-1"]
+
+    manifest.record(INDEX, SOURCE, "a.md", "hash-a2", PARAMS, ["a-1", "a-3"])
+    manifest.record(INDEX, SOURCE, "c.md", "hash-c", PARAMS, [])
+    manifest.remove(INDEX, SOURCE, "b.md")
+    manifest.close()
+
+    # The manifest is kept on disk between runs
+    manifest = IndexManifest(str(tmp_path / "manifest.db"))
+    assert manifest.plan(INDEX, SOURCE, {"a.md": "hash-a2", "c.md": "hash-c"}, PARAMS) == ([], [])
+    assert sorted(manifest.chunk_ids(INDEX, SOURCE, "a.md")) == ["a-1", "a-3"]
+    assert manifest.chunk_ids(INDEX, SOURCE, "b.md") == []
+
+    # Other chunking parameters re-chunk everything, other indexes and sources are separate
+    assert manifest.plan(INDEX, SOURCE, {"a.md": "hash-a2"}, "params-2") == (["a.md"], ["c.md"])
+    assert manifest.plan("other-index", SOURCE, {"a.md": "hash-a2"}, PARAMS) == (["a.md"], [])
+    assert manifest.plan(INDEX, "other-data", {}, PARAMS) == ([], [])
+    manifest.close()
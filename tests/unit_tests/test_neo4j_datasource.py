@@ -0,0 +1,246 @@
+import pytest
+from backend.datasources import neo4j_datasource
+from backend.datasources.neo4j_datasource import (
+    AsyncNeo4jDatasource,
+    CHUNK_LABEL_QUERY,
+    SEMANTIC_SEARCH_MANY_QUERY,
+    SEMANTIC_SEARCH_QUERY,
+    SHOW_VECTOR_INDEX_QUERY,
+    VECTOR_INDEX_SEARCH_MANY_QUERY,
+    VECTOR_INDEX_SEARCH_QUERY,
+)
+from backend.utils import NestedAppSettings
+
+
+class FakeResult:
+    def __init__(self, records):
+        self.records = records
+
+    async def consume(self):
+        pass
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for record in self.records:
+            yield record
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def run(self, query, **parameters):
+        self.driver.queries.append((query, parameters))
+        if query == LABEL_QUERY:
+            return FakeResult([{"1": 1}] if self.driver.has_chunks else [])
+        if query == SHOW_VECTOR_INDEX_QUERY:
+            return FakeResult(self.driver.indexes)
+        if query.lstrip().startswith("CREATE VECTOR INDEX"):
+            self.driver.indexes = [self.driver.created_index]
+            return FakeResult([])
+        return FakeResult(self.driver.records)
+
+
+
+class FakeDriver:
+    def __init__(self, records, indexes=None, created_index=None, has_chunks=True):
+        self.records = records
+        self.has_chunks = has_chunks
+        self.indexes = indexes or []
+        self.created_index = created_index
+        self.queries = []
+        self.sessions = []
+        self.closed = False
+
+    def session(self, **kwargs):
+        self.sessions.append(kwargs)
+        return FakeSession(self)
+
+    async def close(self):
+        self.closed = True
+
+
+RECORD = {"id": 1, "title": None, "content": "text", "webUrl": None, "kind": "case", "score": 0.5}
+LABEL_QUERY = CHUNK_LABEL_QUERY.format(label="Chunk", property="embedding")
+CHUNK_INDEX = {
+    "name": "chunk_embedding_index", "state": "ONLINE",
+    "labelsOrTypes": ["Chunk"], "properties": ["embedding"]
+}
+
+
+def neo4j_settings(**overrides):
+    values = {
+        "uri": "bolt://localhost:7687",
+        "username": "neo4j",
+        "password": "dummy",
+        "database": "neo4j",
+        "max_connection_pool_size": 5,
+        "connection_acquisition_timeout": 1.0,
+        "liveness_check_timeout": 1.0,
+        "search_mode": "scan",
+        "chunk_label": "Chunk",
+        "vector_index_name": "chunk_embedding_index",
+        "vector_dimensions": 3072,
+        "vector_similarity_function": "cosine",
+        "vector_overfetch": 4,
+        "create_vector_index": False,
+    }
+    values.update(overrides)
+    return NestedAppSettings(neo4j=values)
+
+
+async def create_datasource(driver, **overrides):
+    datasource = AsyncNeo4jDatasource(neo4j_settings(**overrides))
+    await datasource.driver.close()
+    datasource.driver = driver
+    return datasource
+
+
+@pytest.mark.asyncio
+async def test_async_semantic_search_passes_kind_as_parameter():
+    driver = FakeDriver([RECORD])
+    datasource = await create_datasource(driver)
+
+    results = await datasource.semantic_search([0.1, 0.2], top_k=3, kind="case' OR 1=1")
+
+    query, parameters = driver.queries[0]
+    assert query == SEMANTIC_SEARCH_QUERY
+    assert parameters == {"query_vector": [0.1, 0.2], "top_k": 3, "kind": "case' OR 1=1"}
+    assert driver.sessions[0]["database"] == "neo4j"
+    assert results == [{
+        "id": "1", "title": "", "webUrl": "", "kind": "case", "content": "text",
+        "@search.score": 0.5, "source": "neo4j"
+    }]
+
+    await datasource.close()
+    assert driver.closed
+    assert datasource.driver is None
+
+
+@pytest.mark.asyncio
+async def test_async_semantic_search_uses_vector_index_with_overfetch():
+    driver = FakeDriver([RECORD], indexes=[CHUNK_INDEX])
+    datasource = await create_datasource(driver, search_mode="index")
+
+    await datasource.semantic_search([0.1], top_k=3, kind=None)
+    await datasource.semantic_search([0.1], top_k=3, kind="case")
+
+    queries = [query for query, _ in driver.queries]
+    # The index is verified once and then reused
+    assert queries == [LABEL_QUERY, SHOW_VECTOR_INDEX_QUERY, VECTOR_INDEX_SEARCH_QUERY, VECTOR_INDEX_SEARCH_QUERY]
+    assert driver.queries[2][1]["candidates"] == 3
+    assert driver.queries[3][1]["candidates"] == 12
+    assert driver.queries[3][1]["index_name"] == "chunk_embedding_index"
+
+
+@pytest.mark.asyncio
+async def test_async_semantic_search_creates_missing_vector_index():
+    driver = FakeDriver([RECORD], created_index=CHUNK_INDEX)
+    datasource = await create_datasource(driver, search_mode="index", create_vector_index=True)
+
+    assert await datasource.ensure_vector_index()
+    create_query = driver.queries[2][0]
+    assert "CREATE VECTOR INDEX `chunk_embedding_index` IF NOT EXISTS" in create_query
+    assert "FOR (c:`Chunk`) ON (c.`embedding`)" in create_query
+    assert "`vector.dimensions`: 3072" in create_query
+
+
+@pytest.mark.asyncio
+async def test_async_semantic_search_does_not_index_a_label_without_chunks():
+    driver = FakeDriver([RECORD], created_index=CHUNK_INDEX, has_chunks=False)
+    datasource = await create_datasource(driver, search_mode="index", create_vector_index=True)
+
+    results = await datasource.semantic_search([0.1], top_k=3, kind=None)
+
+    assert [query for query, _ in driver.queries] == [LABEL_QUERY, SEMANTIC_SEARCH_QUERY]
+    assert len(results) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_semantic_search_falls_back_to_scan():
+    wrong_index = dict(CHUNK_INDEX, labelsOrTypes=["Document"])
+    driver = FakeDriver([RECORD], indexes=[wrong_index])
+    datasource = await create_datasource(driver, search_mode="index")
+
+    results = await datasource.semantic_search([0.1], top_k=3, kind=None)
+
+    assert driver.queries[-1][0] == SEMANTIC_SEARCH_QUERY
+    assert len(results) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_semantic_search_many_groups_results_by_query():
+    records = [
+        dict(RECORD, query_index=1, id=2),
+        dict(RECORD, query_index=0, id=1),
+        dict(RECORD, query_index=1, id=1),
+    ]
+    driver = FakeDriver(records, indexes=[CHUNK_INDEX])
+    datasource = await create_datasource(driver, search_mode="index")
+
+    results = await datasource.semantic_search_many([[0.1], [0.2], [0.3]], top_k=2, kind=None)
+
+    # Round-trips for the index check and one for all three query vectors
+    assert [query for query, _ in driver.queries] == [LABEL_QUERY, SHOW_VECTOR_INDEX_QUERY, VECTOR_INDEX_SEARCH_MANY_QUERY]
+    assert driver.queries[2][1]["query_vectors"] == [[0.1], [0.2], [0.3]]
+    assert [[doc["id"] for doc in result] for result in results] == [["1"], ["2", "1"], []]
+
+
+@pytest.mark.parametrize("query", [SEMANTIC_SEARCH_MANY_QUERY, VECTOR_INDEX_SEARCH_MANY_QUERY])
+def test_semantic_search_many_queries_limit_each_query_before_projecting(query):
+    # The top_k of each query vector is taken in its subquery, before any content is read
+    subquery = query[query.index("CALL {"):query.index("}")]
+    assert "ORDER BY score DESC" in subquery
+    assert "LIMIT $top_k" in subquery
+    assert "content" not in subquery
+    assert "collect(" not in query
+    assert query.index("LIMIT $top_k") < query.index("content")
+
+
+@pytest.mark.asyncio
+async def test_async_semantic_search_many_scans_without_index():
+    records = [dict(RECORD, query_index=0, id=1), dict(RECORD, query_index=1, id=2)]
+    driver = FakeDriver(records)
+    datasource = await create_datasource(driver)
+
+    results = await datasource.semantic_search_many([[0.1], [0.2]], top_k=2, kind=None)
+
+    assert [query for query, _ in driver.queries] == [SEMANTIC_SEARCH_MANY_QUERY]
+    assert driver.queries[0][1] == {"query_vectors": [[0.1], [0.2]], "top_k": 2, "kind": None}
+    assert [[doc["id"] for doc in result] for result in results] == [["1"], ["2"]]
+
+
+@pytest.mark.asyncio
+async def test_async_vector_index_check_is_retried_after_an_error(monkeypatch):
+    driver = FakeDriver([RECORD], indexes=[CHUNK_INDEX])
+    datasource = await create_datasource(driver, search_mode="index")
+    now = 1000.0
+    monkeypatch.setattr(neo4j_datasource.time, "monotonic", lambda: now)
+
+    check_vector_index = datasource._check_vector_index
+    async def unavailable():
+        raise ConnectionError("Neo4j is restarting")
+    datasource._check_vector_index = unavailable
+
+    assert not await datasource.ensure_vector_index()
+    datasource._check_vector_index = check_vector_index
+    # Not retried right away, so an outage doesn't add a check to every search
+    assert not await datasource.ensure_vector_index()
+    assert driver.queries == []
+
+    now += neo4j_datasource.VECTOR_INDEX_RETRY_SECONDS
+    assert await datasource.ensure_vector_index()
+    assert datasource._vector_index_ready is True
+
+
+def test_async_datasource_rejects_invalid_label():
+    with pytest.raises(ValueError):
+        AsyncNeo4jDatasource(neo4j_settings(search_mode="index", chunk_label="Chunk`) DETACH DELETE c //"))
@@ -0,0 +1,99 @@
+import pytest
+from backend.agents.agent_tool import AgentTools
+from backend.agents.result_cache import SemanticResultCache
+
+DOCUMENTS = [{"id": "1", "title": "Storage limits", "kind": "tsg", "content": "5 TiB"}]
+
+
+def test_result_cache_matches_normalized_query():
+    cache = SemanticResultCache()
+    cache.put("storage  limits", 5, None, [1.0, 0.0], DOCUMENTS)
+
+    assert cache.get(" storage limits ", 5, None) is DOCUMENTS
+    assert cache.get("storage limits", 10, None) is None
+    assert cache.get("storage limits", 5, "tsg") is None
+
+
+def test_result_cache_reuses_similar_query_vector():
+    cache = SemanticResultCache(similarity_threshold=0.95)
+    cache.put("storage limits", 5, None, [1.0, 0.0], DOCUMENTS)
+
+    assert cache.get_similar([0.99, 0.05], 5, None) is DOCUMENTS
+    assert cache.get_similar([0.5, 0.5], 5, None) is None
+    assert cache.get_similar([0.99, 0.05], 5, "tsg") is None
+    assert cache.metrics()["similar_hits"] == 1
+
+
+def test_result_cache_expires_and_evicts_entries():
+    cache = SemanticResultCache(max_entries=2, ttl=0)
+    cache.put("a", 5, None, [1.0], DOCUMENTS)
+    assert cache.get("a", 5, None) is None
+
+    cache = SemanticResultCache(max_entries=2)
+    cache.put("a", 5, None, [1.0], DOCUMENTS)
+    cache.put("b", 5, None, [1.0], DOCUMENTS)
+    cache.get("a", 5, None)
+    cache.put("c", 5, None, [1.0], DOCUMENTS)
+    assert cache.get("b", 5, None) is None
+    assert cache.get("a", 5, None) is DOCUMENTS
+
+
+class FakeEmbeddingService:
+    def __init__(self):
+        self.calls = []
+
+    async def embed(self, text):
+        self.calls.append(text)
+        return [1.0, 0.0] if "storage" in text else [0.0, 1.0]
+
+    async def embed_many(self, texts):
+        return [await self.embed(text) for text in texts]
+
+
+class FakeDatasource:
+    def __init__(self):
+        self.searches = 0
+        self.searched_vectors = []
+
+    async def semantic_search(self, query_vector, top_k, kind):
+        self.searches += 1
+        return DOCUMENTS
+
+    async def semantic_search_many(self, query_vectors, top_k, kind):
+        self.searched_vectors.append(query_vectors)
+        return [[dict(DOCUMENTS[0], id=str(vector))] for vector in query_vectors]
+
+
+def create_tools():
+    tools = AgentTools.__new__(AgentTools)
+    tools.embedding_service = FakeEmbeddingService()
+    tools.neo4j_datasource = FakeDatasource()
+    tools.result_cache = SemanticResultCache()
+    return tools
+
+
+@pytest.mark.asyncio
+async def test_agent_tools_semantic_search_uses_result_cache():
+    tools = create_tools()
+
+    first = await tools.semantic_search("storage limits")
+    assert await tools.semantic_search("storage limits") == first
+    # Exact hits skip the embedding call, near-duplicates skip the graph query
+    assert tools.embedding_service.calls == ["storage limits"]
+    await tools.semantic_search("storage account limits")
+    assert tools.neo4j_datasource.searches == 1
+
+
+@pytest.mark.asyncio
+async def test_agent_tools_semantic_search_many_uses_result_cache():
+    tools = create_tools()
+
+    await tools.semantic_search_many(["storage limits"])
+    result = await tools.semantic_search_many(["storage limits", "storage account limits", "billing"])
+
+    # Exact hits skip the embedding call, near-duplicates skip the graph query
+    assert tools.embedding_service.calls == ["storage limits", "storage account limits", "billing"]
+    assert tools.neo4j_datasource.searched_vectors == [[[1.0, 0.0]], [[0.0, 1.0]]]
+    assert "DOCUMENT REFERENCES" in result
+    assert tools.result_cache.metrics()["hits"] == 1
+    assert tools.result_cache.metrics()["similar_hits"] == 1
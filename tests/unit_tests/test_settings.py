@@ -52,6 +52,25 @@ def test_dotenv_with_azure_search_success(app_settings):
     print(payload)
 
 
+def test_dotenv_with_azure_search_payload_template(app_settings):
+    datasource = app_settings.datasource
+    template = datasource.payload_template["parameters"]
+    assert datasource.payload_template["parameters"] is template
+
+    first = datasource.construct_payload_configuration()
+    second = datasource.construct_payload_configuration()
+    assert first == second
+    assert first["parameters"] is not second["parameters"]
+
+    # Request fields are merged into a copy, never into the template
+    payload = datasource.construct_payload_configuration(
+        request_parameters={"filter": "group_ids/any(g:search.in(g, 'a'))"}
+    )
+    assert payload["parameters"]["filter"] == "group_ids/any(g:search.in(g, 'a'))"
+    assert "filter" not in template
+    assert "filter" not in datasource.construct_payload_configuration()["parameters"]
+
+
 def test_dotenv_with_elasticsearch_success(app_settings):
     # Validate model object
     assert app_settings.search is not None
@@ -0,0 +1,105 @@
+import os
+import sys
+import time
+from email.utils import formatdate
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "scripts")))
+
+import throttling
+from throttling import Throttle, TokenBucket, is_retryable, retry_after_seconds
+
+
+class FakeHTTPError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(throttling.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_retry_after_seconds_reads_every_header_form():
+    assert retry_after_seconds({"retry-after-ms": "1500", "Retry-After": "9"}) == 1.5
+    assert retry_after_seconds({"Retry-After": "3"}) == 3
+    assert retry_after_seconds(MappingProxyType({"Retry-After": "4"})) == 4
+
+    http_date = formatdate(time.time() + 30, usegmt=True)
+    assert 28 <= retry_after_seconds({"retry-after": http_date}) <= 30
+    assert retry_after_seconds({"retry-after": formatdate(time.time() - 30, usegmt=True)}) == 0
+
+    assert retry_after_seconds({"retry-after": "soon"}) is None
+    assert retry_after_seconds({}) is None
+    assert retry_after_seconds(None) is None
+
+
+def test_is_retryable():
+    assert all(is_retryable(status) for status in (None, 408, 409, 429, 500, 503))
+    assert not any(is_retryable(status) for status in (400, 401, 403, 404))
+
+
+def test_throttle_retries_throttled_call_after_retry_after(sleeps):
+    throttle = Throttle("test", base_delay=0.01)
+    calls = []
+
+    def call():
+        calls.append(1)
+        if len(calls) == 1:
+            raise FakeHTTPError(429, {"Retry-After": "2"})
+        return "ok"
+
+    assert throttle.call(call) == "ok"
+    assert len(calls) == 2
+    # The pause is shared, the next call waits for it
+    assert len(sleeps) == 1
+    assert 1.9 <= sleeps[0] <= 2
+
+
+def test_throttle_raises_client_errors_right_away(sleeps):
+    throttle = Throttle("test", base_delay=0.01)
+    calls = []
+
+    def call():
+        calls.append(1)
+        raise FakeHTTPError(400)
+
+    with pytest.raises(FakeHTTPError):
+        throttle.call(call)
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_throttle_gives_up_after_max_attempts(sleeps):
+    throttle = Throttle("test", max_attempts=3, base_delay=0.01)
+    calls = []
+
+    def call():
+        calls.append(1)
+        raise FakeHTTPError(503)
+
+    with pytest.raises(FakeHTTPError):
+        throttle.call(call)
+    assert len(calls) == 3
+    # Backoff between attempts, none after the last one
+    assert len(sleeps) == 2
+
+
+def test_token_bucket_reserve_waits_once_budget_is_spent(monkeypatch):
+    monkeypatch.setattr(throttling.time, "time", lambda: 1000.0)
+    bucket = TokenBucket(per_minute=60)
+
+    assert bucket.reserve(60) == 0
+    assert bucket.reserve(30) == pytest.approx(30)
+    assert bucket.reserve(1) == pytest.approx(31)
+
+    bucket = TokenBucket(per_minute=60)
+    bucket.limit(10)
+    assert bucket.reserve(10) == 0
+    assert bucket.reserve(1) == pytest.approx(1)
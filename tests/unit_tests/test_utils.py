@@ -1,5 +1,25 @@
+import asyncio
+import json
+import logging
+
 import pytest
-from backend.utils import format_as_ndjson, parse_multi_columns
+from openai.types.chat import ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import (
+    Choice,
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction
+)
+from backend.utils import (
+    REDACTED,
+    RedactedJSON,
+    StreamResponseEncoder,
+    coalesce_chunks,
+    format_as_ndjson,
+    format_stream_response,
+    log_redacted_debug,
+    parse_multi_columns
+)
 
 
 @pytest.mark.asyncio
@@ -27,3 +47,147 @@ def test_parse_multi_columns():
     assert parse_multi_columns(test_pipes) == ["col1", "col2", "col3"]
     assert parse_multi_columns(test_commas) == ["col1", "col2", "col3"]
     assert parse_multi_columns(test_single) == ["col1"]
+
+
+def test_log_redacted_debug_masks_secrets(caplog):
+    model_args = {
+        "messages": [{"role": "user", "content": "hello"}],
+        "extra_body": {
+            "data_sources": [{
+                "type": "azure_search",
+                "parameters": {
+                    "index_name": "my-index",
+                    "authentication": {"type": "api_key", "key": "search-secret"},
+                    "embedding_dependency": {
+                        "type": "api_key",
+                        "authentication": {"type": "api_key", "key": "embedding-secret"}
+                    }
+                }
+            }, {
+                "type": "azure_cosmos_db",
+                "parameters": {
+                    "authentication": {"type": "connection_string", "connection_string": "mongodb://user:pw@host"}
+                }
+            }]
+        }
+    }
+
+    with caplog.at_level(logging.DEBUG):
+        log_redacted_debug("REQUEST BODY", model_args)
+
+    assert "search-secret" not in caplog.text
+    assert "embedding-secret" not in caplog.text
+    assert "mongodb://" not in caplog.text
+    assert "my-index" in caplog.text
+    assert REDACTED in caplog.text
+    # The original arguments are left as they were
+    assert model_args["extra_body"]["data_sources"][0]["parameters"]["authentication"]["key"] == "search-secret"
+
+
+def test_redacted_json_matches_json_dumps():
+    obj = {"a": [1, {"b": None, "c": []}], "d": {}, "e": "x\n"}
+    assert str(RedactedJSON(obj)) == json.dumps(obj, indent=4)
+
+
+def test_log_redacted_debug_skips_serialization_when_disabled(caplog):
+    class Unserializable:
+        pass
+
+    with caplog.at_level(logging.INFO):
+        log_redacted_debug("REQUEST BODY", {"value": Unserializable()})
+
+    assert caplog.text == ""
+
+
+def completion_chunk(response_id="chunk-1", **delta):
+    return ChatCompletionChunk(
+        id=response_id,
+        model="gpt-4o",
+        created=1,
+        object="chat.completion.chunk",
+        choices=[Choice(index=0, delta=ChoiceDelta(**delta))]
+    )
+
+
+def test_stream_response_encoder_matches_format_stream_response():
+    history_metadata = {"conversation_id": "c", "title": "Caf\u00e9"}
+    encoder = StreamResponseEncoder(history_metadata, "apim-1")
+
+    chunks = [
+        completion_chunk(role="assistant", content="Hello"),
+        completion_chunk(content=' "w\u00f6rld"\n'),
+        completion_chunk(response_id="chunk-2", content="!"),
+        completion_chunk(role="assistant", content=None),
+        completion_chunk(tool_calls=[ChoiceDeltaToolCall(
+            index=0,
+            id="call-1",
+            type="function",
+            function=ChoiceDeltaToolCallFunction(name="lookup", arguments="{}")
+        )]),
+    ]
+    for chunk in chunks:
+        line = encoder.encode(chunk)
+        assert line.endswith("\n")
+        assert json.loads(line) == format_stream_response(chunk, history_metadata, "apim-1")
+
+    # Content frames are byte for byte what json.dumps produces
+    assert encoder.encode(chunks[1]) == json.dumps(
+        format_stream_response(chunks[1], history_metadata, "apim-1")
+    ) + "\n"
+
+
+@pytest.mark.asyncio
+async def test_format_as_ndjson_passes_encoded_frames_through():
+    async def dummy_generator():
+        yield '{"message": "encoded"}\n'
+        yield {"message": "test message"}
+
+    events = [event async for event in format_as_ndjson(dummy_generator())]
+    assert events == ['{"message": "encoded"}\n', '{"message": "test message"}\n']
+
+
+async def stream_of(chunks, delays=None):
+    for i, chunk in enumerate(chunks):
+        if delays:
+            await asyncio.sleep(delays[i])
+        yield chunk
+
+
+def contents(chunks):
+    return [
+        chunk.choices[0].delta.content if chunk.choices[0].delta.content else chunk.choices[0].delta.tool_calls
+        for chunk in chunks
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_chunks_flushes_on_size_and_frame_boundaries():
+    tool_call = [ChoiceDeltaToolCall(index=0, id="call-1", type="function")]
+    chunks = [
+        completion_chunk(content="ab"),
+        completion_chunk(content="cd"),
+        completion_chunk(content="ef"),
+        completion_chunk(content="g"),
+        completion_chunk(tool_calls=tool_call),
+        completion_chunk(content="h"),
+        completion_chunk(role="tool", content="i"),
+        completion_chunk(content="j"),
+    ]
+
+    coalesced = [chunk async for chunk in coalesce_chunks(stream_of(chunks), max_delay=10, max_chars=4)]
+    assert contents(coalesced) == ["abcd", "efg", tool_call, "h", "ij"]
+    assert coalesced[0].id == "chunk-1"
+    assert coalesced[-1].choices[0].delta.role == "tool"
+
+
+@pytest.mark.asyncio
+async def test_coalesce_chunks_flushes_after_max_delay():
+    chunks = [completion_chunk(content="a"), completion_chunk(content="b"), completion_chunk(content="c")]
+    received = []
+
+    async for chunk in coalesce_chunks(stream_of(chunks, delays=[0, 0, 0.2]), max_delay=0.02, max_chars=100):
+        received.append((chunk.choices[0].delta.content, asyncio.get_running_loop().time()))
+
+    assert [content for content, _ in received] == ["ab", "c"]
+    # "ab" was sent while the upstream was still waiting for "c"
+    assert received[1][1] - received[0][1] > 0.1